@@ -0,0 +1 @@
+"""Standalone micro-benchmarks for the core pipeline (run with `python -m benchmarks.<name>`)."""
@@ -0,0 +1,113 @@
+"""Benchmark: in-process clip slicing vs. one ffmpeg process per clip.
+
+Usage (from backend/):
+    python -m benchmarks.clip_slicer --minutes 30 --clips 300
+
+Writes a synthetic 48 kHz stereo PCM WAV, then cuts the same clip list three ways:
+  * legacy  - ffmpeg with -ss after -i (decodes from t=0 for every clip)
+  * ffmpeg  - ffmpeg with input seeking (-ss before -i), the current fallback path
+  * inproc  - ClipReader seek/read + in-process 16 kHz mono resample
+The ffmpeg legs are skipped when ffmpeg is not on PATH.
+"""
+
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.dataset import ClipReader, slice_clip_pcm, write_clip_pcm
+
+SOURCE_SR = 48000
+
+
+def _make_source(path: Path, minutes: float) -> None:
+    rng = np.random.default_rng(0)
+    block = SOURCE_SR * 60
+    with sf.SoundFile(str(path), "w", SOURCE_SR, 2, subtype="PCM_16") as handle:
+        remaining = int(minutes * 60 * SOURCE_SR)
+        while remaining > 0:
+            n = min(block, remaining)
+            handle.write((rng.standard_normal((n, 2)) * 0.1).astype(np.float32))
+            remaining -= n
+
+
+def _clip_plan(total_sec: float, count: int, clip_sec: float):
+    starts = np.linspace(0.0, max(0.0, total_sec - clip_sec), num=count)
+    return [(float(s), float(s) + clip_sec) for s in starts]
+
+
+def _legacy_slice(source: Path, start: float, end: float, dst: Path) -> None:
+    cmd = [
+        "ffmpeg", "-y", "-i", str(source), "-vn", "-ss", f"{start:.3f}", "-to", f"{end:.3f}",
+        "-ar", "16000", "-ac", "1", "-c:a", "pcm_s16le", str(dst),
+    ]
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _time(label: str, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<8} {elapsed:8.2f}s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=20.0, help="Synthetic source length")
+    parser.add_argument("--clips", type=int, default=200, help="Number of clips to cut")
+    parser.add_argument("--clip-sec", type=float, default=8.0)
+    parser.add_argument("--skip-legacy", action="store_true", help="Skip the quadratic legacy leg")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        source = tmp_dir / "source_full.wav"
+        _make_source(source, args.minutes)
+        plan = _clip_plan(args.minutes * 60.0, args.clips, args.clip_sec)
+        print(f"source={args.minutes:.0f} min clips={len(plan)} clip_sec={args.clip_sec}")
+
+        results = {}
+
+        def run_inproc() -> None:
+            out = tmp_dir / "inproc"
+            out.mkdir()
+            with ClipReader(source) as reader:
+                for idx, (start, end) in enumerate(plan):
+                    write_clip_pcm(reader.read(start, end), reader.sample_rate, out / f"{idx:06d}.wav")
+
+        results["inproc"] = _time("inproc", run_inproc)
+
+        if shutil.which("ffmpeg"):
+            def run_ffmpeg() -> None:
+                out = tmp_dir / "ffmpeg"
+                out.mkdir()
+                for idx, (start, end) in enumerate(plan):
+                    slice_clip_pcm(source, start, end, out / f"{idx:06d}.wav")
+
+            results["ffmpeg"] = _time("ffmpeg", run_ffmpeg)
+
+            if not args.skip_legacy:
+                def run_legacy() -> None:
+                    out = tmp_dir / "legacy"
+                    out.mkdir()
+                    for idx, (start, end) in enumerate(plan):
+                        _legacy_slice(source, start, end, out / f"{idx:06d}.wav")
+
+                results["legacy"] = _time("legacy", run_legacy)
+        else:
+            print("ffmpeg not found on PATH; skipping ffmpeg legs")
+
+        base = results["inproc"]
+        for label, elapsed in results.items():
+            if label != "inproc":
+                print(f"speedup inproc vs {label}: {elapsed / max(base, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark + equivalence check: SQLite job repository vs. rewriting temp/jobs.json.
+
+Usage (from backend/):
+    python -m benchmarks.job_repository --jobs 200 --logs 200
+
+Works in a scratch directory (``temp/`` is relative to the working directory):
+  * writes ``--jobs`` domain jobs with ``--logs`` log lines each through
+    ``JsonJobRepository`` plus a few wizard jobs into the same jobs.json, opens
+    the SQLite database (which imports the file once) and checks that
+    ``find_all`` and ``jobs.storage.get_all_jobs`` return what the JSON held,
+  * times one log-append save with everything above already stored, and
+  * has ``--threads`` threads each append log lines to their own job through
+    both repositories at once and counts the lines that survive.
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from streamcraft.domain.job.entities.job import Job, create_job
+from streamcraft.domain.shared.branded_types import create_job_id, create_vod_id
+from streamcraft.infrastructure.persistence.file_system.json_job_repository import JsonJobRepository
+from streamcraft.infrastructure.persistence.sqlite import SqliteJobRepository
+from streamcraft.models.api import JobOutputs, JobResponse, JobSteps
+
+WIZARD_JOBS = [
+    {
+        "id": "job-1-1700000000",
+        "vodUrl": "https://www.twitch.tv/videos/1",
+        "streamer": "someone",
+        "title": "First",
+        "createdAt": "2024-01-01T10:00:00",
+        "updatedAt": "2024-01-01T11:00:00",
+        "steps": {"vod": True, "audio": True, "sanitize": False, "srt": False, "train": False, "tts": False},
+        "outputs": {"audioPath": "temp/1.wav"},
+    },
+    {
+        "id": "job-2-1700000001",
+        "vodUrl": "https://www.twitch.tv/videos/2",
+        "streamer": "someone",
+        "title": "Second",
+        "createdAt": "2024-01-02T10:00:00",
+        "updatedAt": "2024-01-02T10:00:00",
+        "steps": {"vod": True, "audio": False, "sanitize": False, "srt": False, "train": False, "tts": False},
+        "outputs": {},
+    },
+    {"id": "job-old", "vod_url": "https://www.twitch.tv/videos/0", "created": "2023-12-31T00:00:00"},
+]
+
+
+def _append_log(job: Job, message: str) -> Job:
+    step = job.steps[0]
+    steps = (dataclasses.replace(step, log_messages=tuple(step.log_messages) + (message,)),) + tuple(job.steps[1:])
+    return dataclasses.replace(job, steps=steps)
+
+
+def _make_job(index: int, logs: int) -> Job:
+    job = create_job(create_job_id(f"job-{index:05d}"), create_vod_id(str(index)), f"https://www.twitch.tv/videos/{index}")
+    step = job.steps[0]
+    step = dataclasses.replace(step, log_messages=tuple(f"[{index}] line {n}" for n in range(logs)))
+    return dataclasses.replace(job, steps=(step,) + tuple(job.steps[1:]))
+
+
+def _log_lines(repo, job_ids) -> int:
+    wanted = set(job_ids)
+    return sum(len(job.steps[0].log_messages) for job in repo.find_all().unwrap_or(()) if job.id in wanted)
+
+
+def _hammer(repo, job_ids, appends: int) -> int:
+    """Each thread appends to its own job; returns the log lines that survived."""
+    def worker(job_id) -> None:
+        for n in range(appends):
+            try:
+                job = repo.find_by_id(job_id).unwrap()
+            except Exception:
+                # The JSON file can be caught mid-rewrite, or the job wiped by another writer.
+                continue
+            repo.save(_append_log(job, f"appended {n}"))
+
+    before = _log_lines(repo, job_ids)
+    threads = [threading.Thread(target=worker, args=(job_id,)) for job_id in job_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return _log_lines(repo, job_ids) - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--logs", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--appends", type=int, default=25)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            json_path = Path("temp") / "jobs.json"
+            json_repo = JsonJobRepository(json_path)
+            for index in range(args.jobs):
+                json_repo.save(_make_job(index, args.logs))
+            expected = json_repo.find_all().unwrap()
+            entries = json.loads(json_path.read_text())
+            json_path.write_text(json.dumps(WIZARD_JOBS[:1] + entries + WIZARD_JOBS[1:], indent=2))
+
+            t0 = time.perf_counter()
+            sqlite_repo = SqliteJobRepository()
+            migrate = time.perf_counter() - t0
+            if sqlite_repo.find_all().unwrap() != expected:
+                raise AssertionError("migrated domain jobs differ from jobs.json")
+            from streamcraft.jobs.storage import get_all_jobs
+
+            wizard = [
+                JobResponse(
+                    id=j["id"], vodUrl=j["vodUrl"], streamer=j["streamer"], title=j["title"],
+                    createdAt=j["createdAt"], updatedAt=j["updatedAt"], steps=JobSteps(**j["steps"]),
+                    outputs=JobOutputs(**j["outputs"]) if j["outputs"] else None,
+                )
+                for j in WIZARD_JOBS[:2]
+            ]
+            if get_all_jobs() != wizard:
+                raise AssertionError("migrated wizard jobs differ from jobs.json")
+            if json_path.exists() or not json_path.with_name("jobs.json.migrated").exists():
+                raise AssertionError("jobs.json was not set aside after the import")
+            print(f"equivalence: {args.jobs} domain jobs and {len(wizard)} wizard jobs read back unchanged after import")
+
+            json_repo = JsonJobRepository(Path("temp") / "bench.json")
+            for job in expected:
+                json_repo.save(job)
+            timings = {}
+            for name, repo in (("json", json_repo), ("sqlite", sqlite_repo)):
+                job = repo.find_by_id(expected[-1].id).unwrap()
+                t0 = time.perf_counter()
+                runs = 20
+                for n in range(runs):
+                    job = _append_log(job, f"timed {n}")
+                    repo.save(job)
+                timings[name] = (time.perf_counter() - t0) / runs
+
+            job_ids = [job.id for job in expected[: args.threads]]
+            wanted = args.threads * args.appends
+            json_kept = _hammer(json_repo, job_ids, args.appends)
+            sqlite_kept = _hammer(sqlite_repo, job_ids, args.appends)
+            print(f"concurrent appends kept: json {json_kept}/{wanted} (negative: lines of other saves lost too), sqlite {sqlite_kept}/{wanted}")
+            if sqlite_kept != wanted:
+                raise AssertionError("SQLite repository lost concurrent writes")
+        finally:
+            os.chdir(cwd)
+
+    size = args.jobs * args.logs
+    print(f"import       {migrate * 1000:8.2f} ms  (once, {size} log lines)")
+    print(f"json save    {timings['json'] * 1000:8.2f} ms  (rewrites every job)")
+    print(f"sqlite save  {timings['sqlite'] * 1000:8.2f} ms  ({timings['json'] / max(timings['sqlite'], 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: polyphase FIR resampling vs. the old np.interp linear resampler.
+
+Usage (from backend/):
+    python -m benchmarks.resample --minutes 20
+
+For each rate pair used by the pipeline (48k->16k for VAD/Whisper/clips,
+48k->24k for previews, 44.1k->16k for odd sources) it reports:
+  * throughput  - seconds of audio resampled per wall-clock second
+  * peak memory - tracemalloc peak above the input buffer
+  * alias level - residual of a tone above the target Nyquist, in dBFS
+for the legacy linear resampler, one-shot ``resample`` and the streaming
+``PolyphaseResampler`` fed in ``--block-sec`` blocks (output discarded, as a
+chunked pipeline writing to disk would).
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+
+import numpy as np
+
+from streamcraft.core.resample import PolyphaseResampler, resample
+
+RATE_PAIRS = ((48000, 16000), (48000, 24000), (44100, 16000))
+
+
+def _legacy_linear(audio: np.ndarray, src_sr: int, dst_sr: int) -> np.ndarray:
+    duration = len(audio) / src_sr
+    dst_len = max(1, int(round(duration * dst_sr)))
+    src_x = np.linspace(0.0, duration, num=len(audio), endpoint=False)
+    dst_x = np.linspace(0.0, duration, num=dst_len, endpoint=False)
+    return np.interp(dst_x, src_x, audio).astype(np.float32)
+
+
+def _streaming(audio: np.ndarray, src_sr: int, dst_sr: int, block: int) -> int:
+    resampler = PolyphaseResampler(src_sr, dst_sr)
+    produced = 0
+    for i in range(0, audio.size, block):
+        produced += resampler.process(audio[i : i + block]).size
+    return produced + resampler.flush().size
+
+
+def _measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _alias_db(fn, src_sr: int, dst_sr: int) -> float:
+    # A full-scale tone 25% above the target Nyquist should be removed, not folded back.
+    freq = 0.5 * dst_sr * 1.25
+    t = np.arange(src_sr * 2) / src_sr
+    out = fn(np.sin(2 * np.pi * freq * t).astype(np.float32), src_sr, dst_sr)
+    core = out[dst_sr // 10 : -dst_sr // 10]
+    rms = float(np.sqrt(np.mean(np.square(core, dtype=np.float64))))
+    return 20 * math.log10(max(rms * math.sqrt(2), 1e-12))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=20.0)
+    parser.add_argument("--block-sec", type=float, default=10.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'pair':<14}{'method':<12}{'x realtime':>12}{'peak MB':>10}{'alias dB':>10}")
+    for src_sr, dst_sr in RATE_PAIRS:
+        audio = (rng.standard_normal(int(args.minutes * 60 * src_sr)) * 0.1).astype(np.float32)
+        seconds = audio.size / src_sr
+        block = max(1, int(args.block_sec * src_sr))
+        methods = (
+            ("linear", lambda: _legacy_linear(audio, src_sr, dst_sr), _legacy_linear),
+            ("polyphase", lambda: resample(audio, src_sr, dst_sr), resample),
+            ("streaming", lambda: _streaming(audio, src_sr, dst_sr, block), resample),
+        )
+        for name, run, one_shot in methods:
+            elapsed, peak = _measure(run)
+            alias = _alias_db(one_shot, src_sr, dst_sr)
+            print(f"{f'{src_sr}->{dst_sr}':<14}{name:<12}{seconds / elapsed:>12.0f}{peak / 1e6:>10.1f}{alias:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark: vectorised keep mask / segmentation vs. the frame loops.
+
+Usage (from backend/):
+    python -m benchmarks.sanitize_mask --hours 8
+
+Times ``_hysteresis_mask``, ``_mask_to_segments`` and ``_merge_segments`` on a
+synthetic ``--hours`` long feature array (20 ms frames) against the original
+per-frame loops. Equivalence on randomised inputs is covered by
+``tests/test_sanitize_mask.py``, which holds the frozen reference loops.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from streamcraft.core.sanitize_v2 import _hysteresis_mask, _mask_to_segments, _merge_segments
+from tests.test_sanitize_mask import FRAME_MS, quality_curve, reference_mask, reference_merge, reference_segments, run_pipeline
+
+
+def _time(label: str, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<10} {elapsed:8.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-loop", action="store_true", help="Only time the vectorised path")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    frames = int(args.hours * 3600 * 1000 / FRAME_MS)
+    quality = quality_curve(rng, frames)
+    params = {"hangoverMs": 300.0, "minSegmentMs": 400.0, "minSilenceMsToSplit": 600.0}
+    print(f"{args.hours:g} h synthetic features: {frames} frames")
+
+    results = {}
+    fast = _time("numpy", lambda: results.setdefault(
+        "numpy", run_pipeline(_hysteresis_mask, _mask_to_segments, _merge_segments, quality, 0.55, params, True)))
+    if not args.skip_loop:
+        slow = _time("loop", lambda: results.setdefault(
+            "loop", run_pipeline(reference_mask, reference_segments, reference_merge, quality, 0.55, params, True)))
+        assert results["numpy"][2] == results["loop"][2], "outputs differ"
+        print(f"speedup    {slow / max(fast, 1e-9):8.1f}x  ({len(results['numpy'][2])} segments)")
+
+
+if __name__ == "__main__":
+    main()
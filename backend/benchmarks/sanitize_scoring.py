@@ -0,0 +1,189 @@
+"""Benchmark + equivalence check: prefix-sum segment scoring vs. per-segment slices.
+
+Usage (from backend/):
+    python -m benchmarks.sanitize_scoring --minutes 60
+
+Builds frame features for ``--minutes`` of synthetic bursty speech (with
+clipped samples sprinkled in), then for every preset x strictness compares
+``_score_segments`` (one vectorised pass over prefix sums and per-frame clip
+counts) with the original per-segment scorer, which took ``np.mean`` over
+feature slices and scanned each segment's audio for clipping. Quality, keep
+flag, labels and reject reasons must match exactly; the float statistics may
+differ only by float32 rounding of the old ``np.mean``. Then times both on
+the balanced preset.
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from streamcraft.core.sanitize import _clamp
+from streamcraft.core.sanitize_v2 import (
+    SanitiseConfig,
+    SanitiseMode,
+    SanitisePreset,
+    SegmentDiagnostics,
+    _apply_preroll_postroll,
+    _apply_strictness,
+    _build_keep_mask,
+    _extract_feature_set,
+    _mask_to_segments,
+    _merge_segments,
+    _preset_baseline,
+    _score_segments,
+    _SegmentStats,
+)
+
+SR = 48000
+FLOAT_TOLERANCE = 1e-4
+
+
+# Reference implementation (the per-segment scorer _score_segments replaced) --
+
+
+def _reference_segment_quality(audio, features, frame_start, frame_end, params: Dict[str, float], cfg) -> SegmentDiagnostics:
+    seg_audio = audio[int(frame_start * 0.02 * SR) : int(frame_end * 0.02 * SR)]
+    clip_ratio = float(np.mean(np.abs(seg_audio) >= 0.999)) if seg_audio.size else 0.0
+    segment_frames = slice(frame_start, frame_end)
+    speech_ratio = float(np.mean(features.vad_prob[segment_frames]))
+    snr_db = float(np.mean(features.rms_db[segment_frames] - features.noise_floor_db))
+    sfx_score = float(np.mean(features.sfx_score[segment_frames]))
+    speaker_sim = float(np.mean(features.speaker_sim[segment_frames])) if cfg.mode == SanitiseMode.VOICE and features.speaker_sim is not None else 0.5
+
+    score = 0.0
+    score += 40.0 * speech_ratio
+    score += 25.0 * _clamp((snr_db - 6.0) / 12.0, 0.0, 1.0)
+    score += 15.0 * (1.0 - clip_ratio)
+    score += 10.0 * (1.0 - sfx_score)
+    if cfg.mode == SanitiseMode.VOICE:
+        score += 25.0 * speaker_sim
+
+    quality = int(_clamp(score, 0.0, 100.0))
+    if quality >= 80:
+        labels = ["excellent"]
+    elif quality >= 60:
+        labels = ["good"]
+    elif quality >= 40:
+        labels = ["borderline"]
+    else:
+        labels = ["rejected"]
+    reject_reason: List[str] = []
+    if quality < params["qualityMinScore"]:
+        reject_reason.append("low_quality")
+    if speech_ratio < 0.4:
+        reject_reason.append("low_speech_prob")
+    if sfx_score > 0.6:
+        reject_reason.append("high_sfx")
+    if clip_ratio > 0.02:
+        reject_reason.append("clipping")
+    return SegmentDiagnostics(
+        start=frame_start * 0.02,
+        end=frame_end * 0.02,
+        quality=quality,
+        speech_ratio=speech_ratio,
+        snr_db=snr_db,
+        clip_ratio=clip_ratio,
+        sfx_score=sfx_score,
+        speaker_sim=speaker_sim,
+        kept=quality >= params["qualityMinScore"],
+        reject_reason=reject_reason,
+        labels=labels,
+    )
+
+
+def reference_scoring_pass(audio, feature_set, cfg) -> List[SegmentDiagnostics]:
+    """Mask -> segments -> per-segment scoring, as run_sanitise_v2 used to do it."""
+    features, params, segments_idx = _candidates(feature_set, cfg)
+    return [_reference_segment_quality(audio, features, s, e, params, cfg) for s, e in segments_idx]
+
+
+# Synthetic data ------------------------------------------------------------
+
+
+def synthetic_audio(minutes: float, seed: int, block_sec: float = 10.0) -> np.ndarray:
+    """Stereo float32 test signal, generated block by block into one preallocated array.
+
+    Building it in one go (float64 time axis, mask, tone, noise, then a stacked
+    copy) peaked at ~5x the output size; blocks keep the peak near the output.
+    """
+    rng = np.random.default_rng(seed)
+    total = int(minutes * 60 * SR)
+    out = np.empty((total, 2), dtype=np.float32)
+    step = max(1, int(block_sec * SR))
+    for start in range(0, total, step):
+        t = np.arange(start, min(total, start + step)) / SR
+        on = (np.sin(t * 0.9) > 0) & (np.sin(t * 7) > -0.3)
+        x = on * 0.3 * np.sin(2 * np.pi * 170 * t) * (1 + 0.6 * np.sin(2 * np.pi * 4 * t))
+        x += rng.normal(0, 0.01, t.size)
+        out[start : start + t.size, 0] = x
+        out[start : start + t.size, 1] = x * 0.8
+    # Clipped bursts, some dense enough to trip the 2% clipping reason.
+    for pos in rng.integers(0, total - SR, int(minutes * 20)):
+        length = int(rng.integers(1, SR // 4))
+        out[pos : pos + length, 0] = 1.2
+        out[pos : pos + length, 1] = 1.2 * 0.8
+    return out
+
+
+def _candidates(feature_set, cfg):
+    features = feature_set.frame_features(cfg)
+    params = _apply_strictness(_preset_baseline(cfg.preset), cfg.strictness)
+    total = features.vad_prob.size
+    mask = _build_keep_mask(features, params, cfg)
+    segments_idx = _mask_to_segments(mask, params, total_frames=total)
+    segments_idx = _apply_preroll_postroll(segments_idx, params, total)
+    return features, params, _merge_segments(segments_idx, params, cfg.preserve_pauses)
+
+
+def _vectorised_pass(feature_set, cfg) -> List[SegmentDiagnostics]:
+    features, params, segments_idx = _candidates(feature_set, cfg)
+    return _score_segments(_SegmentStats(features, feature_set), segments_idx, params, cfg)
+
+
+def _compare(ref: List[SegmentDiagnostics], new: List[SegmentDiagnostics], label: str) -> None:
+    if len(ref) != len(new):
+        raise AssertionError(f"{label}: {len(ref)} vs {len(new)} segments")
+    for a, b in zip(ref, new):
+        exact = (a.start, a.end, a.quality, a.kept, a.labels, a.reject_reason)
+        if exact != (b.start, b.end, b.quality, b.kept, b.labels, b.reject_reason):
+            raise AssertionError(f"{label}: {a} != {b}")
+        for name in ("speech_ratio", "snr_db", "clip_ratio", "sfx_score", "speaker_sim"):
+            if abs(getattr(a, name) - getattr(b, name)) > FLOAT_TOLERANCE:
+                raise AssertionError(f"{label}: {name} {getattr(a, name)} != {getattr(b, name)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    audio = synthetic_audio(args.minutes, args.seed)
+    feature_set = _extract_feature_set(audio, SR, workers=1)
+    print(f"{args.minutes:g} min synthetic audio: {feature_set.frames} frames")
+
+    checked = 0
+    for mode in SanitiseMode:
+        for preset in SanitisePreset:
+            for strictness in (0.0, 0.5, 1.0):
+                cfg = SanitiseConfig(mode=mode, preset=preset, strictness=strictness)
+                ref = reference_scoring_pass(audio, feature_set, cfg)
+                _compare(ref, _vectorised_pass(feature_set, cfg), f"{mode.value}/{preset.value}/{strictness}")
+                checked += len(ref)
+    print(f"equivalence: {checked} segments identical (floats within {FLOAT_TOLERANCE:g})")
+
+    cfg = SanitiseConfig()
+    t0 = time.perf_counter()
+    segments = reference_scoring_pass(audio, feature_set, cfg)
+    slow = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    _vectorised_pass(feature_set, cfg)
+    fast = time.perf_counter() - t0
+    print(f"per-segment {slow:8.3f}s  ({len(segments)} segments)")
+    print(f"prefix sums {fast:8.3f}s  ({slow / max(fast, 1e-9):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark + equivalence check: vectorised parameter sweep vs. one sanitize scoring pass.
+
+Usage (from backend/):
+    python -m benchmarks.sanitize_sweep --minutes 60
+
+Builds frame features for ``--minutes`` of synthetic bursty speech once, then
+  * checks that ``sweep_features`` reports the same segment count, kept count,
+    kept duration and quality histogram as the per-segment scoring path
+    sanitize used before prefix sums (mask ->
+    segments -> slice means, clip ratios read from the audio) for every
+    preset x strictness setting, and
+  * times a 3 presets x 4 strictness x 4 frameKeep sweep against that single
+    scoring pass.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.sanitize_scoring import SR, reference_scoring_pass, synthetic_audio
+from streamcraft.core.sanitize_v2 import SWEEP_HISTOGRAM_BINS, SanitiseConfig, SanitisePreset, _extract_feature_set, sweep_features
+
+
+def _summary(segments):
+    quality = np.array([seg.quality for seg in segments], dtype=np.int64)
+    bins = np.minimum(quality * SWEEP_HISTOGRAM_BINS // 100, SWEEP_HISTOGRAM_BINS - 1)
+    kept_duration = sum(seg.duration for seg in segments if seg.kept)
+    return len(segments), sum(seg.kept for seg in segments), round(kept_duration, 6), np.bincount(bins, minlength=SWEEP_HISTOGRAM_BINS).tolist()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    audio = synthetic_audio(args.minutes, args.seed)
+    t0 = time.perf_counter()
+    feature_set = _extract_feature_set(audio, SR, workers=1)
+    print(f"features   {time.perf_counter() - t0:8.3f}s  ({feature_set.frames} frames, done once / cached)")
+
+    cfg = SanitiseConfig()
+    for preset in SanitisePreset:
+        for strictness in (0.0, 0.25, 0.5, 0.75):
+            expected = _summary(reference_scoring_pass(audio, feature_set, SanitiseConfig(preset=preset, strictness=strictness)))
+            point = sweep_features(feature_set, [(preset, strictness, None)], cfg)[0]
+            got = (point.segments, point.kept, round(point.kept_duration, 6), point.quality_histogram)
+            if got != expected:
+                raise AssertionError(f"{preset.value} s={strictness}: sweep {got} != run {expected}")
+    print("equivalence: sweep matches the scoring pass for every preset x strictness")
+
+    t0 = time.perf_counter()
+    reference_scoring_pass(audio, feature_set, cfg)
+    single = time.perf_counter() - t0
+    grid = [(p, s, k) for p in SanitisePreset for s in (0.0, 0.25, 0.5, 0.75) for k in (None, 0.45, 0.55, 0.65)]
+    t0 = time.perf_counter()
+    sweep_features(feature_set, grid, cfg)
+    swept = time.perf_counter() - t0
+    print(f"one pass   {single:8.3f}s")
+    print(f"sweep      {swept:8.3f}s  ({len(grid)} settings, {swept / len(grid) * 1000:.1f} ms each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark + equivalence check: columnar segment manifest paging vs. re-parsing the JSON.
+
+Usage (from backend/):
+    python -m benchmarks.segment_manifest --segments 50000
+
+Writes a ``<vod>_segments.json`` with ``--segments`` synthetic sanitize
+segments plus its ``.npz`` sidecar, then
+  * checks that every page served from the cached columns (rows, clean-timeline
+    offsets) matches what ``/sanitize/segments`` used to build by parsing the
+    JSON and looping over all segments, and that filtered/sorted views match a
+    plain Python filter + stable sort over the dicts, and
+  * times a 200-row page both ways, plus a cold sidecar load and a first
+    (memoised) filtered view.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from streamcraft.core.segment_manifest import SegmentColumnsCache, write_segment_columns
+
+PAGE = 200
+LABELS = ("excellent", "good", "borderline", "rejected")
+REASONS = ("low_quality", "low_speech_prob", "high_sfx", "clipping")
+
+
+def _synthetic_segments(count: int, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    segments = []
+    cursor = 0.0
+    for _ in range(count):
+        start = cursor + float(rng.uniform(0.1, 2.0))
+        dur = float(rng.uniform(0.3, 8.0))
+        quality = int(rng.integers(0, 101))
+        reasons = [r for r in REASONS if rng.random() < 0.2]
+        segments.append(
+            {
+                "start": start,
+                "end": start + dur,
+                "dur": dur,
+                "kept": quality >= 55,
+                "quality": quality,
+                "speech_ratio": float(rng.random()),
+                "snr_db": float(rng.uniform(-5, 40)),
+                "clip_ratio": float(rng.random() * 0.05),
+                "sfx_score": float(rng.random()),
+                "speaker_sim": 0.5,
+                "labels": [LABELS[min(3, (100 - quality) // 20)]],
+                "reject_reason": reasons,
+            }
+        )
+        cursor = start + dur
+    return segments
+
+
+def _legacy_page(manifest_path: Path, offset: int, limit: int) -> list:
+    """The old route body: parse the JSON, walk every segment for clean offsets, slice."""
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    segments = payload.get("segments") or []
+    clean_offsets = {}
+    cursor = 0.0
+    for idx, seg in enumerate(segments):
+        if not seg.get("kept"):
+            continue
+        duration = float(seg.get("dur", 0.0))
+        clean_offsets[idx] = (cursor, cursor + duration)
+        cursor += duration
+    rows = []
+    for idx in range(min(offset, len(segments)), min(len(segments), offset + limit)):
+        seg = dict(segments[idx])
+        seg["clean_start"], seg["clean_end"] = clean_offsets.get(idx, (None, None))
+        rows.append((idx, seg))
+    return rows
+
+
+def _columns_page(columns, view, offset: int, limit: int) -> list:
+    return [(idx, columns.row(idx)) for idx in view[offset : offset + limit].tolist()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    segments = _synthetic_segments(args.segments, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = Path(tmp) / "vod_segments.json"
+        manifest_path.write_text(json.dumps({"source": {"sample_rate": 48000}, "segments": segments}, indent=2), encoding="utf-8")
+        write_segment_columns(manifest_path, segments, 48000)
+
+        cache = SegmentColumnsCache()
+        t0 = time.perf_counter()
+        columns = cache.get(manifest_path)
+        cold = time.perf_counter() - t0
+
+        view = columns.select()
+        for offset in range(0, len(segments), PAGE * 7):
+            if _columns_page(columns, view, offset, PAGE) != _legacy_page(manifest_path, offset, PAGE):
+                raise AssertionError(f"page at offset {offset} differs")
+
+        queries = [
+            (dict(kept=True), lambda s: s["kept"], None),
+            (dict(kept=False, sort="quality", descending=True), lambda s: not s["kept"], lambda s: -s["quality"]),
+            (dict(label="borderline", sort="duration"), lambda s: "borderline" in s["labels"], lambda s: s["dur"]),
+            (dict(reject_reason="clipping", min_quality=40, max_quality=80), lambda s: "clipping" in s["reject_reason"] and 40 <= s["quality"] <= 80, None),
+        ]
+        for query, keep, key in queries:
+            expected = [i for i, s in enumerate(segments) if keep(s)]
+            if key is not None:
+                expected.sort(key=lambda i: key(segments[i]))
+            if columns.select(**query).tolist() != expected:
+                raise AssertionError(f"view {query} differs")
+        print(f"equivalence: every {PAGE * 7}th page and {len(queries)} filtered/sorted views match the JSON path")
+
+        t0 = time.perf_counter()
+        _legacy_page(manifest_path, len(segments) // 2, PAGE)
+        legacy = time.perf_counter() - t0
+
+        columns = cache.get(manifest_path)
+        t0 = time.perf_counter()
+        first_view = columns.select(kept=True, sort="quality", descending=True)
+        first = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        runs = 100
+        for _ in range(runs):
+            view = columns.select(kept=True, sort="quality", descending=True)
+            _columns_page(columns, view, len(first_view) // 2, PAGE)
+        paged = (time.perf_counter() - t0) / runs
+
+    print(f"json page    {legacy * 1000:8.2f} ms  (parse + O(n) offsets, every request)")
+    print(f"sidecar load {cold * 1000:8.2f} ms  (once per process / manifest change)")
+    print(f"first view   {first * 1000:8.2f} ms  (filter + sort, once per query)")
+    print(f"cached page  {paged * 1000:8.2f} ms  ({legacy / max(paged, 1e-9):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark + equivalence check: silence-skipping separation vs. separating the whole file.
+
+Usage (from backend/):
+    python -m benchmarks.sparse_separation --minutes 20 --speech-share 0.3
+
+Writes ``--minutes`` of synthetic VOD audio in which about ``--speech-share`` of
+the time is bursty speech-like signal and the rest is low room noise, then runs
+a stand-in separator (a 511-tap FIR band-pass whose cost grows with input
+length, like UVR/Demucs) two ways:
+  * over the whole file, as sanitize and run_demucs used to, and
+  * through ``separate_speech_regions`` (pre-pass, 60 s chunks, crossfades).
+Inside every detected speech region the two outputs must agree to within PCM
+rounding (crossfades of identical chunk outputs sum back to the original), and
+everything outside the regions must be silent. Reports both timings; the
+stand-in runs far faster than real time, so the pre-pass looks costlier here
+than it is next to a real model.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.sparse_separation import EDGE_FADE_SEC, detect_speech_regions, separate_speech_regions
+
+SR = 48000
+TAPS = 511
+EDGE = max(TAPS, int(EDGE_FADE_SEC * SR))
+TOLERANCE = 4.0 / 32768  # a few LSB: both paths round to 16-bit once, chunks once more before separating
+
+
+def _band_pass() -> np.ndarray:
+    n = np.arange(TAPS) - (TAPS - 1) / 2
+    lo, hi = 80.0 / SR, 4000.0 / SR
+    taps = 2 * hi * np.sinc(2 * hi * n) - 2 * lo * np.sinc(2 * lo * n)
+    return (taps * np.hamming(TAPS)).astype(np.float32)
+
+
+def _separate(paths: List[Path]) -> List[Path]:
+    taps = _band_pass()
+    stems = []
+    for path in paths:
+        audio, sr = sf.read(str(path), dtype="float32", always_2d=True)
+        out = np.stack([np.convolve(audio[:, c], taps, mode="same") for c in range(audio.shape[1])], axis=1)
+        stem = path.with_name(f"{path.stem}_(Vocals).wav")
+        sf.write(str(stem), out, sr, subtype="PCM_16")
+        stems.append(stem)
+    return stems
+
+
+def _synthetic_vod(path: Path, minutes: float, speech_share: float, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    total = int(minutes * 60 * SR)
+    with sf.SoundFile(str(path), "w", samplerate=SR, channels=2, subtype="PCM_16") as fh:
+        pos = 0
+        while pos < total:
+            # Alternating talk bursts (2-20 s) and gaps sized to hit the requested share.
+            talk = int(rng.uniform(2, 20) * SR)
+            gap = int(talk * (1 - speech_share) / max(speech_share, 1e-3) * rng.uniform(0.5, 1.5))
+            t = np.arange(talk) / SR
+            burst = 0.3 * np.sin(2 * np.pi * rng.uniform(120, 220) * t) * (1 + 0.6 * np.sin(2 * np.pi * 4 * t))
+            block = np.concatenate((burst, np.zeros(gap)))[: total - pos]
+            block = block + rng.normal(0, 0.002, block.size)
+            fh.write(np.stack([block, 0.8 * block], axis=1).astype(np.float32))
+            pos += block.size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=float, default=20.0)
+    parser.add_argument("--speech-share", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        vod = root / "vod.wav"
+        _synthetic_vod(vod, args.minutes, args.speech_share, args.seed)
+
+        t0 = time.perf_counter()
+        full_stem = _separate([vod])[0]
+        full_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        regions = detect_speech_regions(vod)
+        prepass_time = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        result = separate_speech_regions(vod, root / "sparse.wav", _separate, regions=regions)
+        sparse_time = time.perf_counter() - t0
+
+        full, _ = sf.read(str(full_stem), dtype="float32", always_2d=True)
+        sparse, _ = sf.read(str(result.output_path), dtype="float32", always_2d=True)
+        if sparse.shape != full.shape:
+            raise AssertionError(f"shape {sparse.shape} != {full.shape}")
+        inside = np.zeros(full.shape[0], dtype=bool)
+        for start, end in result.regions:
+            # Region edges are padding: faded out, and short of band-pass context.
+            inside[int(start * SR) + EDGE : int(end * SR) - EDGE] = True
+        err = float(np.max(np.abs(sparse[inside] - full[inside]))) if inside.any() else 0.0
+        covered = np.zeros(full.shape[0], dtype=bool)
+        for start, end in result.regions:
+            covered[int(start * SR) : int(np.ceil(end * SR))] = True
+        leak = float(np.max(np.abs(sparse[~covered]))) if (~covered).any() else 0.0
+        if err > TOLERANCE or leak != 0.0:
+            raise AssertionError(f"max error in regions {err:.2e}, max level outside regions {leak:.2e}")
+        print(f"equivalence: {len(result.regions)} regions match full separation (max err {err * 32768:.1f} LSB), silence elsewhere")
+
+    print(f"speech share {100 * result.speech_share:6.1f}%  (requested {100 * args.speech_share:.0f}% + padding)")
+    print(f"full         {full_time:8.2f}s")
+    print(f"pre-pass     {prepass_time:8.2f}s")
+    print(f"sparse       {sparse_time:8.2f}s  ({full_time / max(prepass_time + sparse_time, 1e-9):.1f}x incl. pre-pass)")
+
+
+if __name__ == "__main__":
+    main()
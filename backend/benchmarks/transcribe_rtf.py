@@ -0,0 +1,72 @@
+"""Benchmark: Whisper real-time factor (RTF) per model size, for sizing CPU fleets.
+
+Usage (from backend/):
+    python -m benchmarks.transcribe_rtf --audio some_speech.wav --models tiny,base,small --device cpu
+
+RTF = decode wall time / audio duration (lower is better; 0.25 means 4x faster than real time).
+Model load time is reported separately since the shared pool pays it once per process.
+Without --audio a synthetic tone is used, which only measures encoder/decoder overhead.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.transcribe import available_cpu_count, cpu_worker_layout, detect_device
+from streamcraft.core.whisper_pool import WhisperModelPool
+
+
+def _synthetic_audio(path: Path, seconds: float) -> None:
+    sr = 16000
+    t = np.arange(int(seconds * sr), dtype=np.float32) / sr
+    tone = 0.1 * np.sin(2 * np.pi * 220.0 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * t))
+    sf.write(str(path), tone.astype(np.float32), sr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", type=Path, default=None, help="Speech sample to transcribe")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Synthetic audio length when --audio is omitted")
+    parser.add_argument("--models", default="tiny,base,small", help="Comma-separated model sizes")
+    parser.add_argument("--device", default="cpu", choices=["auto", "cuda", "cpu"])
+    parser.add_argument("--compute-type", default="auto")
+    parser.add_argument("--threads", type=int, default=0, help="cpu_threads (0 = all available cores)")
+    parser.add_argument("--beam-size", type=int, default=5)
+    args = parser.parse_args()
+
+    device, compute_type = detect_device(args.device, args.compute_type)
+    threads = cpu_worker_layout(1, args.threads)[1] if device == "cpu" else args.threads
+    pool = WhisperModelPool(budget_mb=float("inf"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        audio = args.audio
+        if audio is None:
+            audio = Path(tmp) / "synthetic.wav"
+            _synthetic_audio(audio, args.seconds)
+        duration = sf.info(str(audio)).duration
+
+        print(
+            f"device={device} compute_type={compute_type} cpu_threads={threads} "
+            f"cores={available_cpu_count()} audio={duration:.1f}s"
+        )
+        print(f"{'model':<12} {'load_s':>8} {'decode_s':>9} {'rtf':>7} {'x_realtime':>11}")
+        for size in [m.strip() for m in args.models.split(",") if m.strip()]:
+            t0 = time.perf_counter()
+            with pool.lease(size, device, compute_type, threads) as model:
+                load_s = time.perf_counter() - t0
+                t1 = time.perf_counter()
+                segments, _ = model.transcribe(str(audio), beam_size=args.beam_size, vad_filter=False)
+                for _ in segments:
+                    pass
+                decode_s = time.perf_counter() - t1
+            rtf = decode_s / max(duration, 1e-9)
+            print(f"{size:<12} {load_s:8.2f} {decode_s:9.2f} {rtf:7.3f} {1.0 / max(rtf, 1e-9):10.1f}x")
+            pool.evict_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,26 @@ app.add_middleware(
 app.include_router(routes.router, prefix="/api")
 
 
+@app.on_event("startup")
+async def warmup_whisper_models():
+    """Preload configured Whisper models in the background."""
+    import threading
+
+    from streamcraft.core.whisper_pool import warmup_from_settings
+
+    threading.Thread(target=warmup_from_settings, name="whisper-warmup", daemon=True).start()
+
+
+@app.on_event("startup")
+async def check_uvr_dependencies():
+    """Resolve the audio-separator check once (and preload UVR if configured) off the request path."""
+    import threading
+
+    from streamcraft.core.uvr import startup_from_settings
+
+    threading.Thread(target=startup_from_settings, name="uvr-startup", daemon=True).start()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
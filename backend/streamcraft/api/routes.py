@@ -20,6 +20,9 @@ from streamcraft.models.api import (
     RunAudioResponse,
     RunSanitizeRequest,
     RunSanitizeResponse,
+    SweepSanitizeRequest,
+    SweepSanitizeResponse,
+    SweepSanitizePoint,
     RunSrtRequest,
     RunSrtResponse,
     RunTtsRequest,
@@ -39,11 +42,14 @@ from streamcraft.models.api import (
     JobResponse,
     UpdateJobRequest,
     TranscribeSegmentRequest,
+    TranscribeSegmentsRequest,
     TranscribeSegmentWord,
 )
 from streamcraft.settings import get_settings
 
 router = APIRouter()
+SEGMENT_WHISPER_MODEL = "base"
+SANITIZE_SWEEP_MAX_POINTS = 500
 WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
 _sanitize_cancel_lock = threading.Lock()
 _sanitize_cancel_events: dict[str, threading.Event] = {}
@@ -117,6 +123,10 @@ async def check_vod(vod_url: str = Query(...)) -> VodMetaResponse:
 
         owner = video.get("owner") or {}
         streamer = owner.get("login") or owner.get("displayName") or "unknown"
+        if streamer != "unknown":
+            # Seed the path-resolution cache so later routes never ask Twitch again
+            from streamcraft.core.vod_metadata import get_vod_metadata_cache
+            get_vod_metadata_cache().put(vid, streamer)
         title = video.get("title") or "Untitled VOD"
         duration_raw = video.get("lengthSeconds") or video.get("durationSeconds") or video.get("duration") or 0
         try:
@@ -284,6 +294,7 @@ async def run_sanitize(request: RunSanitizeRequest) -> RunSanitizeResponse:
             target_lufs=request.targetLufs,
             true_peak_limit_db=request.truePeakLimitDb,
             fade_ms=request.fadeMs,
+            block_sec=get_settings().sanitize_block_sec,
         )
 
         def serialize_result(result):
@@ -428,6 +439,73 @@ async def run_sanitize(request: RunSanitizeRequest) -> RunSanitizeResponse:
         raise HTTPException(status_code=500, detail=f"Sanitize failed: {exc}")
 
 
+@router.post("/sanitize/sweep")
+async def sweep_sanitize(request: SweepSanitizeRequest) -> SweepSanitizeResponse:
+    """Score a preset x strictness x frameKeep grid on cached features (no audio is rendered)."""
+    from streamcraft.core.pipeline import configure_temp_dir
+    from streamcraft.core.sanitize_v2 import (
+        SWEEP_HISTOGRAM_BINS,
+        SanitiseConfig,
+        SanitiseMode,
+        SanitisePreset,
+        run_sanitise_sweep,
+    )
+
+    grid = [
+        (SanitisePreset(preset), float(strictness), frame_keep)
+        for preset in request.presets
+        for strictness in request.strictness
+        for frame_keep in request.frameKeep
+    ]
+    if not grid:
+        raise HTTPException(status_code=400, detail="Sweep grid is empty")
+    if len(grid) > SANITIZE_SWEEP_MAX_POINTS:
+        raise HTTPException(status_code=400, detail=f"Sweep grid too large ({len(grid)} > {SANITIZE_SWEEP_MAX_POINTS} settings)")
+
+    try:
+        configure_temp_dir(Path.cwd())
+        cfg = SanitiseConfig(
+            mode=SanitiseMode(request.mode),
+            extract_vocals=request.extractVocals,
+            preview=request.preview,
+            preview_start=request.previewStart,
+            preview_duration=request.previewDuration,
+            preserve_pauses=request.preservePauses,
+            reduce_sfx=request.reduceSfx,
+            block_sec=get_settings().sanitize_block_sec,
+        )
+        result = run_sanitise_sweep(
+            request.vodUrl,
+            Path(request.outdir or "out"),
+            Path(request.datasetOut or "dataset"),
+            cfg,
+            grid,
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Sanitize sweep failed: {exc}")
+
+    return SweepSanitizeResponse(
+        frames=result.frames,
+        histogramBinWidth=100 // SWEEP_HISTOGRAM_BINS,
+        points=[
+            SweepSanitizePoint(
+                preset=point.preset.value,
+                strictness=point.strictness,
+                frameKeep=point.frame_keep,
+                segments=point.segments,
+                kept=point.kept,
+                keptDuration=point.kept_duration,
+                qualityHistogram=point.quality_histogram,
+                params=point.params,
+            )
+            for point in result.points
+        ],
+        log=_timestamp_logs(result.log),
+    )
+
+
 @router.post("/jobs/{job_id}/cancel")
 async def cancel_job(job_id: str) -> dict:
     event = _get_sanitize_cancel_event(job_id)
@@ -461,6 +539,17 @@ def _load_manifest(manifest_path: Path) -> dict:
         raise HTTPException(status_code=500, detail=f"Corrupted manifest: {exc}")
 
 
+def _load_segment_columns(manifest_path: Path):
+    from streamcraft.core.segment_manifest import get_segment_columns
+
+    if not manifest_path.exists():
+        raise FileNotFoundError("Sanitize manifest missing; run sanitize first")
+    try:
+        return get_segment_columns(manifest_path)
+    except ValueError as exc:
+        raise HTTPException(status_code=500, detail=f"Corrupted manifest: {exc}")
+
+
 @router.get("/sanitize/segments")
 async def get_sanitize_segments(
     vodUrl: str = Query(..., description="VOD URL the segments belong to"),
@@ -468,66 +557,67 @@ async def get_sanitize_segments(
     datasetOut: str = Query("dataset"),
     offset: int = Query(0, ge=0),
     limit: int = Query(200, ge=1, le=1000),
+    kept: bool | None = Query(None, description="Only kept (true) or rejected (false) segments"),
+    minQuality: int | None = Query(None, ge=0, le=100),
+    maxQuality: int | None = Query(None, ge=0, le=100),
+    label: str | None = Query(None, description="Only segments carrying this label"),
+    rejectReason: str | None = Query(None, description="Only segments rejected for this reason"),
+    sort: str = Query("index", description="index | quality | duration | kept | label | rejectReason"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
 ) -> SegmentManifestResponse:
     from streamcraft.core.pipeline import resolve_output_dirs
+    from streamcraft.core.segment_manifest import SORT_KEYS
+
+    if sort not in SORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(SORT_KEYS)}")
 
     out_root = Path(outdir or "out")
     dataset_root = Path(datasetOut or "dataset")
     _, vod_dir, dataset_dir = resolve_output_dirs(vodUrl, out_root, dataset_root)
     manifest_path = dataset_dir / f"{vod_dir.name}_segments.json"
-    payload = _load_manifest(manifest_path)
+    columns = _load_segment_columns(manifest_path)
 
     clean_path = vod_dir / f"{vod_dir.name}_clean.wav"
     clean_path_rel = to_workspace_relative(clean_path) if clean_path.exists() else None
     original_path = vod_dir / f"{vod_dir.name}_full.wav"
     original_path_rel = to_workspace_relative(original_path) if original_path.exists() else None
 
-    segments = payload.get("segments") or []
-    sample_rate = int(payload.get("source", {}).get("sample_rate") or 0)
-
-    total = len(segments)
+    # The filtered, sorted index is memoised per query, so a page only touches its own rows.
+    view = columns.select(kept, minQuality, maxQuality, label, rejectReason, sort, order == "desc")
+    total = int(view.size)
     slice_start = min(max(0, offset), total)
     slice_end = min(total, slice_start + limit)
 
-    clean_offsets: dict[int, tuple[float, float]] = {}
-    cursor = 0.0
-    for idx, seg in enumerate(segments):
-        if not seg.get("kept"):
-            continue
-        duration = float(seg.get("dur", 0.0))
-        clean_offsets[idx] = (cursor, cursor + duration)
-        cursor += duration
-
     items: list[SegmentManifestItem] = []
-    for idx in range(slice_start, slice_end):
-        seg = segments[idx]
-        clean_start, clean_end = clean_offsets.get(idx, (None, None))
+    for idx in view[slice_start:slice_end].tolist():
+        seg = columns.row(idx)
         items.append(
             SegmentManifestItem(
                 index=idx,
-                start=float(seg.get("start", 0.0)),
-                end=float(seg.get("end", 0.0)),
-                duration=float(seg.get("dur", 0.0)),
-                cleanStart=clean_start,
-                cleanEnd=clean_end,
-                kept=seg.get("kept"),
-                quality=seg.get("quality"),
-                speechRatio=seg.get("speech_ratio"),
-                snrDb=seg.get("snr_db"),
-                clipRatio=seg.get("clip_ratio"),
-                sfxScore=seg.get("sfx_score"),
-                speakerSim=seg.get("speaker_sim"),
-                labels=seg.get("labels") or [],
-                rejectReason=seg.get("reject_reason") or [],
+                start=seg["start"],
+                end=seg["end"],
+                duration=seg["dur"],
+                cleanStart=seg["clean_start"],
+                cleanEnd=seg["clean_end"],
+                kept=seg["kept"],
+                quality=seg["quality"],
+                speechRatio=seg["speech_ratio"],
+                snrDb=seg["snr_db"],
+                clipRatio=seg["clip_ratio"],
+                sfxScore=seg["sfx_score"],
+                speakerSim=seg["speaker_sim"],
+                labels=seg["labels"],
+                rejectReason=seg["reject_reason"],
             )
         )
 
     return SegmentManifestResponse(
-        sampleRate=sample_rate,
+        sampleRate=columns.sample_rate,
         cleanPath=clean_path_rel,
         originalPath=original_path_rel,
         segments=items,
         total=total,
+        totalSegments=len(columns),
         offset=slice_start,
         limit=limit,
         hasMore=slice_end < total,
@@ -714,6 +804,7 @@ async def save_segment_review(request: SaveSegmentReviewRequest) -> SaveSegmentR
 async def export_sanitize_clips(request: ExportClipsRequest) -> ExportClipsResponse:
     """Export accepted review segments as individual WAV clips per streamer/VOD."""
 
+    from streamcraft.core.audio_source import AudioSource
     from streamcraft.core.pipeline import resolve_output_dirs
 
     out_root = Path(request.outdir or "out")
@@ -739,41 +830,42 @@ async def export_sanitize_clips(request: ExportClipsRequest) -> ExportClipsRespo
     if not clean_path.exists():
         raise HTTPException(status_code=404, detail="Clean audio missing; run sanitize first")
 
-    audio, audio_sr = sf.read(str(clean_path), always_2d=False)
-    if audio_sr != sr:
+    # Each clip is a slice of the memory-mapped clean audio; only accepted ranges are read.
+    audio = AudioSource(clean_path)
+    if audio.sample_rate != sr:
         # tolerate mismatch but log via detail
-        sr = audio_sr
+        sr = audio.sample_rate
 
     clip_dir = dataset_dir / vod_dir.name / "clips_review"
     clip_dir.mkdir(parents=True, exist_ok=True)
 
     items: list[ExportClipItem] = []
-    for idx in accepted_indices:
-        if idx is None:
-            continue
-        if idx < 0 or idx >= len(segments):
-            continue
-        seg = segments[idx]
-        start = float(seg.get("start", 0.0))
-        end = float(seg.get("end", start))
-        if end <= start:
-            continue
-        start_idx = max(0, int(start * sr))
-        end_idx = min(len(audio), int(end * sr))
-        if end_idx <= start_idx:
-            continue
-        clip_audio = audio[start_idx:end_idx]
-        clip_path = clip_dir / f"{vod_dir.name}_keep_{idx:04d}.wav"
-        sf.write(str(clip_path), clip_audio, sr)
-        items.append(
-            ExportClipItem(
-                index=idx,
-                start=start,
-                end=end,
-                duration=end - start,
-                path=to_workspace_relative(clip_path),
+    with audio:
+        for idx in accepted_indices:
+            if idx is None:
+                continue
+            if idx < 0 or idx >= len(segments):
+                continue
+            seg = segments[idx]
+            start = float(seg.get("start", 0.0))
+            end = float(seg.get("end", start))
+            if end <= start:
+                continue
+            start_idx = max(0, int(start * sr))
+            end_idx = min(len(audio), int(end * sr))
+            if end_idx <= start_idx:
+                continue
+            clip_path = clip_dir / f"{vod_dir.name}_keep_{idx:04d}.wav"
+            sf.write(str(clip_path), audio.pcm(start_idx, end_idx), sr, subtype="PCM_16")
+            items.append(
+                ExportClipItem(
+                    index=idx,
+                    start=start,
+                    end=end,
+                    duration=end - start,
+                    path=to_workspace_relative(clip_path),
+                )
             )
-        )
 
     return ExportClipsResponse(
         clipsDir=to_workspace_relative(clip_dir),
@@ -788,6 +880,7 @@ async def run_srt(request: RunSrtRequest) -> RunSrtResponse:
     """Transcribe audio to SRT using faster-whisper."""
     try:
         from streamcraft.core.pipeline import resolve_output_dirs, configure_temp_dir
+        from streamcraft.core.speech_regions import find_speech_regions
         from streamcraft.core.transcribe import run_transcription
 
         configure_temp_dir(Path.cwd())
@@ -796,8 +889,10 @@ async def run_srt(request: RunSrtRequest) -> RunSrtResponse:
         out_root = Path("out")
         dataset_root = Path("dataset")
 
-        _, vod_dir, _ = resolve_output_dirs(vod_url, out_root, dataset_root)
+        _, vod_dir, dataset_dir = resolve_output_dirs(vod_url, out_root, dataset_root)
         vod_dir.mkdir(parents=True, exist_ok=True)
+        # Reuse the sanitize VAD pass when it has already run for this VOD
+        speech_regions = find_speech_regions(vod_dir, dataset_dir)
 
         log_buffer = []
 
@@ -816,15 +911,16 @@ async def run_srt(request: RunSrtRequest) -> RunSrtResponse:
         transcribe_module.log = capture_log
         transcribe_module.log_ok = capture_log
 
+        settings = get_settings()
         try:
             result = run_transcription(
                 vod=vod_url,
                 out_dir=vod_dir,
                 model="large-v3",
                 language="auto",
-                threads=8,
-                device="cuda",
-                compute_type="float16",
+                threads=settings.whisper_threads,
+                device=settings.whisper_device,
+                compute_type=settings.whisper_compute_type,
                 progress_interval=10.0,
                 vod_quality="audio_only",
                 mux_subs=False,
@@ -832,6 +928,8 @@ async def run_srt(request: RunSrtRequest) -> RunSrtResponse:
                 also_txt=True,
                 force=False,
                 max_duration=None,
+                chunk_workers=settings.whisper_chunk_workers,
+                speech_regions=speech_regions,
             )
         finally:
             transcribe_module.log = original_log
@@ -865,149 +963,113 @@ async def run_srt(request: RunSrtRequest) -> RunSrtResponse:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {exc} | {last}")
 
 
+@router.get("/srt/cache-stats")
+async def get_transcript_cache_stats() -> dict:
+    """Hit/miss counters of the content-addressed transcript cache."""
+    from streamcraft.core.transcript_cache import get_transcript_cache
+    return get_transcript_cache().stats()
+
+
+def _load_segment_manifest(vod_url: str, outdir: str | None, dataset_out: str | None):
+    """Resolve the VOD directory and load its sanitize segment manifest (as cached columns)."""
+    from streamcraft.core.pipeline import resolve_output_dirs
+    from streamcraft.core.segment_manifest import get_segment_columns
+
+    out_root = Path(outdir or "out")
+    dataset_root = Path(dataset_out or "dataset")
+    _, vod_dir, dataset_dir = resolve_output_dirs(vod_url, out_root, dataset_root)
+
+    manifest_path = dataset_dir / f"{vod_dir.name}_segments.json"
+    if not manifest_path.exists():
+        raise HTTPException(status_code=404, detail="Segment manifest not found")
+
+    return vod_dir, get_segment_columns(manifest_path)
+
+
+def _resolve_segment_audio(vod_dir: Path, columns, index: int) -> tuple[Path, float, float]:
+    """Pick the audio file and time range for a manifest segment (clean audio for kept segments)."""
+    if index < 0 or index >= len(columns):
+        raise HTTPException(status_code=400, detail="Invalid segment index")
+
+    start_time = float(columns.start[index])
+    end_time = float(columns.end[index])
+    if end_time - start_time <= 0:
+        raise HTTPException(status_code=400, detail="Invalid segment duration")
+
+    # Determine audio source - prefer clean, fallback to original
+    clean_path = vod_dir / f"{vod_dir.name}_clean.wav"
+    original_path = vod_dir / f"{vod_dir.name}_full.wav"
+
+    # Kept segments sit back-to-back on the clean timeline (precomputed prefix sum)
+    clean_range = columns.clean_range(index)
+    if clean_range is not None and clean_path.exists():
+        return clean_path, clean_range[0], clean_range[1]
+
+    if not original_path.exists():
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return original_path, start_time, end_time
+
+
+def _indexed_segment_events(word_index, key, start_time: float, end_time: float):
+    """Word events for one segment served from the persisted word index (no inference)."""
+    yield {
+        "type": "metadata",
+        "segmentIndex": key,
+        "language": word_index.language,
+        "duration": end_time - start_time,
+        "source": "index",
+    }
+    for word in word_index.words_between(start_time, end_time):
+        # Times are relative to the segment start, like the inference path
+        word["start"] -= start_time
+        word["end"] -= start_time
+        yield {"type": "word", "segmentIndex": key, **word}
+    yield {"type": "segmentDone", "segmentIndex": key}
+
+
 @router.post("/srt/transcribe-segment")
 async def transcribe_segment(request: TranscribeSegmentRequest):
     """Transcribe a single segment with word-level timestamps, streaming results as NDJSON."""
-    import tempfile
-    import numpy as np
-    from faster_whisper import WhisperModel
-    
     try:
-        from streamcraft.core.pipeline import resolve_output_dirs
-        from streamcraft.core.transcribe import detect_device, ensure_cuda_dlls_available
-        
-        # Resolve paths
-        out_root = Path(request.outdir or "out")
-        dataset_root = Path(request.datasetOut or "dataset")
-        _, vod_dir, dataset_dir = resolve_output_dirs(request.vodUrl, out_root, dataset_root)
-        
-        # Load segment manifest
-        manifest_path = dataset_dir / f"{vod_dir.name}_segments.json"
-        if not manifest_path.exists():
-            raise HTTPException(status_code=404, detail="Segment manifest not found")
-        
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-        
-        segments = payload.get("segments", [])
-        if request.segmentIndex < 0 or request.segmentIndex >= len(segments):
-            raise HTTPException(status_code=400, detail="Invalid segment index")
-        
-        segment = segments[request.segmentIndex]
-        start_time = float(segment.get("start", 0.0))
-        end_time = float(segment.get("end", 0.0))
-        duration = end_time - start_time
-        
-        if duration <= 0:
-            raise HTTPException(status_code=400, detail="Invalid segment duration")
-        
-        # Determine audio source - prefer clean, fallback to original
-        clean_path = vod_dir / f"{vod_dir.name}_clean.wav"
-        original_path = vod_dir / f"{vod_dir.name}_full.wav"
-        
-        # Check if segment has clean audio (was kept during sanitization)
-        kept = segment.get("kept", False)
-        
-        if kept and clean_path.exists():
-            # Use clean audio with cleanStart/cleanEnd if available
-            audio_path = clean_path
-            # Need to calculate clean offsets like in get_sanitize_segments
-            clean_offsets = {}
-            cursor = 0.0
-            for idx, seg in enumerate(segments):
-                if not seg.get("kept"):
-                    continue
-                dur = float(seg.get("dur", 0.0))
-                clean_offsets[idx] = (cursor, cursor + dur)
-                cursor += dur
-            
-            if request.segmentIndex in clean_offsets:
-                start_time, end_time = clean_offsets[request.segmentIndex]
-            else:
-                # Fallback to original if clean offsets not found
-                audio_path = original_path
-                start_time = float(segment.get("start", 0.0))
-                end_time = float(segment.get("end", 0.0))
-        else:
-            # Use original audio
-            if not original_path.exists():
-                raise HTTPException(status_code=404, detail="Audio file not found")
-            audio_path = original_path
-            start_time = float(segment.get("start", 0.0))
-            end_time = float(segment.get("end", 0.0))
-        
-        # Load audio and extract segment
-        audio_data, sample_rate = sf.read(audio_path)
-        start_sample = int(start_time * sample_rate)
-        end_sample = int(end_time * sample_rate)
-        segment_audio = audio_data[start_sample:end_sample]
-        
-        # Save temporary segment audio file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            sf.write(tmp_path, segment_audio, sample_rate)
-
-        # Initialize Whisper model
-        device, compute_type = detect_device("cuda", "float16")
-        if device == "cuda":
-            ensure_cuda_dlls_available()
-        
-        model = WhisperModel("base", device=device, compute_type=compute_type, cpu_threads=4)
-        
-        # Stream transcription results as NDJSON
-        async def generate():
-            try:
-                segments_iter, info = model.transcribe(
-                    str(tmp_path),
-                    language=None,
-                    vad_filter=True,
-                    beam_size=5,
-                    word_timestamps=True,
-                )
-                
-                # Send metadata
-                yield json.dumps({
-                    "type": "metadata",
-                    "language": info.language,
-                    "duration": duration,
-                }) + "\n"
-                
-                # Stream words
-                for seg in segments_iter:
-                    if hasattr(seg, 'words') and seg.words:
-                        for word_info in seg.words:
-                            word_data = {
-                                "type": "word",
-                                "word": word_info.word.strip(),
-                                "start": word_info.start,
-                                "end": word_info.end,
-                                "probability": word_info.probability,
-                            }
-                            yield json.dumps(word_data) + "\n"
-                    else:
-                        # Fallback if no word timestamps
-                        yield json.dumps({
-                            "type": "segment",
-                            "text": seg.text.strip(),
-                            "start": seg.start,
-                            "end": seg.end,
-                        }) + "\n"
-                
-                # Send completion
+        from streamcraft.core.segment_batcher import get_segment_batcher
+        from streamcraft.core.word_index import load_word_index
+
+        vod_dir, segments = _load_segment_manifest(request.vodUrl, request.outdir, request.datasetOut)
+        audio_path, start_time, end_time = _resolve_segment_audio(vod_dir, segments, request.segmentIndex)
+
+        # Serve word timings persisted by the main transcription pass when available
+        word_index = load_word_index(vod_dir, vod_dir.name)
+        if word_index is not None:
+            events = _indexed_segment_events(
+                word_index,
+                request.segmentIndex,
+                float(segments.start[request.segmentIndex]),
+                float(segments.end[request.segmentIndex]),
+            )
+
+            async def generate_from_index():
+                for event in events:
+                    if event["type"] == "segmentDone":
+                        break
+                    event.pop("segmentIndex", None)
+                    yield json.dumps(event) + "\n"
                 yield json.dumps({"type": "done"}) + "\n"
-                
-            except Exception as exc:
-                yield json.dumps({
-                    "type": "error",
-                    "message": str(exc),
-                }) + "\n"
-            finally:
-                # Cleanup temporary file after streaming finishes
-                try:
-                    tmp_path.unlink()
-                except Exception:
-                    pass
-        
+
+            return StreamingResponse(generate_from_index(), media_type="application/x-ndjson")
+
+        batcher = get_segment_batcher(SEGMENT_WHISPER_MODEL)
+
+        # Stream transcription results as NDJSON; decoding runs on the batcher's worker thread
+        async def generate():
+            async for event in batcher.stream([(request.segmentIndex, audio_path, start_time, end_time)]):
+                if event["type"] == "segmentDone":
+                    continue
+                event.pop("segmentIndex", None)
+                yield json.dumps(event) + "\n"
+                if event["type"] == "error":
+                    return
+            yield json.dumps({"type": "done"}) + "\n"
+
         return StreamingResponse(generate(), media_type="application/x-ndjson")
     
     except HTTPException:
@@ -1019,6 +1081,54 @@ async def transcribe_segment(request: TranscribeSegmentRequest):
         raise HTTPException(status_code=500, detail=f"Segment transcription failed: {exc}")
 
 
+@router.post("/srt/transcribe-segments")
+async def transcribe_segments(request: TranscribeSegmentsRequest):
+    """Transcribe many segments in micro-batches, streaming NDJSON word results per segment.
+
+    Every event carries ``segmentIndex``; each segment ends with ``segmentDone`` (or ``error``)
+    and the stream ends with ``done``.
+    """
+    try:
+        from streamcraft.core.segment_batcher import get_segment_batcher
+        from streamcraft.core.word_index import load_word_index
+
+        vod_dir, segments = _load_segment_manifest(request.vodUrl, request.outdir, request.datasetOut)
+        word_index = load_word_index(vod_dir, vod_dir.name)
+
+        jobs = []
+        invalid = []
+        for index in dict.fromkeys(request.segmentIndices):
+            try:
+                jobs.append((index, *_resolve_segment_audio(vod_dir, segments, index)))
+            except HTTPException as exc:
+                invalid.append({"type": "error", "segmentIndex": index, "message": exc.detail})
+
+        async def generate():
+            for event in invalid:
+                yield json.dumps(event) + "\n"
+            if word_index is not None:
+                for index, _, _, _ in jobs:
+                    start_time = float(segments.start[index])
+                    end_time = float(segments.end[index])
+                    for event in _indexed_segment_events(word_index, index, start_time, end_time):
+                        yield json.dumps(event) + "\n"
+            elif jobs:
+                batcher = get_segment_batcher(SEGMENT_WHISPER_MODEL)
+                async for event in batcher.stream(jobs):
+                    yield json.dumps(event) + "\n"
+            yield json.dumps({"type": "done"}) + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    except HTTPException:
+        raise
+    except Exception as exc:
+        import traceback
+        tb = traceback.format_exc()
+        print(f"[transcribe-segments] exception: {exc}\n{tb}")
+        raise HTTPException(status_code=500, detail=f"Segment transcription failed: {exc}")
+
+
 @router.post("/tts/run")
 async def run_tts(request: RunTtsRequest):
     """Generate TTS output using XTTS v2. Supports streaming logs when stream=True."""
@@ -1226,13 +1336,18 @@ async def purge_job(job_id: str) -> dict:
 
     removed: list[str] = []
     if vod_dir.exists():
+        from streamcraft.core.uvr import get_vocal_cache
+
+        # The stem next to the VOD is a hardlink into the vocal cache; drop that entry too.
+        get_vocal_cache().discard_linked(vod_dir / f"{vod_dir.name}_vocals.wav")
         shutil.rmtree(vod_dir, ignore_errors=True)
         removed.append(to_workspace_relative(vod_dir))
 
     vod_slug = vod_dir.name
     segment_manifest = dataset_dir / f"{vod_slug}_segments.json"
+    segment_columns = dataset_dir / f"{vod_slug}_segments.npz"
     review_manifest = dataset_dir / f"{vod_slug}_segment_review.json"
-    for path in (segment_manifest, review_manifest):
+    for path in (segment_manifest, segment_columns, review_manifest):
         if path.exists():
             try:
                 path.unlink()
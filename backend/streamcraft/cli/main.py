@@ -7,6 +7,7 @@ import typer
 
 from streamcraft.core.pipeline import (
     configure_temp_dir,
+    load_speech_regions_arg,
     resolve_output_dirs,
     run_transcription,
 )
@@ -23,11 +24,22 @@ def pipeline(
     dataset_out: str = typer.Option("dataset", "--dataset-out", help="Base folder for dataset clips"),
     model: str = typer.Option("large-v3", "--model", help="faster-whisper model"),
     language: str = typer.Option("en", "--language", help="ISO language code or 'auto'"),
-    threads: int = typer.Option(8, "--threads", help="CPU threads for Whisper decoder"),
-    compute_type: str = typer.Option("float16", "--compute-type", help="CUDA compute precision"),
+    threads: int = typer.Option(0, "--threads", help="CPU threads for Whisper decoder (0 = all available cores)"),
+    device: str = typer.Option("auto", "--device", help="Whisper device: auto, cuda or cpu"),
+    compute_type: str = typer.Option(
+        "auto", "--compute-type", help="Whisper precision (auto, float16, int8_float16, int8, int8_float32)"
+    ),
     progress_interval: float = typer.Option(10.0, "--progress-interval", help="Seconds between progress updates"),
     vod_quality: str = typer.Option("audio_only", "--vod-quality", help="twitchdl quality"),
     max_duration: float = typer.Option(None, "--max-duration", help="Stop transcription after N seconds"),
+    chunk_workers: int = typer.Option(
+        0, "--chunk-workers", help="Transcribe long VODs in silence-aligned chunks across N processes (0 = off)"
+    ),
+    speech_regions: str = typer.Option(
+        None,
+        "--speech-regions",
+        help="Decode only the speech regions in this file (<vod>_speech.json or a sanitize manifest)",
+    ),
     mux_subs: bool = typer.Option(False, "--mux-subs", help="Mux SRT into MP4"),
     force: bool = typer.Option(False, "--force", help="Re-download + re-slice"),
     use_demucs: bool = typer.Option(False, "--use-demucs", help="Run Demucs to isolate vocals"),
@@ -36,7 +48,7 @@ def pipeline(
     pad_ms: int = typer.Option(150, "--pad-ms"),
     merge_gap_ms: int = typer.Option(300, "--merge-gap-ms"),
     min_rms_db: float = typer.Option(None, "--min-rms-db"),
-    ds_threads: int = typer.Option(4, "--ds-threads", help="FFmpeg threads for slicing"),
+    ds_threads: int = typer.Option(4, "--ds-threads", help="Parallel workers for clip export"),
     keep_existing_clips: bool = typer.Option(False, "--keep-existing-clips", help="Skip existing clips"),
     no_clip_aac: bool = typer.Option(False, "--no-clip-aac", help="Skip AAC mirrors"),
     clip_aac_bitrate: int = typer.Option(320, "--clip-aac-bitrate"),
@@ -58,7 +70,7 @@ def pipeline(
         model=model,
         language=language,
         threads=threads,
-        device="cuda",
+        device=device,
         compute_type=compute_type,
         progress_interval=progress_interval,
         vod_quality=vod_quality,
@@ -67,6 +79,8 @@ def pipeline(
         also_txt=True,
         force=force,
         max_duration=max_duration,
+        chunk_workers=chunk_workers,
+        speech_regions=load_speech_regions_arg(speech_regions),
     )
 
     run_dataset(
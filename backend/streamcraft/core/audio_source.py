@@ -0,0 +1,175 @@
+"""Random-access audio reads shared by sanitize, clip export and transcription.
+
+Most consumers only need a few seconds out of a multi-GB ``_full.wav`` or
+``_clean.wav``. ``AudioSource`` memory-maps 16-bit PCM WAV data, so any time
+range is a zero-copy int16 view and costs O(window), not O(file); float32
+conversion happens only for the frames a caller asks for. Other formats fall
+back to seek + read through libsndfile with the same interface.
+"""
+
+import math
+import struct
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+DEFAULT_BLOCK_SEC = 10.0
+PCM16_SCALE = 1.0 / 32768.0
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _pcm16_layout(path: Path) -> Optional[Tuple[int, int, int, int]]:
+    """``(data_offset, frames, channels, sample_rate)`` of a 16-bit PCM WAV, else None."""
+    file_size = path.stat().st_size
+    with open(path, "rb") as fh:
+        header = fh.read(12)
+        if len(header) < 12 or header[:4] not in (b"RIFF", b"RF64") or header[8:12] != b"WAVE":
+            return None
+        fmt: Optional[Tuple[int, int, int, int, int]] = None
+        ds64_data_size: Optional[int] = None
+        while True:
+            chunk = fh.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id = chunk[:4]
+            size = struct.unpack("<I", chunk[4:])[0]
+            if chunk_id == b"fmt ":
+                body = fh.read(size)
+                if len(body) < 16:
+                    return None
+                tag, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", body[:16])
+                if tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (tag, channels, sample_rate, block_align, bits)
+                fh.seek(size & 1, 1)
+            elif chunk_id == b"ds64":
+                body = fh.read(size)
+                if len(body) >= 16:
+                    ds64_data_size = struct.unpack("<Q", body[8:16])[0]
+                fh.seek(size & 1, 1)
+            elif chunk_id == b"data":
+                offset = fh.tell()
+                break
+            else:
+                fh.seek(size + (size & 1), 1)
+
+    if fmt is None:
+        return None
+    tag, channels, sample_rate, block_align, bits = fmt
+    if tag != _WAVE_FORMAT_PCM or bits != 16 or channels < 1 or block_align != 2 * channels:
+        return None
+    if ds64_data_size is not None and size == 0xFFFFFFFF:
+        size = ds64_data_size
+    # Writers that can't seek back (or overflow 4 GiB) leave a bogus size; trust the file length.
+    available = file_size - offset
+    if size == 0xFFFFFFFF or size > available:
+        size = available
+    return offset, size // block_align, channels, sample_rate
+
+
+class AudioSource:
+    """Read-only random access to an audio file, memory-mapped when it is 16-bit PCM WAV.
+
+    Frame indices are clamped to ``[0, frames]``. ``len()`` and slicing behave like the
+    float32 array ``sf.read(path, always_2d=False)`` would return, without reading it all.
+    """
+
+    def __init__(self, path: Path, block_sec: float = DEFAULT_BLOCK_SEC):
+        self.path = Path(path)
+        self._pcm: Optional[np.ndarray] = None
+        self._handle: Optional[sf.SoundFile] = None
+        layout = _pcm16_layout(self.path)
+        if layout is not None:
+            offset, frames, channels, sample_rate = layout
+            if frames > 0:
+                self._pcm = np.memmap(self.path, dtype="<i2", mode="r", offset=offset, shape=(frames, channels))
+            else:
+                self._pcm = np.zeros((0, channels), dtype=np.int16)
+        else:
+            self._handle = sf.SoundFile(str(self.path))
+            frames = int(self._handle.frames)
+            channels = int(self._handle.channels)
+            sample_rate = int(self._handle.samplerate)
+        self.frames = frames
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.block_frames = max(1, int(block_sec * sample_rate))
+
+    @property
+    def mapped(self) -> bool:
+        """True when reads are zero-copy views of the mapped file."""
+        return self._handle is None
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    def index(self, seconds: float) -> int:
+        """Frame index of ``seconds``, clamped to the file."""
+        if not math.isfinite(seconds):
+            return self.frames if seconds > 0 else 0
+        return min(self.frames, max(0, int(seconds * self.sample_rate)))
+
+    def _bounds(self, start: int, stop: Optional[int]) -> Tuple[int, int]:
+        start = min(self.frames, max(0, start))
+        stop = self.frames if stop is None else min(self.frames, max(start, stop))
+        return start, stop
+
+    def pcm(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """int16 samples shaped (frames, channels); a view into the mapping when ``mapped``."""
+        start, stop = self._bounds(start, stop)
+        if self._pcm is not None:
+            return self._pcm[start:stop]
+        self._handle.seek(start)
+        return self._handle.read(stop - start, dtype="int16", always_2d=True)
+
+    def samples(self, start: int = 0, stop: Optional[int] = None, always_2d: bool = False) -> np.ndarray:
+        """float32 samples in [-1, 1); mono files come back 1-D unless ``always_2d``."""
+        if self._pcm is not None:
+            data = self.pcm(start, stop).astype(np.float32)
+            data *= PCM16_SCALE
+        else:
+            start, stop = self._bounds(start, stop)
+            self._handle.seek(start)
+            data = self._handle.read(stop - start, dtype="float32", always_2d=True)
+        if not always_2d and self.channels == 1:
+            return data[:, 0]
+        return data
+
+    def mono(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """float32 channel mean of ``[start, stop)``."""
+        data = self.samples(start, stop, always_2d=True)
+        return data[:, 0] if self.channels == 1 else data.mean(axis=1)
+
+    def blocks(self, start: int = 0, stop: Optional[int] = None, block_frames: Optional[int] = None) -> Iterator[np.ndarray]:
+        """float32 blocks of at most ``block_frames`` covering ``[start, stop)``."""
+        start, stop = self._bounds(start, stop)
+        step = max(1, block_frames or self.block_frames)
+        for pos in range(start, stop, step):
+            yield self.samples(pos, min(stop, pos + step))
+
+    def __len__(self) -> int:
+        return self.frames
+
+    def __getitem__(self, key: slice) -> np.ndarray:
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("AudioSource supports contiguous slices only")
+        start, stop, _ = key.indices(self.frames)
+        return self.samples(start, stop)
+
+    def close(self) -> None:
+        # Views already handed out keep the mapping alive until they are released.
+        self._pcm = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self) -> "AudioSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,63 @@
+"""Least-recently-used byte budget for the file caches under ``temp/cache``.
+
+Entries are plain files or directories of files; a hit refreshes the entry's
+mtime (``touch``), so mtime order is recency order and eviction needs no index
+beside the entries themselves.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+
+def touch(path: Path) -> None:
+    """Mark a cache entry as just used."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _entry_size(path: Path, stat: os.stat_result) -> int:
+    if not path.is_dir():
+        return stat.st_size
+    return sum(child.stat().st_size for child in path.iterdir() if child.is_file())
+
+
+def _remove_entry(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def evict_to_budget(root: Path, pattern: str, budget_bytes: int, keep: Optional[Path] = None) -> int:
+    """Delete the oldest ``root/pattern`` entries until they fit ``budget_bytes``; returns bytes freed.
+
+    ``budget_bytes <= 0`` means unbounded. ``keep`` (the entry just stored) is
+    never evicted, even if it alone exceeds the budget.
+    """
+    if budget_bytes <= 0 or not root.exists():
+        return 0
+    entries = []
+    for path in root.glob(pattern):
+        try:
+            stat = path.stat()
+            size = _entry_size(path, stat)
+        except OSError:
+            continue  # evicted or replaced by another writer meanwhile
+        entries.append((stat.st_mtime, size, path))
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total - freed <= budget_bytes:
+            break
+        if keep is not None and path == keep:
+            continue
+        try:
+            _remove_entry(path)
+        except OSError:
+            continue
+        freed += size
+    return freed
@@ -2,14 +2,21 @@ import csv
 import json
 import math
 import subprocess
-import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 import soundfile as sf
 
+from streamcraft.core.audio_source import AudioSource
+from streamcraft.core.resample import resample
+from streamcraft.core.sparse_separation import DEFAULT_MERGE_GAP_SEC, DEFAULT_PAD_SEC, separate_speech_regions
+from streamcraft.core.speech_regions import Region, normalize_regions
+
+CLIP_SAMPLE_RATE = 16000
+
 
 def log(msg: str):
     print(f"[i] {msg}")
@@ -67,13 +74,13 @@ def slice_clip_pcm(source: Path, start: float, end: float, dst: Path):
     cmd = [
         "ffmpeg",
         "-y",
-        "-i",
-        str(source),
-        "-vn",
         "-ss",
         f"{start:.3f}",
         "-to",
         f"{end:.3f}",
+        "-i",
+        str(source),
+        "-vn",
         "-ar",
         "16000",
         "-ac",
@@ -89,13 +96,13 @@ def slice_clip_aac(source: Path, start: float, end: float, dst: Path, bitrate_kb
     cmd = [
         "ffmpeg",
         "-y",
-        "-i",
-        str(source),
-        "-vn",
         "-ss",
         f"{start:.3f}",
         "-to",
         f"{end:.3f}",
+        "-i",
+        str(source),
+        "-vn",
         "-ar",
         "48000",
         "-ac",
@@ -111,27 +118,196 @@ def slice_clip_aac(source: Path, start: float, end: float, dst: Path, bitrate_kb
     subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
-def rms_db(wav_path: Path) -> float:
-    audio, sr = sf.read(wav_path)
+class ClipReader:
+    """Cuts clips out of one open ``AudioSource`` instead of spawning ffmpeg per clip.
+
+    PCM WAV is memory-mapped (anything else libsndfile can seek is opened once); each
+    clip reads exactly its own frames, so the total work is O(sum of clip lengths)
+    rather than O(clips x source length).
+    """
+
+    def __init__(self, source: Path):
+        self.source = source
+        self._audio = AudioSource(source)
+        self.sample_rate = self._audio.sample_rate
+        self.channels = self._audio.channels
+        self.frames = self._audio.frames
+
+    def read(self, start: float, end: float) -> np.ndarray:
+        """Return float32 samples shaped (frames, channels) for [start, end) seconds."""
+        start_idx = min(self.frames, max(0, int(round(start * self.sample_rate))))
+        end_idx = min(self.frames, max(start_idx, int(round(end * self.sample_rate))))
+        return self._audio.samples(start_idx, end_idx, always_2d=True)
+
+    def close(self):
+        self._audio.close()
+
+    def __enter__(self) -> "ClipReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def can_slice_in_process(source: Path) -> bool:
+    try:
+        info = sf.info(str(source))
+    except Exception:
+        return False
+    return info.frames > 0
+
+
+def write_clip_pcm(samples: np.ndarray, sr: int, dst: Path) -> np.ndarray:
+    """Downmix + resample a clip to 16 kHz mono PCM (same target as slice_clip_pcm)."""
+    from streamcraft.core.sanitize import _to_mono
+
+    mono = _to_mono(samples).astype(np.float32, copy=False)
+    if mono.size:
+        mono = resample(mono, sr, CLIP_SAMPLE_RATE)
+    sf.write(str(dst), mono, CLIP_SAMPLE_RATE, subtype="PCM_16")
+    return mono
+
+
+def encode_clip_aac(samples: np.ndarray, sr: int, dst: Path, bitrate_kbps: int):
+    """Encode already-decoded samples to AAC by piping raw PCM into ffmpeg (no source re-decode)."""
+    channels = samples.shape[1] if samples.ndim == 2 else 1
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "f32le",
+        "-ar",
+        str(sr),
+        "-ac",
+        str(channels),
+        "-i",
+        "pipe:0",
+        "-ar",
+        "48000",
+        "-ac",
+        "2",
+        "-c:a",
+        "aac",
+        "-b:a",
+        f"{bitrate_kbps}k",
+        "-movflags",
+        "+faststart",
+        str(dst),
+    ]
+    payload = np.ascontiguousarray(samples, dtype="<f4").tobytes()
+    subprocess.run(cmd, input=payload, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _level_db(audio: np.ndarray) -> float:
     if audio.size == 0:
         return -120.0
-    rms = np.sqrt(np.mean(np.square(audio)))
+    return _power_db(float(np.mean(np.square(audio))))
+
+
+def _power_db(mean_square: float) -> float:
+    rms = math.sqrt(mean_square)
     if rms <= 1e-9:
         return -120.0
     return 20 * math.log10(rms)
 
 
-def run_demucs(input_audio: Path, out_dir: Path) -> Path:
+def rms_db(wav_path: Path) -> float:
+    """RMS level of a whole file, accumulated block by block."""
+    total = 0.0
+    count = 0
+    with AudioSource(wav_path) as source:
+        for block in source.blocks():
+            total += float(np.square(block, dtype=np.float64).sum())
+            count += block.size
+    if count == 0:
+        return -120.0
+    return _power_db(total / count)
+
+
+@dataclass
+class ClipTask:
+    seg: Cue
+    clip_path: Path
+    clip_aac_path: Optional[Path]
+
+
+def _export_clip(
+    task: ClipTask,
+    source_audio: Path,
+    samples: Optional[np.ndarray],
+    sample_rate: int,
+    clip_aac_bitrate: int,
+    min_rms_db: Optional[float],
+) -> bool:
+    """Write one clip (+ AAC mirror). Returns False when the RMS gate drops it; raises on failure."""
+    seg = task.seg
+    clip_path = task.clip_path
+    clip_aac_path = task.clip_aac_path
+    level = None
+    try:
+        if samples is not None:
+            level = _level_db(write_clip_pcm(samples, sample_rate, clip_path))
+            if clip_aac_path:
+                encode_clip_aac(samples, sample_rate, clip_aac_path, clip_aac_bitrate)
+        else:
+            slice_clip_pcm(source_audio, seg.start, seg.end, clip_path)
+            if clip_aac_path:
+                slice_clip_aac(source_audio, seg.start, seg.end, clip_aac_path, clip_aac_bitrate)
+    except Exception:
+        clip_path.unlink(missing_ok=True)
+        if clip_aac_path:
+            clip_aac_path.unlink(missing_ok=True)
+        raise
+
+    if min_rms_db is not None:
+        if level is None:
+            level = rms_db(clip_path)
+        if level < min_rms_db:
+            log_warn(f"Dropping clip {clip_path.name} RMS {level:.1f} dB < {min_rms_db}")
+            clip_path.unlink(missing_ok=True)
+            if clip_aac_path:
+                clip_aac_path.unlink(missing_ok=True)
+            return False
+    return True
+
+
+def _progress_logger(label: str) -> Callable[[float], None]:
+    """Logs ``label`` at every 10% step of a 0-1 progress fraction."""
+    step = [0]
+
+    def report(fraction: float) -> None:
+        if int(fraction * 10) > step[0]:
+            step[0] = int(fraction * 10)
+            log(f"{label} {step[0] * 10}%")
+
+    return report
+
+
+def run_demucs(input_audio: Path, out_dir: Path, regions: Optional[List[Region]] = None) -> Path:
+    """Vocal stem of ``input_audio``; with ``regions`` only those spans are separated, the rest is silence."""
+    from streamcraft.core.demucs_engine import check_dependencies, get_demucs_engine
+
+    if not check_dependencies():
+        raise RuntimeError("demucs is not installed (pip install demucs)")
     vocals_dir = out_dir / "demucs"
     vocals_dir.mkdir(parents=True, exist_ok=True)
-    cmd = [sys.executable, "-m", "demucs", "--two-stems", "vocals", "-o", str(vocals_dir), str(input_audio)]
-    log(f"Running demucs: {' '.join(cmd)}")
-    subprocess.run(cmd, check=True)
-    # demucs outputs folder named after model; pick newest wav in tree
-    candidates = sorted(vocals_dir.rglob("*vocals*.wav"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if not candidates:
-        raise RuntimeError("Demucs did not produce vocals stem")
-    return candidates[0]
+    engine = get_demucs_engine()
+    log(f"Running demucs ({engine.model_name}, in process) on {input_audio.name}")
+    if regions is not None:
+        progress = _progress_logger("Demucs")
+        result = separate_speech_regions(
+            input_audio,
+            vocals_dir / f"{input_audio.stem}_vocals_sparse.wav",
+            lambda paths: [engine.separate(p, {"vocals": p.with_name(f"{p.stem}_vocals.wav")})["vocals"] for p in paths],
+            regions=regions,
+            on_progress=lambda done, share: progress(done),
+            log=log,
+        )
+        log_ok(f"Demucs separated {result.separated_sec:.1f}s of {result.duration_sec:.1f}s ({100.0 * result.speech_share:.0f}%)")
+        return result.output_path
+    vocals_path = vocals_dir / f"{input_audio.stem}_vocals.wav"
+    engine.separate(input_audio, {"vocals": vocals_path}, on_progress=_progress_logger("Demucs"))
+    return vocals_path
 
 
 def run_dataset(
@@ -163,15 +339,21 @@ def run_dataset(
     existing_ids = sorted(existing_ids)
     clip_offset = max(existing_ids) if existing_ids else 0
 
-    # pick audio source
-    source_audio = input_audio
-    if use_demucs:
-        source_audio = run_demucs(input_audio, out_dir)
-
     cues = parse_srt(srt_path)
     if not cues:
         raise RuntimeError("No cues parsed from SRT")
 
+    # pick audio source
+    source_audio = input_audio
+    if use_demucs:
+        # Clips are only cut around cues, so only those spans need separating.
+        regions = normalize_regions(
+            [(cue.start, cue.end) for cue in cues],
+            pad=max(pad_ms / 1000.0, DEFAULT_PAD_SEC),
+            merge_gap=DEFAULT_MERGE_GAP_SEC,
+        )
+        source_audio = run_demucs(input_audio, out_dir, regions)
+
     # merge/normalize cues based on gaps and durations
     merged: List[Cue] = []
     for cue in cues:
@@ -201,8 +383,12 @@ def run_dataset(
         else:
             final_segments.append(Cue(start, end, cue.text))
 
-    rows = []
-    exported = []
+    # Decode the source once and seek per clip; fall back to ffmpeg for containers libsndfile can't read.
+    reader = ClipReader(source_audio) if can_slice_in_process(source_audio) else None
+    if reader is None:
+        log_warn(f"Source not seekable in-process, slicing with ffmpeg: {source_audio}")
+
+    tasks: List[ClipTask] = []
     for idx, seg in enumerate(final_segments, 1):
         clip_id = clip_offset + idx
         clip_path = clips_dir / f"{clip_id:06d}.wav"
@@ -212,25 +398,68 @@ def run_dataset(
             if clip_path.exists() or (clip_aac_path and clip_aac_path.exists()):
                 log_warn(f"Clip exists, skipping: {clip_path.name}")
                 continue
+        tasks.append(ClipTask(seg=seg, clip_path=clip_path, clip_aac_path=clip_aac_path))
+
+    # Reads stay sequential on this thread (one pass over the source); encoding and
+    # writing fan out to a bounded pool so at most ~2x workers clips sit in memory.
+    workers = max(1, threads or 1)
+    kept: Dict[int, bool] = {}
+    pending: Dict[Future, int] = {}
+    failed = 0
+
+    def collect(done) -> None:
+        nonlocal failed
+        for fut in done:
+            task_idx = pending.pop(fut)
+            task = tasks[task_idx]
+            try:
+                kept[task_idx] = fut.result()
+            except Exception as exc:
+                failed += 1
+                log_warn(f"Clip {task.clip_path.name} failed, skipping: {exc}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for task_idx, task in enumerate(tasks):
+                if len(pending) >= workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                samples = None
+                if reader is not None:
+                    try:
+                        samples = reader.read(task.seg.start, task.seg.end)
+                    except Exception as exc:
+                        failed += 1
+                        log_warn(f"Clip {task.clip_path.name} failed, skipping: {exc}")
+                        continue
+                fut = pool.submit(
+                    _export_clip,
+                    task,
+                    source_audio,
+                    samples,
+                    reader.sample_rate if reader is not None else 0,
+                    clip_aac_bitrate,
+                    min_rms_db,
+                )
+                pending[fut] = task_idx
+            collect(list(pending))
+    finally:
+        if reader is not None:
+            reader.close()
+
+    if failed:
+        log_warn(f"{failed} clip(s) failed to export")
+        if failed == len(tasks):
+            raise RuntimeError(f"All {failed} clips failed to export from {source_audio}")
 
-        try:
-            slice_clip_pcm(source_audio, seg.start, seg.end, clip_path)
-            if clip_aac_path:
-                slice_clip_aac(source_audio, seg.start, seg.end, clip_aac_path, clip_aac_bitrate)
-        except subprocess.CalledProcessError as exc:
-            clip_path.unlink(missing_ok=True)
-            if clip_aac_path:
-                clip_aac_path.unlink(missing_ok=True)
-            raise exc
-
-        if min_rms_db is not None:
-            level = rms_db(clip_path)
-            if level < min_rms_db:
-                log_warn(f"Dropping clip {clip_path.name} RMS {level:.1f} dB < {min_rms_db}")
-                clip_path.unlink(missing_ok=True)
-                if clip_aac_path:
-                    clip_aac_path.unlink(missing_ok=True)
-                continue
+    rows = []
+    exported = []
+    for task_idx, task in enumerate(tasks):
+        if not kept.get(task_idx):
+            continue
+        seg = task.seg
+        clip_path = task.clip_path
+        clip_aac_path = task.clip_aac_path
         rows.append([clip_path.name, f"{seg.start:.3f}", f"{seg.end:.3f}", seg.text])
         exported.append({
             "start": seg.start,
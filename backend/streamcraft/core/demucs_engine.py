@@ -0,0 +1,207 @@
+"""In-process Demucs source separation with bounded memory.
+
+``python -m demucs`` reloads the model on every call, holds the whole track and
+every stem of it in memory, and leaves callers to find its output by mtime.
+``DemucsEngine`` instead:
+
+* loads a pretrained model once per process (``get_demucs_engine``);
+* streams the input through a polyphase resampler to the model rate and runs
+  ``apply_model`` on fixed-size overlapping chunks (Demucs still splits each
+  chunk into its own segments internally);
+* crossfades neighbouring chunks and writes every requested stem straight to
+  disk, so memory stays at a couple of chunks whatever the track length;
+* reports progress per chunk and checks for cancellation between chunks.
+
+Used by ``core.dataset.run_demucs`` and the ``DemucsSeparator`` adapter.
+"""
+
+import importlib.util
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.audio_source import AudioSource
+from streamcraft.core.resample import PolyphaseResampler
+from streamcraft.core.sparse_separation import TimelineWriter, crossfade_weights, plan_chunks
+
+DEFAULT_MODEL = "htdemucs"
+DEFAULT_CHUNK_SEC = 30.0
+DEFAULT_OVERLAP_SEC = 1.0
+SEGMENT_OVERLAP = 0.25  # apply_model's overlap between its own segments inside a chunk
+COMPLEMENT_PREFIX = "no_"  # "no_vocals" = mix minus vocals, as ``--two-stems`` writes it
+
+
+_available: Optional[bool] = None
+
+
+def check_dependencies() -> bool:
+    """Whether demucs and torch are importable; memoised."""
+    global _available
+    if _available is None:
+        _available = all(importlib.util.find_spec(name) is not None for name in ("demucs", "torch"))
+    return _available
+
+
+def _match_channels(data: np.ndarray, channels: int) -> np.ndarray:
+    """(n, c) -> (n, channels) the way demucs' ``convert_audio`` does."""
+    if data.shape[1] == channels:
+        return data
+    if channels == 1:
+        return data.mean(axis=1, keepdims=True)
+    if data.shape[1] == 1:
+        return np.repeat(data, channels, axis=1)
+    return data[:, :channels]
+
+
+def _mix_stats(source: AudioSource) -> Tuple[float, float]:
+    """Mean and standard deviation of the mono mix; demucs normalises its input by them."""
+    total = 0.0
+    total_sq = 0.0
+    for start in range(0, source.frames, source.block_frames):
+        mono = source.mono(start, start + source.block_frames).astype(np.float64)
+        total += float(mono.sum())
+        total_sq += float(np.dot(mono, mono))
+    count = max(1, source.frames)
+    mean = total / count
+    std = float(np.sqrt(max(total_sq / count - mean * mean, 0.0)))
+    return mean, std if std > 1e-8 else 1.0
+
+
+def _model_rate_blocks(source: AudioSource, channels: int, sample_rate: int) -> Iterator[np.ndarray]:
+    """(channels, n) float32 blocks of ``source`` converted to the model's layout and rate."""
+    resamplers = [PolyphaseResampler(source.sample_rate, sample_rate) for _ in range(channels)]
+    for block in source.blocks():
+        block = _match_channels(block.reshape(block.shape[0], -1), channels)
+        yield np.stack([resampler.process(np.ascontiguousarray(block[:, c])) for c, resampler in enumerate(resamplers)])
+    yield np.stack([resampler.flush() for resampler in resamplers])
+
+
+class DemucsEngine:
+    """A loaded Demucs model; one separation at a time."""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, device: str = "cpu"):
+        from demucs.pretrained import get_model
+
+        self.model_name = model_name
+        self.device = device
+        self._model = get_model(model_name)
+        self._model.to(device)
+        self._model.eval()
+        self._lock = threading.Lock()
+
+    @property
+    def sample_rate(self) -> int:
+        return int(self._model.samplerate)
+
+    @property
+    def channels(self) -> int:
+        return int(self._model.audio_channels)
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self._model.sources)
+
+    def _stem_selector(self, name: str) -> Callable[[np.ndarray], np.ndarray]:
+        sources = self.sources
+        if name in sources:
+            index = sources.index(name)
+            return lambda separated: separated[index]
+        if name.startswith(COMPLEMENT_PREFIX) and name[len(COMPLEMENT_PREFIX) :] in sources:
+            index = sources.index(name[len(COMPLEMENT_PREFIX) :])
+            return lambda separated: separated.sum(axis=0) - separated[index]
+        raise ValueError(f"Unknown stem {name!r} for {self.model_name} (has {', '.join(sources)})")
+
+    def _apply(self, mix: np.ndarray, mean: float, std: float) -> np.ndarray:
+        """(sources, channels, n) stems of a (channels, n) chunk."""
+        import torch
+        from demucs.apply import apply_model
+
+        with torch.inference_mode():
+            wav = torch.from_numpy(np.ascontiguousarray((mix - mean) / std, dtype=np.float32))
+            out = apply_model(self._model, wav[None], shifts=1, split=True, overlap=SEGMENT_OVERLAP, progress=False, device=self.device)[0]
+            return (out * std + mean).cpu().numpy()
+
+    def separate(
+        self,
+        input_path: Path,
+        outputs: Dict[str, Path],
+        chunk_sec: float = DEFAULT_CHUNK_SEC,
+        overlap_sec: float = DEFAULT_OVERLAP_SEC,
+        on_progress: Optional[Callable[[float], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Path]:
+        """Write each stem named in ``outputs`` (a source, or ``no_<source>``) to its path.
+
+        Stems are 16-bit WAV at the model's sample rate and channel count.
+        ``on_progress`` gets the fraction done after every chunk; ``should_cancel``
+        is polled before every chunk and aborts with ``RuntimeError``.
+        """
+        selectors = {name: self._stem_selector(name) for name in outputs}
+        sr = self.sample_rate
+        channels = self.channels
+        tmp_paths = {name: path.with_name(f"{path.name}.{os.getpid()}.tmp") for name, path in outputs.items()}
+        handles: Dict[str, sf.SoundFile] = {}
+        with self._lock, AudioSource(input_path) as source:
+            try:
+                mean, std = _mix_stats(source)
+                total = PolyphaseResampler(source.sample_rate, sr).output_length(source.frames)
+                chunks = plan_chunks([(0.0, total / sr)], sr, total, chunk_sec, overlap_sec)
+                writers: Dict[str, TimelineWriter] = {}
+                for name, tmp in tmp_paths.items():
+                    tmp.parent.mkdir(parents=True, exist_ok=True)
+                    handles[name] = sf.SoundFile(str(tmp), "w", samplerate=sr, channels=channels, subtype="PCM_16", format="WAV")
+                    writers[name] = TimelineWriter(handles[name], total)
+
+                blocks = _model_rate_blocks(source, channels, sr)
+                buffer = np.zeros((channels, 0), dtype=np.float32)
+                buffer_start = 0
+                for i, (start, stop) in enumerate(chunks):
+                    if should_cancel and should_cancel():
+                        raise RuntimeError("Separation canceled by user")
+                    while buffer_start + buffer.shape[1] < stop:
+                        block = next(blocks, None)
+                        if block is None:
+                            break
+                        buffer = np.concatenate((buffer, block), axis=1)
+                    separated = self._apply(buffer[:, start - buffer_start : stop - buffer_start], mean, std)
+
+                    prev_stop = chunks[i - 1][1] if i > 0 else start
+                    next_start = chunks[i + 1][0] if i + 1 < len(chunks) else stop
+                    weights = crossfade_weights(stop - start, max(0, prev_stop - start), max(0, stop - next_start))
+                    for name, select in selectors.items():
+                        stem = np.clip(select(separated).T, -1.0, 1.0) * weights[:, None]
+                        writers[name].add(start, stem.astype(np.float32, copy=False))
+
+                    buffer = buffer[:, next_start - buffer_start :]
+                    buffer_start = next_start
+                    if on_progress:
+                        on_progress(stop / total)
+
+                for name, writer in writers.items():
+                    writer.finish()
+                    handles.pop(name).close()
+                    os.replace(tmp_paths[name], outputs[name])
+            finally:
+                for handle in handles.values():
+                    handle.close()
+                for tmp in tmp_paths.values():
+                    tmp.unlink(missing_ok=True)
+        return dict(outputs)
+
+
+_engines: Dict[Tuple[str, str], DemucsEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_demucs_engine(model_name: str = DEFAULT_MODEL, device: str = "cpu") -> DemucsEngine:
+    """Get or load the process-wide engine for ``model_name`` on ``device``."""
+    with _engines_lock:
+        engine = _engines.get((model_name, device))
+        if engine is None:
+            engine = DemucsEngine(model_name, device)
+            _engines[(model_name, device)] = engine
+        return engine
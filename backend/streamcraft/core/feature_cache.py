@@ -0,0 +1,87 @@
+"""Content-addressed cache of sanitize frame features.
+
+Sanitize spends most of its time decoding, resampling and scoring every 20 ms
+frame (RMS, SFX transients, webrtcvad). None of that depends on the preset,
+strictness, preserve-pauses or reduce-SFX settings, so the per-frame arrays are
+stored as a compressed ``.npz`` keyed by the decoded-audio hash plus the
+feature parameters; a re-tune only redoes the keep mask, scoring and render.
+
+Layout under ``temp/cache/features``::
+
+    <key>.npz   # rms_db, sfx_score, noise_floor_db, bit-packed VAD decisions
+
+Entries are evicted least-recently-used first once they exceed
+``feature_cache_budget_mb``.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from streamcraft.core.cache_budget import evict_to_budget, touch
+from streamcraft.paths import get_paths
+
+
+class FeatureCache:
+    """Filesystem cache of per-frame feature arrays."""
+
+    def __init__(self, root: Path, budget_bytes: int = 0):
+        self.root = root
+        self.budget_bytes = budget_bytes
+
+    def audio_fingerprint(self, audio_path: Path) -> str:
+        # Shares the (path, size, mtime) memo with the transcript cache: same audio, same hash.
+        from streamcraft.core.transcript_cache import get_transcript_cache
+
+        return get_transcript_cache().audio_fingerprint(audio_path)
+
+    @staticmethod
+    def make_key(audio_hash: str, params: Dict) -> str:
+        """Cache key for features of ``audio_hash`` computed with ``params``."""
+        payload = json.dumps({"audio": audio_hash, **params}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.npz"
+
+    def load(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        path = self.entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError, KeyError):
+            return None
+        touch(path)
+        return arrays
+
+    def store(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        path = self.entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: two threads storing the same key must not share a tmp file.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez_compressed(fh, **arrays)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        evict_to_budget(self.root, "*.npz", self.budget_bytes, keep=path)
+
+
+_cache: Optional[FeatureCache] = None
+
+
+def get_feature_cache() -> FeatureCache:
+    """Get or create the process-wide feature cache."""
+    global _cache
+    if _cache is None:
+        from streamcraft.settings import get_settings
+
+        _cache = FeatureCache(get_paths().features_cache_dir, get_settings().feature_cache_budget_mb << 20)
+    return _cache
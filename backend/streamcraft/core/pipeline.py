@@ -36,22 +36,53 @@ def slugify_label(value: Optional[str], fallback: str) -> str:
     return cleaned or fallback
 
 
-def describe_vod(vod: str) -> Tuple[str, Optional[str]]:
+def _fetch_vod_owner(vid: str) -> Optional[str]:
+    from twitchdl import twitch  # type: ignore
+
+    video = twitch.get_video(vid) or {}
+    owner = video.get("owner") or {}
+    return owner.get("login") or owner.get("displayName")
+
+
+def _find_existing_bucket(out_root: Path, vod_slug: str) -> Optional[str]:
+    """Streamer bucket of an already materialised ``<out_root>/<bucket>/vods/<vod_slug>`` dir."""
+    try:
+        buckets = [p.parent.parent.name for p in out_root.glob(f"*/vods/{vod_slug}") if p.is_dir()]
+    except OSError:
+        return None
+    buckets = [b for b in buckets if b != "unknown"]
+    return buckets[0] if len(buckets) == 1 else None
+
+
+def describe_vod(vod: str, out_root: Optional[Path] = None) -> Tuple[str, Optional[str]]:
+    """Return (streamer, vod id) for a VOD URL, via the persistent metadata cache.
+
+    With ``out_root``, a VOD folder that already exists under exactly one streamer bucket
+    is adopted without asking Twitch.
+    """
     if not vod.startswith("http"):
         return "local", Path(vod).stem or "vod"
 
     try:
-        from twitchdl import twitch, utils  # type: ignore
+        from twitchdl import utils  # type: ignore
 
         vid = utils.parse_video_identifier(vod)
-        if not vid:
-            return "unknown", None
-        video = twitch.get_video(vid) or {}
-        owner = video.get("owner") or {}
-        streamer = owner.get("login") or owner.get("displayName") or "unknown"
-        return streamer, vid
     except Exception:
         return "unknown", None
+    if not vid:
+        return "unknown", None
+
+    from streamcraft.core.vod_metadata import get_vod_metadata_cache
+
+    cache = get_vod_metadata_cache()
+    if out_root is not None and cache.get(vid) is None:
+        bucket = _find_existing_bucket(out_root, slugify_label(vid, vid))
+        if bucket:
+            cache.put(vid, bucket)
+    streamer = cache.resolve(vid, _fetch_vod_owner)
+    if not streamer:
+        return "unknown", None
+    return streamer, vid
 
 
 def fallback_vod_slug(vod: str) -> str:
@@ -61,7 +92,7 @@ def fallback_vod_slug(vod: str) -> str:
 
 
 def resolve_output_dirs(vod: str, out_root: Path, dataset_root: Path) -> Tuple[str, Path, Path]:
-    streamer, vod_identifier = describe_vod(vod)
+    streamer, vod_identifier = describe_vod(vod, out_root=out_root)
     streamer_slug = slugify_label(streamer, "unknown")
     vod_slug = slugify_label(vod_identifier, fallback_vod_slug(vod))
 
@@ -70,9 +101,21 @@ def resolve_output_dirs(vod: str, out_root: Path, dataset_root: Path) -> Tuple[s
     return streamer_slug or "unknown", vod_dir, dataset_dir
 
 
+def load_speech_regions_arg(path: Optional[str]):
+    """Load ``--speech-regions``; None when the option is not given."""
+    if not path:
+        return None
+    from streamcraft.core.speech_regions import load_speech_regions
+
+    regions = load_speech_regions(Path(path))
+    if regions is None:
+        raise ValueError(f"No usable speech regions in {path} (preview manifests are not supported)")
+    return regions
+
+
 def parse_args():
     parser = argparse.ArgumentParser(
-        description="One-click Twitch VOD → transcription → dataset tool (CUDA only)."
+        description="One-click Twitch VOD → transcription → dataset tool."
     )
     parser.add_argument("--vod", required=True, help="Twitch VOD URL or local media file path")
     parser.add_argument("--outdir", default="out", help="Base folder for VOD artifacts")
@@ -88,11 +131,19 @@ def parse_args():
         help="faster-whisper checkpoint to use",
     )
     parser.add_argument("--language", default="en", help="ISO language code or 'auto'")
-    parser.add_argument("--threads", type=int, default=8, help="CPU threads for the Whisper decoder")
+    parser.add_argument(
+        "--threads", type=int, default=0, help="CPU threads for the Whisper decoder (0 = all available cores)"
+    )
+    parser.add_argument(
+        "--device",
+        choices=["auto", "cuda", "cpu"],
+        default="auto",
+        help="Whisper device; auto uses CUDA when present and falls back to CPU",
+    )
     parser.add_argument(
         "--compute-type",
-        default="float16",
-        help="CUDA compute precision (float16, int8_float16, etc.)",
+        default="auto",
+        help="Whisper precision (auto, float16, int8_float16 on CUDA; int8, int8_float32 on CPU)",
     )
     parser.add_argument(
         "--progress-interval", type=float, default=10.0, help="Seconds between progress updates"
@@ -104,6 +155,17 @@ def parse_args():
         help="Quality label passed to twitchdl",
     )
     parser.add_argument("--max-duration", type=float, default=None, help="Stop transcription after N seconds")
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=0,
+        help="Transcribe long VODs in silence-aligned chunks across N processes (0 = off)",
+    )
+    parser.add_argument(
+        "--speech-regions",
+        default=None,
+        help="Decode only the speech regions in this file (<vod>_speech.json or a sanitize manifest)",
+    )
     parser.add_argument("--mux-subs", action="store_true", help="Also mux the SRT into the MP4")
     parser.add_argument(
         "--force",
@@ -116,7 +178,7 @@ def parse_args():
     parser.add_argument("--pad-ms", type=int, default=150)
     parser.add_argument("--merge-gap-ms", type=int, default=300)
     parser.add_argument("--min-rms-db", type=float, default=None)
-    parser.add_argument("--ds-threads", type=int, default=4, help="FFmpeg threads for slicing")
+    parser.add_argument("--ds-threads", type=int, default=4, help="Parallel workers for clip export")
     parser.add_argument(
         "--keep-existing-clips",
         action="store_true",
@@ -151,7 +213,7 @@ def main():
         model=args.model,
         language=args.language,
         threads=args.threads,
-        device="cuda",
+        device=args.device,
         compute_type=args.compute_type,
         progress_interval=args.progress_interval,
         vod_quality=args.vod_quality,
@@ -160,6 +222,8 @@ def main():
         also_txt=True,
         force=args.force,
         max_duration=args.max_duration,
+        chunk_workers=args.chunk_workers,
+        speech_regions=load_speech_regions_arg(args.speech_regions),
     )
 
     run_dataset(
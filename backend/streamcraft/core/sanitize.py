@@ -11,7 +11,9 @@ from typing import Dict, Iterable, List, Sequence, Tuple
 import numpy as np
 import soundfile as sf
 
+from streamcraft.core.audio_source import AudioSource
 from streamcraft.core.pipeline import resolve_output_dirs
+from streamcraft.core.resample import resample
 
 PREVIEW_SAMPLE_RATE = 24000
 
@@ -43,10 +45,8 @@ def _to_mono(audio: np.ndarray) -> np.ndarray:
 
 
 def _load_audio(path: Path) -> Tuple[np.ndarray, int]:
-	data, sr = sf.read(str(path), always_2d=False)
-	if data.dtype != np.float32:
-		data = data.astype(np.float32)
-	return data, int(sr)
+	with AudioSource(path) as source:
+		return source.samples(), source.sample_rate
 
 
 def _compute_rms_envelope(audio: np.ndarray, frame_samples: int) -> np.ndarray:
@@ -229,19 +229,6 @@ def write_manifest(segments: Sequence[Segment], sr: int, source: Path, path: Pat
 	path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
-def _resample_linear(audio: np.ndarray, src_sr: int, dst_sr: int) -> np.ndarray:
-	if src_sr == dst_sr:
-		return audio.copy()
-	duration = len(audio) / src_sr
-	dst_len = max(1, int(round(duration * dst_sr)))
-	if dst_len <= 1:
-		return np.zeros(1, dtype=np.float32)
-	src_samples = np.linspace(0.0, duration, num=len(audio), endpoint=False)
-	dst_samples = np.linspace(0.0, duration, num=dst_len, endpoint=False)
-	resampled = np.interp(dst_samples, src_samples, audio)
-	return resampled.astype(np.float32)
-
-
 def sanitize_audio(
 	input_wav: Path,
 	clean_path: Path,
@@ -287,7 +274,7 @@ def sanitize_audio(
 	sf.write(str(clean_path), clean_audio, sr)
 
 	preview_path = clean_path.with_name(f"{clean_path.stem}_preview.wav")
-	preview_audio = _resample_linear(clean_audio, sr, PREVIEW_SAMPLE_RATE)
+	preview_audio = resample(clean_audio, sr, PREVIEW_SAMPLE_RATE)
 	emit(f"Writing preview {preview_path} @ {PREVIEW_SAMPLE_RATE} hz")
 	sf.write(str(preview_path), preview_audio, PREVIEW_SAMPLE_RATE)
 
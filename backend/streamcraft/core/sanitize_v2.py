@@ -15,32 +15,33 @@ from __future__ import annotations
 
 import json
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 import soundfile as sf
 import webrtcvad
 import re
 
+from streamcraft.core.audio_source import DEFAULT_BLOCK_SEC, AudioSource
+from streamcraft.core.feature_cache import get_feature_cache
+from streamcraft.core.segment_manifest import write_segment_columns
 from streamcraft.core.pipeline import resolve_output_dirs
-from streamcraft.core.sanitize import _apply_fade, _clamp, _resample_linear, _to_mono
-import subprocess
-import sys
-
-
-def _has_cuda() -> bool:
-	"""Check if CUDA is available for PyTorch acceleration."""
-	try:
-		import torch
-		return torch.cuda.is_available()
-	except Exception:
-		return False
+from streamcraft.core.resample import KAISER_BETA, ZERO_CROSSINGS, PolyphaseResampler, resample
+from streamcraft.core.speech_regions import SPEECH_REGIONS_SUFFIX, regions_from_vad, write_speech_regions
+from streamcraft.core.sparse_separation import DIGITAL_SILENCE_DB
+from streamcraft.core.transcribe import available_cpu_count
 
 PREVIEW_SAMPLE_RATE = 24000
 VAD_SAMPLE_RATE = 16000
+VAD_MIN_CHUNK_FRAMES = 45000  # 15 min of 20 ms frames; webrtcvad adapts, so chunks stay long
+VAD_LEVELS = (1, 2)  # webrtcvad aggressiveness used by the presets (see _vad_aggressiveness)
+# v3: the noise floor ignores frames at or below DIGITAL_SILENCE_DB for every input
+# (sparse and full-length stems, separation off), so audio containing exact digital
+# silence gets a higher floor, and possibly a different keep mask, than under v2.
+FEATURE_CACHE_VERSION = 3
 
 
 class SanitiseMode(str, Enum):
@@ -73,6 +74,9 @@ class SanitiseConfig:
 	target_lufs: float = -18.0
 	true_peak_limit_db: float = -1.0
 	fade_ms: int = 12
+	vad_workers: int = 0  # processes scoring VAD chunks (0 = one per CPU); short audio stays in-process
+	block_sec: float = 0.0  # >0 = full runs stream the input in blocks of this many seconds
+	feature_cache: bool = True  # reuse frame features of the same audio across presets/strictness
 
 
 @dataclass
@@ -174,27 +178,10 @@ def _apply_strictness(base: Dict[str, float], s: float) -> Dict[str, float]:
 # ---------------- Audio helpers -----------------
 
 
-def _load_audio(path: Path) -> Tuple[np.ndarray, int]:
-	data, sr = sf.read(str(path), always_2d=False)
-	if data.dtype != np.float32:
-		data = data.astype(np.float32)
-	return data, int(sr)
-
-
 def _ensure_mono(audio: np.ndarray) -> np.ndarray:
 	return audio if audio.ndim == 1 else audio.mean(axis=1)
 
 
-def _resample_simple(audio: np.ndarray, src_sr: int, dst_sr: int) -> np.ndarray:
-	if src_sr == dst_sr:
-		return audio.copy()
-	duration = len(audio) / src_sr
-	dst_len = max(1, int(round(duration * dst_sr)))
-	src_x = np.linspace(0.0, duration, num=len(audio), endpoint=False)
-	dst_x = np.linspace(0.0, duration, num=dst_len, endpoint=False)
-	return np.interp(dst_x, src_x, audio).astype(np.float32)
-
-
 # ---------------- Feature extraction -----------------
 
 
@@ -206,33 +193,101 @@ def _frame_audio(audio: np.ndarray, frame_samples: int) -> np.ndarray:
 	return trimmed.reshape(total, frame_samples)
 
 
+def _frame_rms(frames: np.ndarray) -> np.ndarray:
+	return np.sqrt(np.mean(frames * frames, axis=1) + 1e-12)
+
+
 def _rms_db(frames: np.ndarray) -> np.ndarray:
 	if frames.size == 0:
 		return np.array([], dtype=np.float32)
-	rms = np.sqrt(np.mean(frames * frames, axis=1) + 1e-12)
-	return 20 * np.log10(rms + 1e-12)
+	return 20 * np.log10(_frame_rms(frames) + 1e-12)
 
 
 def _sfx_score(frames: np.ndarray) -> np.ndarray:
-	# Simple transient detector: normalized absolute diff between consecutive frame RMS
 	if len(frames) == 0:
 		return np.array([], dtype=np.float32)
-	rms = np.sqrt(np.mean(frames * frames, axis=1) + 1e-12)
+	return _sfx_from_rms(_frame_rms(frames))
+
+
+def _sfx_from_rms(rms: np.ndarray) -> np.ndarray:
+	# Simple transient detector: normalized absolute diff between consecutive frame RMS
 	diff = np.abs(np.diff(rms, prepend=rms[:1]))
 	max_rms = np.maximum(rms, 1e-6)
 	score = diff / max_rms
 	return np.clip(score, 0.0, 1.0).astype(np.float32)
 
 
-def _vad_prob(frames: np.ndarray, vad: webrtcvad.Vad) -> np.ndarray:
+def _vad_decisions(pcm: memoryview, frame_bytes: int, lo: int, hi: int, vad: webrtcvad.Vad) -> np.ndarray:
+	"""Speech decisions for frames ``lo..hi`` of an int16 PCM buffer, read as zero-copy slices."""
+	out = np.empty(hi - lo, dtype=np.float32)
+	for i in range(lo, hi):
+		out[i - lo] = 1.0 if vad.is_speech(pcm[i * frame_bytes : (i + 1) * frame_bytes], VAD_SAMPLE_RATE) else 0.0
+	return out
+
+
+def _vad_chunk_worker(shm_name: str, frame_bytes: int, lo: int, hi: int, levels: Sequence[int]) -> np.ndarray:
+	from multiprocessing import shared_memory
+
+	shm = shared_memory.SharedMemory(name=shm_name)
+	try:
+		return np.stack([_vad_decisions(shm.buf, frame_bytes, lo, hi, webrtcvad.Vad(level)) for level in levels])
+	finally:
+		shm.close()
+
+
+def _to_pcm16(frames: np.ndarray, out: np.ndarray) -> None:
+	"""Convert float frames to int16 into ``out`` in bounded blocks."""
+	flat = frames.reshape(-1)
+	block = 1 << 20
+	scratch = np.empty(min(block, flat.size), dtype=np.float32)
+	for pos in range(0, flat.size, block):
+		n = min(block, flat.size - pos)
+		np.multiply(flat[pos : pos + n], 32768.0, out=scratch[:n])
+		np.clip(scratch[:n], -32768, 32767, out=scratch[:n])
+		out[pos : pos + n] = scratch[:n]
+
+
+def _vad_speech(frames: np.ndarray, levels: Sequence[int] = VAD_LEVELS, workers: int = 0) -> np.ndarray:
+	"""Raw webrtcvad decisions (0/1), one row per aggressiveness level."""
 	if len(frames) == 0:
-		return np.array([], dtype=np.float32)
-	# webrtcvad expects 16k 16-bit mono PCM
-	probs = []
-	for f in frames:
-		pcm16 = np.clip(f * 32768.0, -32768, 32767).astype(np.int16).tobytes()
-		probs.append(1.0 if vad.is_speech(pcm16, VAD_SAMPLE_RATE) else 0.0)
-	probs = np.array(probs, dtype=np.float32)
+		return np.zeros((len(levels), 0), dtype=np.float32)
+	# webrtcvad expects 16k 16-bit mono PCM; the whole buffer is converted once.
+	total, frame_samples = frames.shape
+	frame_bytes = frame_samples * 2
+	if workers <= 0:
+		workers = available_cpu_count()
+	chunks = min(workers, total // VAD_MIN_CHUNK_FRAMES)
+
+	if chunks <= 1:
+		pcm16 = np.empty(total * frame_samples, dtype=np.int16)
+		_to_pcm16(frames, pcm16)
+		pcm = memoryview(pcm16).cast("B")
+		return np.stack([_vad_decisions(pcm, frame_bytes, 0, total, webrtcvad.Vad(level)) for level in levels])
+
+	# Each worker scores one contiguous time chunk with its own Vad instances,
+	# reading the shared int16 buffer without copying it.
+	from concurrent.futures import ProcessPoolExecutor
+	from multiprocessing import get_context, shared_memory
+
+	shm = shared_memory.SharedMemory(create=True, size=total * frame_bytes)
+	try:
+		pcm16 = np.ndarray(total * frame_samples, dtype=np.int16, buffer=shm.buf)
+		_to_pcm16(frames, pcm16)
+		bounds = np.linspace(0, total, chunks + 1).astype(int)
+		with ProcessPoolExecutor(max_workers=chunks, mp_context=get_context("spawn")) as pool:
+			futures = [
+				pool.submit(_vad_chunk_worker, shm.name, frame_bytes, int(lo), int(hi), tuple(levels))
+				for lo, hi in zip(bounds[:-1], bounds[1:])
+			]
+			speech = np.concatenate([fut.result() for fut in futures], axis=1)
+		del pcm16
+	finally:
+		shm.close()
+		shm.unlink()
+	return speech
+
+
+def _smooth_vad(probs: np.ndarray) -> np.ndarray:
 	# Smooth to act like probability
 	if probs.size >= 3:
 		kernel = np.ones(3, dtype=np.float32) / 3.0
@@ -240,30 +295,300 @@ def _vad_prob(frames: np.ndarray, vad: webrtcvad.Vad) -> np.ndarray:
 	return probs
 
 
-def extract_features(audio: np.ndarray, sr: int, cfg: SanitiseConfig) -> FrameFeatures:
+def _vad_aggressiveness(cfg: SanitiseConfig) -> int:
+	return 2 if cfg.preset == SanitisePreset.STRICT else 1
+
+
+@dataclass
+class _FeatureSet:
+	"""Per-frame features that don't depend on preset, strictness or render options.
+
+	Holds the raw VAD decisions for every level in ``VAD_LEVELS`` so one extraction
+	(or one feature-cache entry) serves every preset.
+	"""
+
+	rms_db: np.ndarray
+	sfx_score: np.ndarray
+	noise_floor_db: float
+	vad_speech: np.ndarray  # shape (len(VAD_LEVELS), n), 0/1
+	clip_count: np.ndarray  # clipped source samples (all channels) per frame, see _frame_sample_bounds
+	sample_rate: int
+	channels: int
+	samples: int  # source frames the features were computed from
+
+	@classmethod
+	def build(cls, rms_db: np.ndarray, sfx: np.ndarray, vad_speech: np.ndarray, clips: "_ClipCounter") -> "_FeatureSet":
+		# Digital silence (e.g. the gaps a sparse vocal stem leaves unseparated) would drag the floor to -240 dB.
+		audible = rms_db[rms_db > DIGITAL_SILENCE_DB]
+		noise_floor_db = float(np.percentile(audible, 15)) if audible.size else -60.0
+		return cls(
+			rms_db=rms_db,
+			sfx_score=sfx,
+			noise_floor_db=noise_floor_db,
+			vad_speech=vad_speech,
+			clip_count=clips.finish(rms_db.size),
+			sample_rate=clips.sr,
+			channels=clips.channels,
+			samples=clips.samples,
+		)
+
+	@property
+	def frames(self) -> int:
+		return int(self.rms_db.size)
+
+	def frame_features(self, cfg: SanitiseConfig) -> FrameFeatures:
+		vad_prob = _smooth_vad(self.vad_speech[VAD_LEVELS.index(_vad_aggressiveness(cfg))])
+
+		# Placeholder speaker similarity until embeddings are integrated
+		speaker_sim = None
+		if cfg.mode == SanitiseMode.VOICE:
+			speaker_sim = np.full_like(vad_prob, 0.5)
+
+		return FrameFeatures(
+			rms_db=self.rms_db,
+			vad_prob=vad_prob,
+			noise_floor_db=self.noise_floor_db,
+			sfx_score=self.sfx_score,
+			speaker_sim=speaker_sim,
+		)
+
+	def to_arrays(self) -> Dict[str, np.ndarray]:
+		return {
+			"rms_db": self.rms_db,
+			"sfx_score": self.sfx_score,
+			"noise_floor_db": np.float64(self.noise_floor_db),
+			"vad_speech": np.packbits(self.vad_speech > 0.5, axis=1),
+			"clip_count": self.clip_count,
+			"frames": np.int64(self.frames),
+			"source": np.array([self.sample_rate, self.channels, self.samples], dtype=np.int64),
+		}
+
+	@classmethod
+	def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "_FeatureSet":
+		frames = int(arrays["frames"])
+		speech = np.unpackbits(arrays["vad_speech"], axis=1, count=frames).astype(np.float32)
+		if speech.shape != (len(VAD_LEVELS), frames) or arrays["rms_db"].size != frames or arrays["clip_count"].size != frames:
+			raise ValueError("feature cache entry has inconsistent shapes")
+		sample_rate, channels, samples = (int(v) for v in arrays["source"])
+		return cls(
+			rms_db=arrays["rms_db"],
+			sfx_score=arrays["sfx_score"],
+			noise_floor_db=float(arrays["noise_floor_db"]),
+			vad_speech=speech,
+			clip_count=arrays["clip_count"],
+			sample_rate=sample_rate,
+			channels=channels,
+			samples=samples,
+		)
+
+
+def _frame_sample_bounds(frames: np.ndarray, sr: int) -> np.ndarray:
+	"""Source sample index where each 20 ms frame starts, as the segment scorer computes it."""
+	return (np.asarray(frames) * 0.02 * sr).astype(np.int64)
+
+
+class _ClipCounter:
+	"""Counts clipped source samples per 20 ms frame, so clip ratios need no audio reads."""
+
+	def __init__(self, sr: int):
+		self.sr = sr
+		self.channels = 1
+		self.samples = 0
+		self._counts = np.zeros(0, dtype=np.int64)
+
+	def push(self, block: np.ndarray) -> None:
+		if block.ndim > 1:
+			self.channels = block.shape[1]
+		clipped = np.abs(block) >= 0.999
+		per_sample = clipped.sum(axis=1) if clipped.ndim > 1 else clipped
+		idx = np.flatnonzero(per_sample)
+		if idx.size:
+			pos = self.samples + idx
+			# Frame starts are float-derived, so look them up rather than dividing.
+			first = max(0, int(pos[0] / (0.02 * self.sr)) - 1)
+			last = int(pos[-1] / (0.02 * self.sr)) + 2
+			bounds = _frame_sample_bounds(np.arange(first, last + 1), self.sr)
+			frame = first + np.searchsorted(bounds, pos, side="right") - 1
+			if self._counts.size < last:
+				self._counts = np.concatenate((self._counts, np.zeros(last - self._counts.size, dtype=np.int64)))
+			np.add.at(self._counts, frame, per_sample[idx].astype(np.int64))
+		self.samples += len(block)
+
+	def finish(self, frames: int) -> np.ndarray:
+		out = np.zeros(frames, dtype=np.int32)
+		n = min(frames, self._counts.size)
+		out[:n] = self._counts[:n]
+		return out
+
+
+def _extract_feature_set(audio: np.ndarray, sr: int, workers: int = 0) -> _FeatureSet:
 	mono = _ensure_mono(audio)
-	mono_16k = _resample_simple(mono, sr, VAD_SAMPLE_RATE)
+	mono_16k = resample(mono, sr, VAD_SAMPLE_RATE)
 	frame_ms = 20
 	frame_samples = int(VAD_SAMPLE_RATE * frame_ms / 1000)
 	frames = _frame_audio(mono_16k, frame_samples)
-	rms_db = _rms_db(frames)
-	noise_floor_db = float(np.percentile(rms_db, 15)) if rms_db.size else -60.0
-	sfx = _sfx_score(frames)
-	vad = webrtcvad.Vad(2 if cfg.preset == SanitisePreset.STRICT else 1)
-	vad_prob = _vad_prob(frames, vad)
-
-	# Placeholder speaker similarity until embeddings are integrated
-	speaker_sim = None
-	if cfg.mode == SanitiseMode.VOICE:
-		speaker_sim = np.full_like(vad_prob, 0.5)
-
-	return FrameFeatures(
-		rms_db=rms_db,
-		vad_prob=vad_prob,
-		noise_floor_db=noise_floor_db,
-		sfx_score=sfx,
-		speaker_sim=speaker_sim,
-	)
+	clips = _ClipCounter(sr)
+	step = 1 << 20
+	for pos in range(0, len(audio), step):
+		clips.push(audio[pos : pos + step])
+	return _FeatureSet.build(_rms_db(frames), _sfx_score(frames), _vad_speech(frames, VAD_LEVELS, workers), clips)
+
+
+def extract_features(audio: np.ndarray, sr: int, cfg: SanitiseConfig) -> FrameFeatures:
+	return _extract_feature_set(audio, sr, cfg.vad_workers).frame_features(cfg)
+
+
+# ---------------- Streaming input -----------------
+
+
+class _FeatureStream:
+	"""Incremental ``_extract_feature_set`` over consecutive blocks of source audio.
+
+	With more than one VAD worker, VAD is scored the way ``_vad_speech`` scores
+	long in-memory audio: converted int16 frames fill a shared-memory chunk of
+	``VAD_MIN_CHUNK_FRAMES`` frames, and each full chunk goes to a process pool
+	while reading continues, with at most ``workers`` chunks in flight. Input
+	shorter than one chunk never starts the pool and is scored in-process; with
+	a single worker the stateful in-process scorer runs block by block as before.
+	"""
+
+	def __init__(self, sr: int, workers: int = 0):
+		self.frame_samples = int(VAD_SAMPLE_RATE * 20 / 1000)
+		self.workers = workers if workers > 0 else available_cpu_count()
+		self._clips = _ClipCounter(sr)
+		self._resampler = PolyphaseResampler(sr, VAD_SAMPLE_RATE)
+		self._vads = [webrtcvad.Vad(level) for level in VAD_LEVELS] if self.workers <= 1 else None
+		self._pending = np.empty(0, dtype=np.float32)
+		self._rms: List[np.ndarray] = []
+		self._vad_raw: List[Optional[np.ndarray]] = []
+		self._chunk = None  # SharedMemory being filled
+		self._chunk_frames = 0
+		self._in_flight: List[Tuple[int, object, object]] = []  # (index into _vad_raw, future, SharedMemory)
+		self._pool = None
+
+	def push(self, block: np.ndarray) -> None:
+		self._clips.push(block)
+		self._add_samples(self._resampler.process(_ensure_mono(block)))
+
+	def _add_samples(self, samples: np.ndarray) -> None:
+		if self._pending.size:
+			samples = np.concatenate((self._pending, samples))
+		frames = _frame_audio(samples, self.frame_samples)
+		self._pending = samples[frames.size :].copy()
+		if len(frames) == 0:
+			return
+		self._rms.append(_frame_rms(frames))
+		if self._vads is not None:
+			pcm16 = np.empty(frames.size, dtype=np.int16)
+			_to_pcm16(frames, pcm16)
+			pcm = memoryview(pcm16).cast("B")
+			self._vad_raw.append(np.stack([_vad_decisions(pcm, self.frame_samples * 2, 0, len(frames), vad) for vad in self._vads]))
+			return
+
+		from multiprocessing import shared_memory
+
+		pos = 0
+		while pos < len(frames):
+			if self._chunk is None:
+				self._chunk = shared_memory.SharedMemory(create=True, size=VAD_MIN_CHUNK_FRAMES * self.frame_samples * 2)
+				self._chunk_frames = 0
+			take = min(len(frames) - pos, VAD_MIN_CHUNK_FRAMES - self._chunk_frames)
+			out = np.ndarray(take * self.frame_samples, dtype=np.int16, buffer=self._chunk.buf, offset=self._chunk_frames * self.frame_samples * 2)
+			_to_pcm16(frames[pos : pos + take], out)
+			del out  # release the export so the segment can be closed
+			self._chunk_frames += take
+			pos += take
+			if self._chunk_frames == VAD_MIN_CHUNK_FRAMES:
+				self._submit_chunk()
+
+	def _submit_chunk(self) -> None:
+		if self._pool is None:
+			from concurrent.futures import ProcessPoolExecutor
+			from multiprocessing import get_context
+
+			self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+		while len(self._in_flight) >= self.workers:
+			self._collect_oldest()
+		fut = self._pool.submit(_vad_chunk_worker, self._chunk.name, self.frame_samples * 2, 0, self._chunk_frames, VAD_LEVELS)
+		self._in_flight.append((len(self._vad_raw), fut, self._chunk))
+		self._vad_raw.append(None)
+		self._chunk = None
+
+	def _collect_oldest(self) -> None:
+		index, fut, shm = self._in_flight.pop(0)
+		self._vad_raw[index] = fut.result()
+		_release_shared(shm)
+
+	def finish(self) -> _FeatureSet:
+		try:
+			self._add_samples(self._resampler.flush())
+			if self._chunk is not None and self._chunk_frames:
+				if self._pool is None:
+					# Shorter than one chunk: not worth starting worker processes.
+					frame_bytes = self.frame_samples * 2
+					self._vad_raw.append(
+						np.stack([_vad_decisions(self._chunk.buf, frame_bytes, 0, self._chunk_frames, webrtcvad.Vad(level)) for level in VAD_LEVELS])
+					)
+				else:
+					self._submit_chunk()
+			while self._in_flight:
+				self._collect_oldest()
+		finally:
+			self.close()
+		if not self._rms:
+			empty = np.array([], dtype=np.float32)
+			return _FeatureSet.build(empty, empty, np.zeros((len(VAD_LEVELS), 0), dtype=np.float32), self._clips)
+		rms = np.concatenate(self._rms)
+		return _FeatureSet.build(20 * np.log10(rms + 1e-12), _sfx_from_rms(rms), np.concatenate(self._vad_raw, axis=1), self._clips)
+
+	def close(self) -> None:
+		"""Stop the pool (dropping queued chunks) and free every shared-memory chunk."""
+		if self._pool is not None:
+			self._pool.shutdown(wait=False, cancel_futures=True)
+			self._pool = None
+		for _, _, shm in self._in_flight:
+			_release_shared(shm)
+		self._in_flight = []
+		if self._chunk is not None:
+			_release_shared(self._chunk)
+			self._chunk = None
+
+
+def _release_shared(shm) -> None:
+	shm.close()
+	shm.unlink()
+
+
+def _stream_features(
+	reader: AudioSource,
+	send: Callable[[dict], None],
+	check_cancel: Callable[[str], None],
+	workers: int = 0,
+) -> _FeatureSet:
+	stream = _FeatureStream(reader.sample_rate, workers)
+	done = 0
+	try:
+		for block in reader.blocks():
+			check_cancel("features")
+			stream.push(block)
+			done += len(block)
+			send({"type": "progress", "stage": "segment", "value": 90.0 * done / max(1, len(reader))})
+	except BaseException:
+		stream.close()
+		raise
+	return stream.finish()
+
+
+def _feature_cache_params(window: Optional[Tuple[int, int]]) -> Dict:
+	"""Everything besides the audio that changes ``_FeatureSet`` contents."""
+	return {
+		"version": FEATURE_CACHE_VERSION,
+		"frameMs": 20,
+		"vadSampleRate": VAD_SAMPLE_RATE,
+		"vadLevels": list(VAD_LEVELS),
+		"resampler": f"polyphase-kaiser{KAISER_BETA:g}-zc{ZERO_CROSSINGS}",
+		"window": list(window) if window is not None else None,
+	}
 
 
 # ---------------- Keep mask & segments -----------------
@@ -272,7 +597,10 @@ def extract_features(audio: np.ndarray, sr: int, cfg: SanitiseConfig) -> FrameFe
 def _build_keep_mask(features: FrameFeatures, params: Dict[str, float], cfg: SanitiseConfig) -> np.ndarray:
 	if features.vad_prob.size == 0:
 		return np.array([], dtype=bool)
+	return _threshold_quality(_frame_quality(features, params, cfg), params)
+
 
+def _frame_quality(features: FrameFeatures, params: Dict[str, float], cfg: SanitiseConfig) -> np.ndarray:
 	vad = features.vad_prob
 	energy_above_noise = features.rms_db - features.noise_floor_db
 	energy_ok = np.clip((energy_above_noise - 6.0) / 12.0, 0.0, 1.0)
@@ -282,57 +610,86 @@ def _build_keep_mask(features: FrameFeatures, params: Dict[str, float], cfg: San
 	if cfg.mode == SanitiseMode.VOICE and features.speaker_sim is not None:
 		quality_frame += 0.35 * features.speaker_sim
 		quality_frame -= 0.20 * (1.0 - features.speaker_sim)
+	return quality_frame
+
 
+def _threshold_quality(quality_frame: np.ndarray, params: Dict[str, float]) -> np.ndarray:
 	frame_keep = params.get("frameKeep", 0.55)
 	start_keep = frame_keep + 0.05
 	stop_keep = frame_keep - 0.05
 
-	mask = np.zeros_like(quality_frame, dtype=bool)
-	active = False
-	hang_ms = params["hangoverMs"]
-	hang_frames = max(1, int(hang_ms / 20))
-	hang_count = 0
-	for i, q in enumerate(quality_frame):
-		if active:
-			if q >= stop_keep:
-				mask[i] = True
-				hang_count = 0
-			else:
-				hang_count += 1
-				if hang_count <= hang_frames:
-					mask[i] = True
-				else:
-					active = False
-		else:
-			if q >= start_keep:
-				active = True
-				mask[i] = True
-	return mask
+	hang_frames = max(1, int(params["hangoverMs"] / 20))
+	return _hysteresis_mask(quality_frame, start_keep, stop_keep, hang_frames)
+
+
+def _runs(flags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+	"""Start/end (exclusive) indices of the True runs in ``flags``."""
+	edges = np.diff(np.concatenate(([0], flags.astype(np.int8), [0])))
+	return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _hysteresis_mask(quality: np.ndarray, start_keep: float, stop_keep: float, hang_frames: int) -> np.ndarray:
+	"""Keep mask with start/stop thresholds and a hangover of ``hang_frames`` low frames.
+
+	A kept run opens on a frame >= ``start_keep`` and closes on the ``hang_frames + 1``-th
+	consecutive frame below ``stop_keep``. The hangover counter is only reset by a frame
+	>= ``stop_keep`` *after* the opening one, so once a run has closed, a start frame
+	directly followed by a low frame keeps just that one frame. Closing points depend
+	only on the low runs, so the mask is built from run boundaries instead of per frame.
+	"""
+	n = quality.size
+	is_start = quality >= start_keep
+	start_idx = np.flatnonzero(is_start)
+	if start_idx.size == 0:
+		return np.zeros(n, dtype=bool)
+	is_low = ~(quality >= stop_keep)
+	# Where a long enough low run ends an active region (only after the first opening).
+	low_starts, low_ends = _runs(is_low)
+	long_low = (low_ends - low_starts) > hang_frames
+	breaks = low_starts[long_low] + hang_frames
+	breaks = breaks[breaks > start_idx[0]]
+	# Start frames that close again immediately when the hangover counter is stale.
+	spikes = is_start.copy()
+	spikes[:-1] &= is_low[1:]
+	spikes[-1:] = False
+	# Between consecutive breaks, a region opens on the first start frame that holds.
+	bounds_lo = np.concatenate(([0], breaks))
+	bounds_hi = np.concatenate((breaks, [n]))
+	opens = np.full(bounds_lo.shape, n, dtype=np.int64)
+	opens[0] = start_idx[0]
+	candidates = np.flatnonzero(is_start & ~spikes)
+	pos = np.searchsorted(candidates, bounds_lo[1:], side="left")
+	found = pos < candidates.size
+	opens[1:][found] = candidates[pos[found]]
+	valid = opens < bounds_hi
+	delta = np.zeros(n + 1, dtype=np.int32)
+	np.add.at(delta, opens[valid], 1)
+	np.add.at(delta, bounds_hi[valid], -1)
+	return (np.cumsum(delta[:n]) > 0) | spikes
 
 
 def _mask_to_segments(mask: np.ndarray, params: Dict[str, float], total_frames: int) -> List[Tuple[int, int]]:
-	segments: List[Tuple[int, int]] = []
-	start = None
 	min_frames = max(1, int(params["minSegmentMs"] / 20))
 	min_silence_split = max(1, int(params["minSilenceMsToSplit"] / 20))
 
-	silence_run = 0
-	for idx, keep in enumerate(mask):
-		if keep:
-			if start is None:
-				start = idx
-			silence_run = 0
-		else:
-			if start is not None:
-				silence_run += 1
-				if silence_run >= min_silence_split:
-					end = idx - silence_run
-					if end - start >= min_frames:
-						segments.append((start, end))
-					start = None
-					silence_run = 0
-	if start is not None:
-		segments.append((start, total_frames))
+	keep_idx = np.flatnonzero(mask)
+	if keep_idx.size == 0:
+		return []
+	first = int(keep_idx[0])
+	# Silences long enough to split; a segment closes one frame before its silence starts.
+	gap_starts, gap_ends = _runs(~mask.astype(bool))
+	splits = ((gap_ends - gap_starts) >= min_silence_split) & (gap_starts > first)
+	gap_starts = gap_starts[splits]
+	gap_ends = gap_ends[splits]
+
+	starts = np.concatenate(([first], gap_ends[gap_ends < mask.size]))
+	closed_ends = gap_starts - 1
+	closed_starts = starts[: closed_ends.size]
+	long_enough = (closed_ends - closed_starts) >= min_frames
+	segments = [(int(s), int(e)) for s, e in zip(closed_starts[long_enough], closed_ends[long_enough])]
+	if starts.size > closed_ends.size:
+		# Still open at the end of the mask: runs to the last frame, no length check.
+		segments.append((int(starts[-1]), total_frames))
 	return segments
 
 
@@ -350,98 +707,171 @@ def _merge_segments(segments: List[Tuple[int, int]], params: Dict[str, float], p
 		return []
 	adaptive_gap = params["minSilenceMsToSplit"] if preserve_pauses else params["minSilenceMsToSplit"] * 0.6
 	gap_frames = max(1, int(adaptive_gap / 20))
-	merged: List[Tuple[int, int]] = []
-	cur_s, cur_e = segments[0]
-	for s, e in segments[1:]:
-		if s - cur_e <= gap_frames:
-			cur_e = e
-		else:
-			merged.append((cur_s, cur_e))
-			cur_s, cur_e = s, e
-	merged.append((cur_s, cur_e))
-	return merged
+	bounds = np.asarray(segments, dtype=np.int64)
+	# Each segment is compared with the end of the one before it.
+	split = np.flatnonzero(bounds[1:, 0] - bounds[:-1, 1] > gap_frames)
+	starts = bounds[np.concatenate(([0], split + 1)), 0]
+	ends = bounds[np.concatenate((split, [len(bounds) - 1])), 1]
+	return [(int(s), int(e)) for s, e in zip(starts, ends)]
 
 
 # ---------------- Segment scoring -----------------
 
 
-def _segment_quality(seg_audio: np.ndarray, features: FrameFeatures, frame_start: int, frame_end: int, params: Dict[str, float], cfg: SanitiseConfig) -> SegmentDiagnostics:
-	frames_count = max(1, frame_end - frame_start)
-	segment_frames = slice(frame_start, frame_end)
-
-	speech_ratio = float(np.mean(features.vad_prob[segment_frames])) if frames_count else 0.0
-	snr_db = float(np.mean(features.rms_db[segment_frames] - features.noise_floor_db)) if frames_count else -60.0
-	clip_ratio = float(np.mean(np.abs(seg_audio) >= 0.999)) if seg_audio.size else 0.0
-	sfx_score = float(np.mean(features.sfx_score[segment_frames])) if frames_count else 0.0
-	speaker_sim = float(np.mean(features.speaker_sim[segment_frames])) if cfg.mode == SanitiseMode.VOICE and features.speaker_sim is not None else 0.5
-
-	score = 0.0
-	score += 40.0 * speech_ratio
-	score += 25.0 * _clamp((snr_db - 6.0) / 12.0, 0.0, 1.0)
-	score += 15.0 * (1.0 - clip_ratio)
-	score += 10.0 * (1.0 - sfx_score)
-	if cfg.mode == SanitiseMode.VOICE:
-		score += 25.0 * speaker_sim
-
-	quality = int(_clamp(score, 0.0, 100.0))
-	labels: List[str] = []
-	if quality >= 80:
-		labels.append("excellent")
-	elif quality >= 60:
-		labels.append("good")
-	elif quality >= 40:
-		labels.append("borderline")
-	else:
-		labels.append("rejected")
-
-	reject_reason: List[str] = []
-	if quality < params["qualityMinScore"]:
-		reject_reason.append("low_quality")
-	if speech_ratio < 0.4:
-		reject_reason.append("low_speech_prob")
-	if sfx_score > 0.6:
-		reject_reason.append("high_sfx")
-	if clip_ratio > 0.02:
-		reject_reason.append("clipping")
-
-	start = frame_start * 0.02
-	end = frame_end * 0.02
-	kept = quality >= params["qualityMinScore"]
-
-	return SegmentDiagnostics(
-		start=start,
-		end=end,
-		quality=quality,
-		speech_ratio=speech_ratio,
-		snr_db=snr_db,
-		clip_ratio=clip_ratio,
-		sfx_score=sfx_score,
-		speaker_sim=speaker_sim,
-		kept=kept,
-		reject_reason=reject_reason,
-		labels=labels,
-	)
+def _prefix_sum(values: np.ndarray) -> np.ndarray:
+	return np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+
+
+class _SegmentStats:
+	"""Prefix sums of per-frame features (and clipped-sample counts), so scoring any segment costs O(1)."""
+
+	def __init__(self, features: FrameFeatures, feature_set: _FeatureSet):
+		self.noise_floor_db = features.noise_floor_db
+		self.vad = _prefix_sum(features.vad_prob)
+		self.rms_db = _prefix_sum(features.rms_db)
+		self.sfx = _prefix_sum(features.sfx_score)
+		self.speaker = _prefix_sum(features.speaker_sim) if features.speaker_sim is not None else None
+		self.clips = _prefix_sum(feature_set.clip_count)
+		self.sr = feature_set.sample_rate
+		self.channels = feature_set.channels
+		self.samples = feature_set.samples
+
+	def score(self, segments: Sequence[Tuple[int, int]], params: Dict[str, float], cfg: SanitiseConfig) -> Dict[str, np.ndarray]:
+		"""Per-segment speech ratio, SNR, SFX, clip ratio, quality and keep flag, as arrays."""
+		bounds = np.asarray(segments, dtype=np.int64).reshape(-1, 2)
+		s, e = bounds[:, 0], bounds[:, 1]
+		frames = np.maximum(1, e - s)
+		speech_ratio = (self.vad[e] - self.vad[s]) / frames
+		snr_db = (self.rms_db[e] - self.rms_db[s]) / frames - self.noise_floor_db
+		sfx_score = (self.sfx[e] - self.sfx[s]) / frames
+		if cfg.mode == SanitiseMode.VOICE and self.speaker is not None:
+			speaker_sim = (self.speaker[e] - self.speaker[s]) / frames
+		else:
+			speaker_sim = np.full(len(bounds), 0.5)
+		# Same sample range the segment covers in the source: int(frame * 0.02 * sr).
+		first = np.clip(_frame_sample_bounds(s, self.sr), 0, self.samples)
+		last = np.clip(_frame_sample_bounds(e, self.sr), first, self.samples)
+		total = (last - first) * self.channels
+		clip_ratio = np.divide(self.clips[e] - self.clips[s], total, out=np.zeros(len(bounds)), where=total > 0)
+
+		score = 40.0 * speech_ratio
+		score += 25.0 * np.clip((snr_db - 6.0) / 12.0, 0.0, 1.0)
+		score += 15.0 * (1.0 - clip_ratio)
+		score += 10.0 * (1.0 - sfx_score)
+		if cfg.mode == SanitiseMode.VOICE:
+			score += 25.0 * speaker_sim
+		quality = np.clip(score, 0.0, 100.0).astype(np.int64)
+		return {
+			"speech_ratio": speech_ratio,
+			"snr_db": snr_db,
+			"sfx_score": sfx_score,
+			"speaker_sim": speaker_sim,
+			"clip_ratio": clip_ratio,
+			"quality": quality,
+			"kept": quality >= params["qualityMinScore"],
+		}
+
+
+def _score_segments(stats: _SegmentStats, segments: Sequence[Tuple[int, int]], params: Dict[str, float], cfg: SanitiseConfig) -> List[SegmentDiagnostics]:
+	scores = stats.score(segments, params, cfg)
+	# Plain Python floats/ints/bools, as the manifest and API serialise them.
+	columns = {name: values.tolist() for name, values in scores.items()}
+	out: List[SegmentDiagnostics] = []
+	for idx, (frame_start, frame_end) in enumerate(segments):
+		quality = columns["quality"][idx]
+		speech_ratio = columns["speech_ratio"][idx]
+		sfx_score = columns["sfx_score"][idx]
+		clip_ratio = columns["clip_ratio"][idx]
+
+		labels: List[str] = []
+		if quality >= 80:
+			labels.append("excellent")
+		elif quality >= 60:
+			labels.append("good")
+		elif quality >= 40:
+			labels.append("borderline")
+		else:
+			labels.append("rejected")
+
+		reject_reason: List[str] = []
+		if quality < params["qualityMinScore"]:
+			reject_reason.append("low_quality")
+		if speech_ratio < 0.4:
+			reject_reason.append("low_speech_prob")
+		if sfx_score > 0.6:
+			reject_reason.append("high_sfx")
+		if clip_ratio > 0.02:
+			reject_reason.append("clipping")
+
+		out.append(
+			SegmentDiagnostics(
+				start=frame_start * 0.02,
+				end=frame_end * 0.02,
+				quality=quality,
+				speech_ratio=speech_ratio,
+				snr_db=columns["snr_db"][idx],
+				clip_ratio=clip_ratio,
+				sfx_score=sfx_score,
+				speaker_sim=columns["speaker_sim"][idx],
+				kept=columns["kept"][idx],
+				reject_reason=reject_reason,
+				labels=labels,
+			)
+		)
+	return out
 
 
 # ---------------- Rendering -----------------
 
 
-def _concat_kept(audio: np.ndarray, sr: int, segments: List[SegmentDiagnostics], cfg: SanitiseConfig) -> np.ndarray:
-	mono = _ensure_mono(audio)
-	pieces: List[np.ndarray] = []
+def _kept_ranges(segments: List[SegmentDiagnostics], sr: int, length: int) -> List[Tuple[int, int]]:
+	"""Non-empty ``[start, end)`` sample ranges of the kept segments, in output order."""
+	ranges = []
 	for seg in segments:
 		if not seg.kept:
 			continue
 		start_idx = max(0, int(seg.start * sr))
-		end_idx = min(len(mono), int(seg.end * sr))
-		chunk = mono[start_idx:end_idx].copy()
-		if chunk.size == 0:
-			continue
-		chunk = _apply_fade(chunk, sr, type("obj", (), {"fade_ms": cfg.fade_ms}))
-		pieces.append(chunk)
-	if not pieces:
-		return np.array([], dtype=np.float32)
-	return np.concatenate(pieces)
+		end_idx = min(length, int(seg.end * sr))
+		if end_idx > start_idx:
+			ranges.append((start_idx, end_idx))
+	return ranges
+
+
+def _fade_window(sr: int, cfg: SanitiseConfig) -> np.ndarray:
+	return np.linspace(0.0, 1.0, max(1, int(sr * cfg.fade_ms / 1000)), dtype=np.float32)
+
+
+def _render_kept(audio: np.ndarray, sr: int, segments: List[SegmentDiagnostics], cfg: SanitiseConfig) -> np.ndarray:
+	"""Kept segments, faded and loudness-normalised, in one preallocated mono buffer."""
+	ranges = _kept_ranges(segments, sr, len(audio))
+	out = np.empty(sum(end - start for start, end in ranges), dtype=np.float32)
+	window = _fade_window(sr, cfg)
+	fade = window.size
+	pos = 0
+	for start_idx, end_idx in ranges:
+		n = end_idx - start_idx
+		chunk = out[pos : pos + n]
+		if audio.ndim == 1:
+			chunk[:] = audio[start_idx:end_idx]
+		else:
+			np.mean(audio[start_idx:end_idx], axis=1, out=chunk)
+		if n >= fade * 2:
+			chunk[:fade] *= window
+			chunk[-fade:] *= window[::-1]
+		pos += n
+	if out.size == 0:
+		return out
+
+	sum_sq = 0.0
+	for block in range(0, out.size, 1 << 20):
+		part = out[block : block + (1 << 20)]
+		sum_sq += float(np.dot(part, part))
+	current = 20 * math.log10(math.sqrt(sum_sq / out.size + 1e-12) + 1e-12)  # proxy for LUFS
+	gain, peak_lin = _loudness_gain(current, cfg.target_lufs, cfg.true_peak_limit_db)
+	out *= gain
+	# True-peak limit (simple hard clip)
+	np.clip(out, -peak_lin, peak_lin, out=out)
+	return out
 
 
 def _measure_rms_db(audio: np.ndarray) -> float:
@@ -451,17 +881,84 @@ def _measure_rms_db(audio: np.ndarray) -> float:
 	return 20 * math.log10(rms + 1e-12)
 
 
-def _normalize_lufs_like(audio: np.ndarray, target_lufs: float, true_peak_db: float) -> np.ndarray:
-	if audio.size == 0:
-		return audio
-	current = _measure_rms_db(audio)  # proxy for LUFS
-	gain_db = target_lufs - current
-	gain = math.pow(10.0, gain_db / 20.0)
-	audio = audio * gain
-	# True-peak limit (simple hard clip)
-	peak_lin = math.pow(10.0, true_peak_db / 20.0)
-	audio = np.clip(audio, -peak_lin, peak_lin)
-	return audio.astype(np.float32)
+def _loudness_gain(current_db: float, target_lufs: float, true_peak_db: float) -> Tuple[float, float]:
+	"""Linear gain towards ``target_lufs`` and the linear true-peak ceiling."""
+	gain = math.pow(10.0, (target_lufs - current_db) / 20.0)
+	return gain, math.pow(10.0, true_peak_db / 20.0)
+
+
+def _write_clean_and_preview(chunks: Iterable[np.ndarray], sr: int, clean_path: Path, preview_path: Path) -> Tuple[int, int]:
+	"""Write rendered mono chunks to ``_clean.wav`` and the 24 kHz preview in the same pass.
+
+	Returns the clean and preview sample counts.
+	"""
+	preview = PolyphaseResampler(sr, PREVIEW_SAMPLE_RATE)
+	clean_samples = 0
+	preview_samples = 0
+	clean_path.parent.mkdir(parents=True, exist_ok=True)
+	with sf.SoundFile(str(clean_path), "w", sr, 1) as clean_file, sf.SoundFile(str(preview_path), "w", PREVIEW_SAMPLE_RATE, 1) as preview_file:
+		for chunk in chunks:
+			clean_file.write(chunk)
+			clean_samples += chunk.size
+			resampled = preview.process(chunk)
+			preview_file.write(resampled)
+			preview_samples += resampled.size
+		tail = preview.flush()
+		preview_file.write(tail)
+		preview_samples += tail.size
+	return clean_samples, preview_samples
+
+
+def _iter_kept_chunks(reader: AudioSource, start_idx: int, end_idx: int, window: np.ndarray) -> Iterator[np.ndarray]:
+	"""Mono, faded blocks of one kept range: ``_render_kept`` one block at a time."""
+	length = end_idx - start_idx
+	fade = window.size if length >= window.size * 2 else 0
+	offset = 0
+	for block in reader.blocks(start_idx, end_idx):
+		chunk = np.array(_ensure_mono(block), dtype=np.float32)
+		n = len(chunk)
+		if fade and offset < fade:
+			head = min(fade - offset, n)
+			chunk[:head] *= window[offset : offset + head]
+		if fade and offset + n > length - fade:
+			lo = max(length - fade, offset)
+			chunk[lo - offset :] *= window[::-1][lo - (length - fade) : fade - (length - offset - n)]
+		offset += n
+		yield chunk
+
+
+def _render_streaming(reader: AudioSource, segments: List[SegmentDiagnostics], cfg: SanitiseConfig, clean_path: Path, preview_path: Path, check_cancel: Callable[[str], None]) -> Tuple[int, int]:
+	"""Write ``_clean.wav`` and the preview block by block; returns the clean and preview sample counts.
+
+	Loudness normalisation needs the RMS of the whole result, so kept audio is read twice:
+	once to measure it and once to write it with the gain applied in place.
+	"""
+	sr = reader.sample_rate
+	window = _fade_window(sr, cfg)
+	ranges = _kept_ranges(segments, sr, len(reader))
+	sum_sq = 0.0
+	total = 0
+	for start_idx, end_idx in ranges:
+		for chunk in _iter_kept_chunks(reader, start_idx, end_idx, window):
+			sum_sq += float(np.dot(chunk, chunk))
+			total += chunk.size
+	if total == 0:
+		raise ValueError("No speech retained after sanitization")
+	check_cancel("render")
+
+	current = 20 * math.log10(math.sqrt(sum_sq / total + 1e-12) + 1e-12)
+	gain, peak_lin = _loudness_gain(current, cfg.target_lufs, cfg.true_peak_limit_db)
+
+	def gained() -> Iterator[np.ndarray]:
+		for idx, (start_idx, end_idx) in enumerate(ranges):
+			if idx % 50 == 0:
+				check_cancel("render")
+			for chunk in _iter_kept_chunks(reader, start_idx, end_idx, window):
+				chunk *= gain
+				np.clip(chunk, -peak_lin, peak_lin, out=chunk)
+				yield chunk
+
+	return _write_clean_and_preview(gained(), sr, clean_path, preview_path)
 
 
 # ---------------- Manifest -----------------
@@ -477,6 +974,7 @@ def _write_manifest(path: Path, sr: int, source: Path, cfg: SanitiseConfig, para
 			"preset": cfg.preset.value,
 			"strictness": cfg.strictness,
 			"mode": cfg.mode.value,
+			"preview": cfg.preview,
 		},
 		"segments": [
 			{
@@ -498,6 +996,8 @@ def _write_manifest(path: Path, sr: int, source: Path, cfg: SanitiseConfig, para
 	}
 	path.parent.mkdir(parents=True, exist_ok=True)
 	path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+	# Columnar sidecar with clean-timeline offsets, so the review API can page without re-parsing.
+	write_segment_columns(path, payload["segments"], sr)
 
 
 # ---------------- Voice samples selection -----------------
@@ -537,12 +1037,14 @@ def _select_voice_samples(audio: np.ndarray, sr: int, segments: List[SegmentDiag
 
 def _extract_vocals_uvr(
 	input_path: Path,
-	output_dir: Path,
+	final_path: Path,
 	log: List[str],
 	event_cb: Optional[Callable[[dict], None]] = None,
 	should_cancel: Optional[Callable[[], bool]] = None,
 ) -> Path:
-	"""Extract vocals using audio-separator (UVR models) with detailed progress logging and callbacks."""
+	"""Vocal stem of ``input_path`` at ``final_path``: from the stem cache, else via the UVR worker."""
+	from streamcraft.core.uvr import check_dependencies, get_uvr_worker, get_vocal_cache, place_file
+	from streamcraft.settings import get_settings
 
 	def send(evt: dict) -> None:
 		if event_cb:
@@ -555,186 +1057,143 @@ def _extract_vocals_uvr(
 		log.append(line)
 		send({"type": "log", "line": line})
 
-	def is_cancelled() -> bool:
-		return bool(should_cancel and should_cancel())
-
 	emit("[UVR] Starting vocal extraction (Ultimate Vocal Remover AI)...")
 	emit(f"[UVR] Input: {input_path}")
-	emit(f"[UVR] Output dir (will be created): {output_dir}")
 	send({"type": "stage", "stage": "uvr", "message": "starting"})
 
-	if is_cancelled():
+	if should_cancel and should_cancel():
 		raise RuntimeError("Sanitize canceled by user")
 
-	# Keep UVR temp outputs in a dedicated subdir to avoid clobbering VOD assets
-	uvr_out_dir = output_dir / "vocals"
-	uvr_out_dir.mkdir(parents=True, exist_ok=True)
-	emit(f"[UVR] Existing files before run: {list(uvr_out_dir.glob('*'))}")
-
-	# Check if audio-separator is available
-	try:
-		result = subprocess.run(
-			[sys.executable, "-m", "pip", "show", "audio-separator"],
-			capture_output=True,
-			text=True,
-			timeout=10,
-		)
-		if result.returncode != 0:
-			emit("[UVR] ⚠️ audio-separator not installed. Installing...")
-			result = subprocess.run(
-				[sys.executable, "-m", "pip", "install", "audio-separator[cpu]"],
-				capture_output=True,
-				text=True,
-				timeout=300,
-			)
-			if result.returncode == 0:
-				emit("[UVR] ✓ audio-separator installed successfully")
-			else:
-				emit(f"[UVR] ❌ Installation failed: {result.stderr}")
-				raise RuntimeError("Failed to install audio-separator")
+	settings = get_settings()
+	model = settings.uvr_model
+	# Sparse stems are silent outside speech, so they are cached apart from full-length ones.
+	sparse = (
+		{"sparse": {"chunk": settings.separation_chunk_sec, "overlap": settings.separation_overlap_sec, "pad": settings.separation_pad_sec}}
+		if settings.separation_skip_silence
+		else None
+	)
+	cache = get_vocal_cache()
+	key = cache.make_key(get_feature_cache().audio_fingerprint(input_path), model, sparse)
+	cached = cache.lookup(key)
+	if cached is not None:
+		place_file(cached, final_path, keep_source=True)
+		emit(f"[UVR] ✓ Cache hit for this audio ({model}) -> {final_path.name}")
+		send({"type": "progress", "stage": "uvr", "value": 100.0, "message": "uvr-cached"})
+		send({"type": "stage", "stage": "uvr", "message": "complete"})
+		return final_path
+
+	# Resolved once at API startup; installing packages is not done on the request path.
+	if not check_dependencies():
+		raise RuntimeError("audio-separator is not installed (pip install 'audio-separator[cpu]' or '[gpu]')")
+
+	worker = get_uvr_worker()
+	emit(f"[UVR] Using {model} on {'CUDA (GPU)' if worker.use_cuda else 'CPU'}" + ("" if worker.running else " (loading model)"))
+	send({"type": "stage", "stage": "uvr", "message": "separating"})
+
+	# Track state: only report progress during actual separation, not model download
+	processing_started = False
+	# Sparse runs separate many chunks; each chunk's 0-100% maps onto its share of the total.
+	progress_span = (0.0, 1.0)
+
+	def on_line(line: str) -> None:
+		nonlocal processing_started
+		line = line.strip()
+		if not line:
+			return
+
+		# Detect when actual audio processing starts (after model load)
+		if "Processing file:" in line or "Starting separation" in line:
+			processing_started = True
+			send({"type": "progress", "stage": "uvr", "value": 100.0 * progress_span[0], "message": "starting-separation"})
+
+		# Only parse progress percentages during actual separation
+		if processing_started:
+			percent_match = re.search(r"(\d{1,3}(?:\.\d+)?)%", line)
+			if percent_match:
+				pct = max(0.0, min(100.0, float(percent_match.group(1))))
+				pct = 100.0 * progress_span[0] + pct * progress_span[1]
+				send({"type": "progress", "stage": "uvr", "value": pct, "message": line})
+				return  # progress-bar redraws go to the progress channel, not the log
+
+		# Log progress from audio-separator
+		if "Downloading" in line or "Loading model" in line:
+			emit(f"[UVR] 📥 {line}")
+		elif "Processing" in line or "Separating" in line:
+			emit(f"[UVR] 🎵 {line}")
+		elif "Writing" in line or "Saved" in line:
+			emit(f"[UVR] 💾 {line}")
+		elif "error" in line.lower() or "fail" in line.lower():
+			emit(f"[UVR] ❌ {line}")
 		else:
-			emit("[UVR] ✓ audio-separator is installed")
-	except Exception as e:
-		emit(f"[UVR] ❌ Error checking audio-separator: {e}")
-		raise
+			emit(f"[UVR] {line}")
 
-	# Check CUDA availability for GPU acceleration
-	use_cuda = _has_cuda()
-	device_name = "CUDA (GPU)" if use_cuda else "CPU"
-	emit(f"[UVR] Using BS-Roformer model on {device_name}...")
-	if use_cuda:
-		emit("[UVR] GPU acceleration enabled - processing will be much faster")
-	else:
-		emit("[UVR] GPU not available - using CPU (slower)")
-	emit("[UVR] This may take 2-5 minutes depending on audio length...")
+	def on_progress(done: float, share: float) -> None:
+		nonlocal progress_span
+		progress_span = (done, share)
+		send({"type": "progress", "stage": "uvr", "value": 100.0 * done, "message": "separating-speech"})
 
 	try:
-		# Use audio-separator CLI directly (installed as exe/script in venv)
-		# Find the audio-separator executable in the same Scripts dir as python
-		venv_scripts_dir = Path(sys.executable).parent
-		audio_sep_exe = venv_scripts_dir / "audio-separator.exe"
-		if not audio_sep_exe.exists():
-			audio_sep_exe = venv_scripts_dir / "audio-separator"  # Unix/Linux
-		
-		if not audio_sep_exe.exists():
-			raise FileNotFoundError(f"audio-separator executable not found in {venv_scripts_dir}")
-		
-		cmd = [
-			str(audio_sep_exe),
-			"--model_filename",
-			"model_bs_roformer_ep_317_sdr_12.9755.ckpt",
-			"--output_dir",
-			str(uvr_out_dir),
-			"--output_format",
-			"WAV",
-			"--single_stem",
-			"Vocals",
-		]
-		
-		# Use autocast on GPU for speed (audio-separator auto-detects CUDA)
-		if use_cuda:
-			cmd.append("--use_autocast")
-
-		cmd.append(str(input_path))
-
-		emit(f"[UVR] Executing: {' '.join(cmd[:6])} ... (truncated)")
-		send({"type": "stage", "stage": "uvr", "message": "separating"})
-
-		process = subprocess.Popen(
-			cmd,
-			stdout=subprocess.PIPE,
-			stderr=subprocess.STDOUT,
-			text=True,
-			bufsize=1,
-		)
-
-		# Track state: only report progress during actual separation, not model download
-		processing_started = False
-
-		for line in process.stdout:
-			if is_cancelled():
-				emit("[UVR] Cancel requested. Terminating process...")
-				process.terminate()
-				try:
-					process.wait(timeout=10)
-				except Exception:
-					process.kill()
-				raise RuntimeError("Sanitize canceled by user")
-			line = line.strip()
-			if not line:
-				continue
-
-			# Detect when actual audio processing starts (after model load)
-			if "Processing file:" in line or "Starting separation" in line:
-				processing_started = True
-				send({"type": "progress", "stage": "uvr", "value": 0.0, "message": "starting-separation"})
-
-			# Only parse progress percentages during actual separation
-			if processing_started:
-				percent_match = re.search(r"(\d{1,3}(?:\.\d+)?)%", line)
-				if percent_match:
-					try:
-						pct = float(percent_match.group(1))
-						pct = max(0.0, min(100.0, pct))
-						send({"type": "progress", "stage": "uvr", "value": pct, "message": line})
-					except Exception:
-						pass
-
-			# Log progress from audio-separator
-			if "Downloading" in line or "Loading model" in line:
-				emit(f"[UVR] 📥 {line}")
-			elif "Processing" in line or "Separating" in line:
-				emit(f"[UVR] 🎵 {line}")
-			elif "%" in line or "progress" in line.lower():
-				emit(f"[UVR] ⏳ {line}")
-			elif "Writing" in line or "Saved" in line:
-				emit(f"[UVR] 💾 {line}")
-			elif "error" in line.lower() or "fail" in line.lower():
-				emit(f"[UVR] ❌ {line}")
-			else:
-				emit(f"[UVR] {line}")
-
-		process.wait()
-		if is_cancelled():
-			raise RuntimeError("Sanitize canceled by user")
-
-		if process.returncode != 0:
-			emit(f"[UVR] ❌ Separation failed with exit code {process.returncode}")
-			raise RuntimeError(f"audio-separator failed: exit code {process.returncode}")
-
-		# Find the output vocals file
-		vocals_pattern = f"{input_path.stem}*Vocals*.wav"
-		vocals_files = list(uvr_out_dir.glob(vocals_pattern))
-
-		if not vocals_files:
-			emit(f"[UVR] ❌ No vocals file found matching: {vocals_pattern}")
-			all_wavs = list(uvr_out_dir.glob('*.wav'))
-			emit(f"[UVR] WAVs present: {all_wavs}")
-			if all_wavs:
-				fallback = max(all_wavs, key=lambda p: p.stat().st_mtime)
-				emit(f"[UVR] ⚠️ Using fallback WAV: {fallback.name}")
-				vocals_path = fallback
-			else:
-				raise FileNotFoundError("Vocals stem not found after separation")
+		if sparse:
+			from streamcraft.core.sparse_separation import separate_speech_regions
+
+			emit("[UVR] Pre-pass: locating speech so silence and gameplay are not separated")
+			result = separate_speech_regions(
+				input_path,
+				cache.staging_dir() / f"{key}.sparse.wav",
+				lambda paths: [worker.separate(path, on_line, should_cancel) for path in paths],
+				chunk_sec=settings.separation_chunk_sec,
+				overlap_sec=settings.separation_overlap_sec,
+				pad_sec=settings.separation_pad_sec,
+				on_progress=on_progress,
+				log=emit,
+				should_cancel=should_cancel,
+			)
+			stem = result.output_path
+			emit(f"[UVR] Separated {result.separated_sec:.1f}s of {result.duration_sec:.1f}s ({100.0 * result.speech_share:.0f}%)")
 		else:
-			vocals_path = vocals_files[0]
-		emit(f"[UVR] ✓ Vocals extracted successfully: {vocals_path.name}")
-
-		# Check file size
-		size_mb = vocals_path.stat().st_size / (1024 * 1024)
-		emit(f"[UVR] ✓ Vocals file size: {size_mb:.2f} MB")
-		send({"type": "progress", "stage": "uvr", "value": 100.0, "message": "uvr-complete"})
-		send({"type": "stage", "stage": "uvr", "message": "complete"})
-
-		return vocals_path
-
-	except subprocess.TimeoutExpired:
-		emit("[UVR] ❌ Process timed out")
-		raise
+			stem = worker.separate(input_path, on_line, should_cancel)
+		cached = cache.store(key, stem)
+		place_file(cached, final_path, keep_source=True)
 	except Exception as e:
 		emit(f"[UVR] ❌ Extraction failed: {e}")
 		raise
 
+	size_mb = final_path.stat().st_size / (1024 * 1024)
+	emit(f"[UVR] ✓ Vocals extracted successfully: {final_path.name} ({size_mb:.2f} MB, cached)")
+	send({"type": "progress", "stage": "uvr", "value": 100.0, "message": "uvr-complete"})
+	send({"type": "stage", "stage": "uvr", "message": "complete"})
+	return final_path
+
+
+def _load_feature_set(
+	input_audio: Path,
+	window: Optional[Tuple[int, int]],
+	cfg: SanitiseConfig,
+	extract: Callable[[], _FeatureSet],
+	emit: Callable[[str], None],
+) -> _FeatureSet:
+	"""Feature-cache lookup for ``input_audio`` (or its ``window``), extracting and storing on a miss."""
+	if not cfg.feature_cache:
+		return extract()
+	# Features depend only on the audio, so re-tuning preset/strictness/pauses/SFX skips extraction.
+	cache = get_feature_cache()
+	cache_key = cache.make_key(cache.audio_fingerprint(input_audio), _feature_cache_params(window))
+	cached = cache.load(cache_key)
+	if cached is not None:
+		try:
+			feature_set = _FeatureSet.from_arrays(cached)
+			emit(f"[features] cache hit ({feature_set.frames} frames)")
+			return feature_set
+		except (KeyError, ValueError):
+			pass
+	feature_set = extract()
+	try:
+		cache.store(cache_key, feature_set.to_arrays())
+		emit(f"[features] cached {feature_set.frames} frames")
+	except OSError as e:
+		emit(f"[features] cache write failed: {e}")
+	return feature_set
+
 
 def run_sanitise_v2(
     vod_url: str,
@@ -782,22 +1241,17 @@ def run_sanitise_v2(
 		emit("=" * 60)
 		emit("🎵 VOCAL EXTRACTION MODE ENABLED (UVR AI)")
 		emit("=" * 60)
-		vocals_dir = vod_dir  # store alongside VOD assets
-		emit(f"[UVR] target dir: {vocals_dir}")
+		final_vocals_path = vod_dir / f"{vod_slug}_vocals.wav"  # store alongside VOD assets
+		emit(f"[UVR] target: {final_vocals_path}")
 		try:
 			check_cancel("uvr")
-			vocals_path = _extract_vocals_uvr(
+			input_audio = _extract_vocals_uvr(
 				input_audio,
-				vocals_dir,
+				final_vocals_path,
 				log,
 				event_cb,
 				should_cancel=should_cancel,
-			)
-			final_vocals_path = vocals_dir / f"{vod_slug}_vocals.wav"
-			if vocals_path != final_vocals_path:
-				final_vocals_path.write_bytes(vocals_path.read_bytes())
-				emit(f"[UVR] renamed vocals -> {final_vocals_path.name}")
-			input_audio = final_vocals_path  # Use extracted vocals for sanitization
+			)  # Use extracted vocals for sanitization
 			emit("=" * 60)
 			emit("✓ Vocal extraction complete - proceeding with sanitization...")
 			emit("=" * 60)
@@ -807,23 +1261,47 @@ def run_sanitise_v2(
 			# Continue with original audio on failure
 
 	send({"type": "stage", "stage": "segment", "message": "loading"})
-	emit(f"Loading audio {input_audio}")
-	audio, sr = _load_audio(input_audio)
-	emit(f"Loaded waveform sr={sr} hz, duration={len(audio)/sr:.2f}s")
-	emit(f"[stats] rms_estimate={float(np.mean(np.abs(audio))):.4f}")
-	check_cancel("load-audio")
-
-	if cfg.preview:
+	streaming = cfg.block_sec > 0 and not cfg.preview
+	source = AudioSource(input_audio, cfg.block_sec if streaming else DEFAULT_BLOCK_SEC)
+	sr = source.sample_rate
+	window: Optional[Tuple[int, int]] = None
+	if streaming:
+		# Multi-hour inputs: read in blocks, never holding the waveform in memory.
+		audio = source
+		emit(f"Streaming audio {input_audio} in {cfg.block_sec:g}s blocks")
+		emit(f"Waveform sr={sr} hz, duration={len(audio)/sr:.2f}s")
+	elif cfg.preview:
+		# Only the preview window is read from the file.
 		start = max(0.0, cfg.preview_start)
-		end = min(len(audio) / sr, start + cfg.preview_duration)
-		start_idx = int(start * sr)
-		end_idx = int(end * sr)
+		end = min(source.duration, start + cfg.preview_duration)
+		emit(f"Loading audio {input_audio}")
 		emit(f"Preview window: {start:.2f}s-{end:.2f}s")
-		audio = audio[start_idx:end_idx]
+		window = (int(start * sr), int(end * sr))
+		audio = source.samples(*window)
+		source.close()
+		emit(f"Loaded waveform sr={sr} hz, duration={len(audio)/sr:.2f}s")
+	else:
+		emit(f"Loading audio {input_audio}")
+		audio = source.samples()
+		source.close()
+		emit(f"Loaded waveform sr={sr} hz, duration={len(audio)/sr:.2f}s")
+		emit(f"[stats] rms_estimate={float(np.mean(np.abs(audio))):.4f}")
+	check_cancel("load-audio")
 
 	params = _apply_strictness(_preset_baseline(cfg.preset), cfg.strictness)
 
-	features = extract_features(audio, sr, cfg)
+	if streaming:
+		extract = lambda: _stream_features(audio, send, check_cancel, cfg.vad_workers)
+	else:
+		extract = lambda: _extract_feature_set(audio, sr, cfg.vad_workers)
+	feature_set = _load_feature_set(input_audio, window, cfg, extract, emit)
+	check_cancel("features")
+	features = feature_set.frame_features(cfg)
+	if not cfg.preview:
+		# Share the VAD pass with transcription so it can decode speech spans only
+		speech_path = vod_dir / f"{vod_slug}{SPEECH_REGIONS_SUFFIX}"
+		write_speech_regions(speech_path, input_audio, regions_from_vad(features.vad_prob, 0.02), 0.02)
+		emit(f"[write] speech regions -> {speech_path}")
 	mask = _build_keep_mask(features, params, cfg)
 	segments_idx = _mask_to_segments(mask, params, total_frames=len(features.vad_prob))
 	segments_idx = _apply_preroll_postroll(segments_idx, params, len(features.vad_prob))
@@ -831,36 +1309,28 @@ def run_sanitise_v2(
 	emit(f"[segments] candidate_count={len(segments_idx)}")
 	check_cancel("segment-build")
 
-	segments: List[SegmentDiagnostics] = []
-	for idx, (s, e) in enumerate(segments_idx):
-		if idx % 50 == 0:
-			check_cancel("segment-score")
-		start_t = s * 0.02
-		end_t = e * 0.02
-		seg_audio = audio[int(start_t * sr) : int(end_t * sr)]
-		segments.append(_segment_quality(seg_audio, features, s, e, params, cfg))
+	# One vectorised pass over every candidate; clip ratios come from per-frame counts, not the audio.
+	segments = _score_segments(_SegmentStats(features, feature_set), segments_idx, params, cfg)
+	check_cancel("segment-score")
+	if streaming:
+		for idx, seg in enumerate(segments):
+			send({"type": "segment", "index": idx, "start": seg.start, "end": seg.end, "kept": seg.kept, "quality": seg.quality})
 
 	kept = sum(1 for s in segments if s.kept)
 	emit(f"Detected {len(segments)} segments; kept {kept}")
 	send({"type": "progress", "stage": "segment", "value": 100.0})
 
-	clean_audio = _concat_kept(audio, sr, segments, cfg)
-	clean_audio = _normalize_lufs_like(clean_audio, cfg.target_lufs, cfg.true_peak_limit_db)
-	check_cancel("render")
-
-	if clean_audio.size == 0:
-		raise ValueError("No speech retained after sanitization")
-
-	clean_path.parent.mkdir(parents=True, exist_ok=True)
-	sf.write(str(clean_path), clean_audio, sr)
-	emit(f"[write] clean audio -> {clean_path} (sr={sr}, duration={len(clean_audio)/sr:.2f}s)")
-	check_cancel("write-clean")
-
-	preview_audio = _resample_linear(clean_audio, sr, PREVIEW_SAMPLE_RATE)
-	sf.write(str(preview_path), preview_audio, PREVIEW_SAMPLE_RATE)
-	emit(
-		f"[write] preview -> {preview_path} (sr={PREVIEW_SAMPLE_RATE}, duration={len(preview_audio)/PREVIEW_SAMPLE_RATE:.2f}s)"
-	)
+	if streaming:
+		clean_samples, preview_samples = _render_streaming(audio, segments, cfg, clean_path, preview_path, check_cancel)
+	else:
+		clean_audio = _render_kept(audio, sr, segments, cfg)
+		check_cancel("render")
+		if clean_audio.size == 0:
+			raise ValueError("No speech retained after sanitization")
+		blocks = (clean_audio[pos : pos + source.block_frames] for pos in range(0, clean_audio.size, source.block_frames))
+		clean_samples, preview_samples = _write_clean_and_preview(blocks, sr, clean_path, preview_path)
+	emit(f"[write] clean audio -> {clean_path} (sr={sr}, duration={clean_samples/sr:.2f}s)")
+	emit(f"[write] preview -> {preview_path} (sr={PREVIEW_SAMPLE_RATE}, duration={preview_samples/PREVIEW_SAMPLE_RATE:.2f}s)")
 	send({"type": "progress", "stage": "preview", "value": 100.0})
 	check_cancel("write-preview")
 
@@ -890,3 +1360,121 @@ def run_sanitise_v2(
 		voice_samples=voice_samples,
 		log=log,
 	)
+
+
+# ---------------- Parameter sweep -----------------
+
+
+SWEEP_HISTOGRAM_BINS = 10  # quality histogram over 0..100 in 10-point bins
+
+
+@dataclass
+class SweepPoint:
+	preset: SanitisePreset
+	strictness: float
+	frame_keep: float
+	params: Dict[str, float]
+	segments: int
+	kept: int
+	kept_duration: float
+	quality_histogram: List[int]
+
+
+@dataclass
+class SweepResult:
+	points: List[SweepPoint]
+	frames: int
+	log: List[str]
+
+
+def sweep_features(
+	feature_set: _FeatureSet,
+	grid: Sequence[Tuple[SanitisePreset, float, Optional[float]]],
+	cfg: SanitiseConfig,
+) -> List[SweepPoint]:
+	"""Evaluate (preset, strictness, frameKeep) settings on one feature set, without rendering.
+
+	A ``frameKeep`` of None keeps the value the preset and strictness give. Settings
+	sharing a VAD level and SFX penalty share one frame-quality curve, and segments are
+	scored from prefix sums, so each setting costs one mask pass plus O(segments).
+	"""
+	total = feature_set.frames
+	stats: Dict[int, Tuple[FrameFeatures, _SegmentStats]] = {}
+	curves: Dict[Tuple[int, float], np.ndarray] = {}
+	points: List[SweepPoint] = []
+	for preset, strictness, frame_keep in grid:
+		point_cfg = replace(cfg, preset=preset, strictness=strictness)
+		params = _apply_strictness(_preset_baseline(preset), strictness)
+		if frame_keep is not None:
+			params["frameKeep"] = float(frame_keep)
+
+		level = _vad_aggressiveness(point_cfg)
+		if level not in stats:
+			features = feature_set.frame_features(point_cfg)
+			stats[level] = (features, _SegmentStats(features, feature_set))
+		features, segment_stats = stats[level]
+		curve_key = (level, params["sfxPenaltyStrength"])
+		if curve_key not in curves:
+			curves[curve_key] = _frame_quality(features, params, point_cfg)
+
+		mask = _threshold_quality(curves[curve_key], params) if total else np.array([], dtype=bool)
+		segments_idx = _mask_to_segments(mask, params, total_frames=total)
+		segments_idx = _apply_preroll_postroll(segments_idx, params, total)
+		segments_idx = _merge_segments(segments_idx, params, cfg.preserve_pauses)
+
+		scores = segment_stats.score(segments_idx, params, point_cfg)
+		bounds = np.asarray(segments_idx, dtype=np.int64).reshape(-1, 2)
+		durations = bounds[:, 1] * 0.02 - bounds[:, 0] * 0.02
+		bins = np.minimum(scores["quality"] * SWEEP_HISTOGRAM_BINS // 100, SWEEP_HISTOGRAM_BINS - 1)
+		points.append(
+			SweepPoint(
+				preset=preset,
+				strictness=float(strictness),
+				frame_keep=float(params["frameKeep"]),
+				params=params,
+				segments=len(segments_idx),
+				kept=int(np.count_nonzero(scores["kept"])),
+				kept_duration=float(durations[scores["kept"]].sum()),
+				quality_histogram=np.bincount(bins, minlength=SWEEP_HISTOGRAM_BINS).tolist(),
+			)
+		)
+	return points
+
+
+def run_sanitise_sweep(
+	vod_url: str,
+	out_root: Path,
+	dataset_root: Path,
+	cfg: SanitiseConfig,
+	grid: Sequence[Tuple[SanitisePreset, float, Optional[float]]],
+) -> SweepResult:
+	"""Score a grid of settings on the (cached) frame features of a VOD's sanitize input.
+
+	Uses the same input as ``run_sanitise_v2``: the extracted vocals when
+	``cfg.extract_vocals`` and they exist, the preview window when ``cfg.preview``.
+	"""
+	log: List[str] = []
+	_, vod_dir, _ = resolve_output_dirs(vod_url, out_root, dataset_root)
+	vod_slug = vod_dir.name
+	input_audio = vod_dir / f"{vod_slug}_full.wav"
+	vocals_path = vod_dir / f"{vod_slug}_vocals.wav"
+	if cfg.extract_vocals and vocals_path.exists():
+		input_audio = vocals_path
+	if not input_audio.exists():
+		raise FileNotFoundError(f"Missing input audio: {input_audio}")
+
+	source = AudioSource(input_audio, cfg.block_sec or DEFAULT_BLOCK_SEC)
+	with source:
+		window: Optional[Tuple[int, int]] = None
+		if cfg.preview:
+			start = max(0.0, cfg.preview_start)
+			end = min(source.duration, start + cfg.preview_duration)
+			window = (source.index(start), source.index(end))
+			extract = lambda: _extract_feature_set(source.samples(*window), source.sample_rate, cfg.vad_workers)
+		else:
+			extract = lambda: _stream_features(source, lambda evt: None, lambda stage: None, cfg.vad_workers)
+		feature_set = _load_feature_set(input_audio, window, cfg, extract, log.append)
+
+	points = sweep_features(feature_set, grid, cfg)
+	log.append(f"[sweep] {len(points)} setting(s) over {feature_set.frames} frames")
+	return SweepResult(points=points, frames=feature_set.frames, log=log)
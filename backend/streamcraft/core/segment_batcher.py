@@ -0,0 +1,271 @@
+"""Queue-backed, micro-batched transcription of short audio segments.
+
+Review UIs request word timings for many manifest segments in quick
+succession. Instead of one model call per HTTP request, requests are queued
+and a single background worker drains up to ``batch_size`` of them at a time
+(waiting at most ``max_wait`` for stragglers). Each segment's speech is found
+with VAD and its language detected on its own; segments that share a language
+are concatenated and decoded in one ``BatchedInferencePipeline`` call with
+``clip_timestamps`` so every speech clip is one batch row. Results are
+delivered per segment as soon as the pipeline moves past it; async callers
+receive them through an ``asyncio.Queue`` and never block the event loop.
+"""
+
+import asyncio
+import bisect
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, ContextManager, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from streamcraft.core.transcribe import (
+    WHISPER_SAMPLE_RATE,
+    cpu_worker_layout,
+    detect_device,
+    log_warn,
+    read_audio_16k,
+)
+
+MAX_CLIP_SEC = 30.0  # Whisper window; longer speech is split into several batch rows
+CLIP_GAP_SEC = 0.5
+SPEECH_MERGE_GAP_SEC = 2.0  # VAD spans closer than this share a batch row
+
+
+@dataclass
+class SegmentJob:
+    """One segment to transcribe; results are pushed to ``sink`` on ``loop``."""
+    key: object
+    audio_path: Path
+    start: float
+    end: float
+    loop: asyncio.AbstractEventLoop
+    sink: "asyncio.Queue[Dict]"
+    finished: bool = False
+
+    def emit(self, item: Dict) -> None:
+        if item.get("type") in ("segmentDone", "error"):
+            self.finished = True
+        self.loop.call_soon_threadsafe(self.sink.put_nowait, item)
+
+
+class SegmentBatcher:
+    """Single background worker that transcribes queued segments in micro-batches."""
+
+    def __init__(self, model_size: str, batch_size: int = 8, max_wait: float = 0.05):
+        self.model_size = model_size
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[SegmentJob]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, job: SegmentJob) -> None:
+        self._ensure_worker()
+        self._queue.put(job)
+
+    async def stream(self, requests: List[Tuple[object, Path, float, float]]) -> AsyncIterator[Dict]:
+        """Queue ``(key, audio_path, start, end)`` requests and yield result events as they finish.
+
+        Each segment yields ``metadata``, ``word``/``segment`` events and ``segmentDone`` (or
+        ``error``); events of different segments are never interleaved.
+        """
+        loop = asyncio.get_running_loop()
+        sink: "asyncio.Queue[Dict]" = asyncio.Queue()
+        for key, audio_path, start, end in requests:
+            self.submit(SegmentJob(key=key, audio_path=audio_path, start=start, end=end, loop=loop, sink=sink))
+        remaining = len(requests)
+        while remaining:
+            item = await sink.get()
+            if item.get("type") in ("segmentDone", "error"):
+                remaining -= 1
+            yield item
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="segment-batcher", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self) -> List[SegmentJob]:
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get(timeout=self.max_wait))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._transcribe_batch(batch)
+            except Exception as exc:
+                log_warn(f"Segment batch failed: {exc}")
+                for job in batch:
+                    if not job.finished:
+                        job.emit({"type": "error", "segmentIndex": job.key, "message": str(exc)})
+
+    def _transcribe_batch(self, batch: List[SegmentJob]) -> None:
+        prepared: List[Tuple[SegmentJob, np.ndarray, List[Tuple[int, int]]]] = []
+        for job in batch:
+            try:
+                samples = read_audio_16k(job.audio_path, job.start, job.end)
+            except Exception as exc:
+                job.emit({"type": "error", "segmentIndex": job.key, "message": str(exc)})
+                continue
+            spans = self._speech_spans(samples)
+            if not spans:
+                job.emit({"type": "metadata", "segmentIndex": job.key, "language": None, "duration": job.end - job.start})
+                job.emit({"type": "segmentDone", "segmentIndex": job.key})
+                continue
+            prepared.append((job, samples, spans))
+        if not prepared:
+            return
+
+        with self._lease_model() as model:
+            # Queued segments can come from different VODs; a batched decode detects
+            # the language once for all rows, so detect per segment and decode each
+            # language group on its own.
+            groups: Dict[str, List[Tuple[SegmentJob, np.ndarray, List[Tuple[int, int]]]]] = {}
+            for job, samples, spans in prepared:
+                speech = np.concatenate([samples[start:end] for start, end in spans])
+                language, _, _ = model.detect_language(audio=speech)
+                groups.setdefault(language, []).append((job, samples, spans))
+            for language, members in groups.items():
+                self._decode_group(model, members, language)
+
+    def _speech_spans(self, samples: np.ndarray) -> List[Tuple[int, int]]:
+        """Sample ranges of ``samples`` to decode: VAD speech merged into clips of at most ``MAX_CLIP_SEC``.
+
+        Batch rows come from ``clip_timestamps``, which makes the pipeline skip its
+        own VAD filter, so speech is found here with the options it would use.
+        """
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        options = VadOptions(max_speech_duration_s=MAX_CLIP_SEC, min_silence_duration_ms=160)
+        max_len = int(MAX_CLIP_SEC * WHISPER_SAMPLE_RATE)
+        max_gap = int(SPEECH_MERGE_GAP_SEC * WHISPER_SAMPLE_RATE)
+        spans: List[Tuple[int, int]] = []
+        for ts in get_speech_timestamps(samples, options):
+            if spans and ts["start"] - spans[-1][1] <= max_gap and ts["end"] - spans[-1][0] <= max_len:
+                spans[-1] = (spans[-1][0], ts["end"])
+            else:
+                spans.append((ts["start"], ts["end"]))
+        return spans
+
+    def _lease_model(self) -> ContextManager[object]:
+        from streamcraft.core.whisper_pool import get_model_pool
+        from streamcraft.settings import get_settings
+
+        settings = get_settings()
+        device, compute_type = detect_device(settings.whisper_device, settings.whisper_compute_type)
+        threads = settings.whisper_threads
+        if device == "cpu":
+            _, threads = cpu_worker_layout(1, threads)
+        pool = get_model_pool()
+        return pool.lease(*pool.make_key(self.model_size, device, compute_type, threads))
+
+    def _decode(self, model, audio: np.ndarray, clips: List[Dict[str, float]], language: str):
+        from faster_whisper import BatchedInferencePipeline
+
+        pipeline = BatchedInferencePipeline(model=model)
+        segments, _ = pipeline.transcribe(
+            audio,
+            language=language,
+            beam_size=5,
+            word_timestamps=True,
+            clip_timestamps=clips,
+            batch_size=self.batch_size,
+        )
+        return segments
+
+    def _decode_group(
+        self,
+        model,
+        members: List[Tuple[SegmentJob, np.ndarray, List[Tuple[int, int]]]],
+        language: str,
+    ) -> None:
+        # Lay the clips out on one timeline, separated by short gaps of silence.
+        pieces: List[np.ndarray] = []
+        clips: List[Dict[str, float]] = []
+        clip_starts: List[float] = []
+        clip_owner: List[int] = []
+        cursor = 0.0
+        for position, (_, samples, spans) in enumerate(members):
+            pieces.append(samples)
+            for start, end in spans:
+                clips.append({
+                    "start": cursor + start / WHISPER_SAMPLE_RATE,
+                    "end": cursor + end / WHISPER_SAMPLE_RATE,
+                })
+                clip_starts.append(cursor)
+                clip_owner.append(position)
+            cursor += samples.size / WHISPER_SAMPLE_RATE
+            pieces.append(np.zeros(int(CLIP_GAP_SEC * WHISPER_SAMPLE_RATE), dtype=np.float32))
+            cursor += CLIP_GAP_SEC
+
+        segments = self._decode(model, np.concatenate(pieces), clips, language)
+        jobs = [job for job, _, _ in members]
+        clip_bounds = [clip["start"] for clip in clips]
+        current = -1  # index into ``jobs`` of the segment currently streaming
+
+        def advance_to(target: int) -> None:
+            # The pipeline yields in clip order, so every earlier segment is complete.
+            nonlocal current
+            while current < target:
+                if current >= 0:
+                    jobs[current].emit({"type": "segmentDone", "segmentIndex": jobs[current].key})
+                current += 1
+                if current < len(jobs):
+                    job = jobs[current]
+                    job.emit({
+                        "type": "metadata",
+                        "segmentIndex": job.key,
+                        "language": language,
+                        "duration": job.end - job.start,
+                    })
+
+        for seg in segments:
+            clip_idx = max(0, bisect.bisect_right(clip_bounds, seg.start + 1e-6) - 1)
+            owner = clip_owner[clip_idx]
+            advance_to(owner)
+            job = jobs[owner]
+            base = clip_starts[clip_idx]
+            if seg.words:
+                for word in seg.words:
+                    job.emit({
+                        "type": "word",
+                        "segmentIndex": job.key,
+                        "word": word.word.strip(),
+                        "start": word.start - base,
+                        "end": word.end - base,
+                        "probability": word.probability,
+                    })
+            else:
+                job.emit({
+                    "type": "segment",
+                    "segmentIndex": job.key,
+                    "text": seg.text.strip(),
+                    "start": seg.start - base,
+                    "end": seg.end - base,
+                })
+        advance_to(len(jobs))
+
+
+_batchers: Dict[str, SegmentBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_segment_batcher(model_size: str) -> SegmentBatcher:
+    """Get or create the process-wide batcher for ``model_size``."""
+    with _batchers_lock:
+        batcher = _batchers.get(model_size)
+        if batcher is None:
+            batcher = SegmentBatcher(model_size)
+            _batchers[model_size] = batcher
+        return batcher
@@ -0,0 +1,350 @@
+"""Columnar sidecar for the sanitize segment manifest.
+
+``<vod>_segments.json`` holds one dict per segment, and a full run can have
+tens of thousands of them. The review UI pages through it 200 rows at a time.
+Before this sidecar, every page and every segment transcription re-parsed the
+JSON and walked all segments to find each kept segment's offset on the clean
+timeline.
+
+Sanitize now also writes ``<vod>_segments.npz``, which holds one array per
+field, labels and reject reasons as bitmasks over a small vocabulary, and a
+``clean_start`` column: the prefix sum of kept durations. It is stamped with
+the JSON's size and mtime. ``get_segment_columns`` keeps the loaded columns
+per process until the JSON changes. A missing or stale sidecar (older runs,
+hand-edited JSON) is rebuilt from the JSON once and rewritten. A filtered,
+sorted view is computed once per query and then memoised, so a page costs
+O(page size).
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FLOAT_FIELDS = ("speech_ratio", "snr_db", "clip_ratio", "sfx_score", "speaker_sim")
+SORT_KEYS = ("index", "quality", "duration", "kept", "label", "rejectReason")
+MAX_CACHED_MANIFESTS = 16
+MAX_CACHED_VIEWS = 32
+
+Stamp = Tuple[int, int]
+
+
+def columns_path(manifest_path: Path) -> Path:
+    """``<vod>_segments.json`` -> ``<vod>_segments.npz``."""
+    return manifest_path.with_suffix(".npz")
+
+
+def manifest_stamp(manifest_path: Path) -> Stamp:
+    st = manifest_path.stat()
+    return int(st.st_size), int(st.st_mtime_ns)
+
+
+def _vocabulary(values: Sequence[Sequence[str]]) -> List[str]:
+    """Distinct names, ordered so each row's own order survives the bitmask round trip."""
+    rows = {tuple(names) for names in values}
+    remaining = {name for row in rows for name in row}
+    before: Dict[str, set] = {name: set() for name in remaining}
+    for row in rows:
+        for i, name in enumerate(row):
+            before[name].update(other for other in row[:i] if other != name)
+    order: List[str] = []
+    while remaining:
+        ready = sorted(name for name in remaining if not before[name] & remaining)
+        if not ready:  # rows disagree on the order; fall back to alphabetical
+            order.extend(sorted(remaining))
+            break
+        order.append(ready[0])
+        remaining.remove(ready[0])
+    return order
+
+
+def _bitmask(values: Sequence[Sequence[str]], vocab: List[str]) -> np.ndarray:
+    if len(vocab) > 64:
+        raise ValueError(f"too many distinct values for a bitmask column ({len(vocab)})")
+    bit = {name: np.uint64(1) << np.uint64(i) for i, name in enumerate(vocab)}
+    out = np.zeros(len(values), dtype=np.uint64)
+    for i, names in enumerate(values):
+        for name in names:
+            out[i] |= bit[name]
+    return out
+
+
+def _float_or_none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass
+class SegmentColumns:
+    """Per-field arrays of a segment manifest, indexed by segment position."""
+
+    start: np.ndarray
+    end: np.ndarray
+    dur: np.ndarray
+    kept: np.ndarray  # int8: 1 kept, 0 rejected, -1 missing
+    quality: np.ndarray  # int32, -1 missing
+    floats: Dict[str, np.ndarray]  # FLOAT_FIELDS, NaN missing
+    label_bits: np.ndarray  # uint64 bitmask over label_vocab
+    reason_bits: np.ndarray  # uint64 bitmask over reason_vocab
+    label_vocab: List[str]
+    reason_vocab: List[str]
+    clean_start: np.ndarray  # offset on the clean timeline, NaN when not kept
+    sample_rate: int
+    stamp: Stamp = (0, 0)
+    _views: "OrderedDict[tuple, np.ndarray]" = field(default_factory=OrderedDict, repr=False)
+    _views_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_segments(cls, segments: Sequence[dict], sample_rate: int, stamp: Stamp = (0, 0)) -> "SegmentColumns":
+        start = np.array([float(seg.get("start", 0.0)) for seg in segments], dtype=np.float64)
+        end = np.array([float(seg.get("end", 0.0)) for seg in segments], dtype=np.float64)
+        dur = np.array([float(seg.get("dur", 0.0)) for seg in segments], dtype=np.float64)
+        kept = np.array([-1 if seg.get("kept") is None else int(bool(seg["kept"])) for seg in segments], dtype=np.int8)
+        quality = np.array([-1 if seg.get("quality") is None else int(seg["quality"]) for seg in segments], dtype=np.int32)
+        floats = {
+            name: np.array([np.nan if seg.get(name) is None else float(seg[name]) for seg in segments], dtype=np.float64)
+            for name in FLOAT_FIELDS
+        }
+        labels = [seg.get("labels") or [] for seg in segments]
+        reasons = [seg.get("reject_reason") or [] for seg in segments]
+        label_vocab = _vocabulary(labels)
+        reason_vocab = _vocabulary(reasons)
+        # Kept segments sit back-to-back on the clean timeline; cumsum adds in order like the old loop.
+        kept_dur = np.where(kept == 1, dur, 0.0)
+        clean_start = np.where(kept == 1, np.concatenate(([0.0], np.cumsum(kept_dur)[:-1])), np.nan)
+        return cls(
+            start=start,
+            end=end,
+            dur=dur,
+            kept=kept,
+            quality=quality,
+            floats=floats,
+            label_bits=_bitmask(labels, label_vocab),
+            reason_bits=_bitmask(reasons, reason_vocab),
+            label_vocab=label_vocab,
+            reason_vocab=reason_vocab,
+            clean_start=clean_start,
+            sample_rate=int(sample_rate),
+            stamp=stamp,
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "dur": self.dur,
+            "kept": self.kept,
+            "quality": self.quality,
+            **{f"f_{name}": values for name, values in self.floats.items()},
+            "label_bits": self.label_bits,
+            "reason_bits": self.reason_bits,
+            "label_vocab": np.array(self.label_vocab, dtype=np.str_),
+            "reason_vocab": np.array(self.reason_vocab, dtype=np.str_),
+            "clean_start": self.clean_start,
+            "sample_rate": np.int64(self.sample_rate),
+            "stamp": np.array(self.stamp, dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "SegmentColumns":
+        n = arrays["start"].shape[0]
+        columns = cls(
+            start=arrays["start"],
+            end=arrays["end"],
+            dur=arrays["dur"],
+            kept=arrays["kept"],
+            quality=arrays["quality"],
+            floats={name: arrays[f"f_{name}"] for name in FLOAT_FIELDS},
+            label_bits=arrays["label_bits"],
+            reason_bits=arrays["reason_bits"],
+            label_vocab=[str(v) for v in arrays["label_vocab"]],
+            reason_vocab=[str(v) for v in arrays["reason_vocab"]],
+            clean_start=arrays["clean_start"],
+            sample_rate=int(arrays["sample_rate"]),
+            stamp=(int(arrays["stamp"][0]), int(arrays["stamp"][1])),
+        )
+        lengths = [columns.end, columns.dur, columns.kept, columns.quality, columns.label_bits, columns.reason_bits, columns.clean_start]
+        if any(values.shape != (n,) for values in lengths + list(columns.floats.values())):
+            raise ValueError("segment columns have mismatched lengths")
+        return columns
+
+    def __len__(self) -> int:
+        return int(self.start.shape[0])
+
+    def _names(self, bits: np.uint64, vocab: List[str]) -> List[str]:
+        return [name for i, name in enumerate(vocab) if int(bits) >> i & 1]
+
+    def clean_range(self, index: int) -> Optional[Tuple[float, float]]:
+        """(start, end) of a kept segment on the clean timeline, else None."""
+        clean_start = float(self.clean_start[index])
+        if np.isnan(clean_start):
+            return None
+        return clean_start, clean_start + float(self.dur[index])
+
+    def row(self, index: int) -> dict:
+        """One segment as the JSON manifest spells it, plus its clean-timeline range."""
+        clean = self.clean_range(index)
+        kept = int(self.kept[index])
+        quality = int(self.quality[index])
+        return {
+            "start": float(self.start[index]),
+            "end": float(self.end[index]),
+            "dur": float(self.dur[index]),
+            "kept": None if kept < 0 else bool(kept),
+            "quality": None if quality < 0 else quality,
+            **{name: _float_or_none(values[index]) for name, values in self.floats.items()},
+            "labels": self._names(self.label_bits[index], self.label_vocab),
+            "reject_reason": self._names(self.reason_bits[index], self.reason_vocab),
+            "clean_start": clean[0] if clean else None,
+            "clean_end": clean[1] if clean else None,
+        }
+
+    def _has(self, bits: np.ndarray, vocab: List[str], name: str) -> np.ndarray:
+        if name not in vocab:
+            return np.zeros(len(self), dtype=bool)
+        return (bits & (np.uint64(1) << np.uint64(vocab.index(name)))) != 0
+
+    def _first_name_rank(self, bits: np.ndarray, vocab: List[str]) -> np.ndarray:
+        # Vocabulary rank of the segment's first name; segments without any sort last.
+        rank = np.full(len(self), len(vocab), dtype=np.int64)
+        for i in reversed(range(len(vocab))):
+            rank[(bits >> np.uint64(i)) & np.uint64(1) == 1] = i
+        return rank
+
+    def _sort_key(self, sort: str) -> np.ndarray:
+        if sort == "quality":
+            return self.quality
+        if sort == "duration":
+            return self.dur
+        if sort == "kept":
+            return self.kept
+        if sort == "label":
+            return self._first_name_rank(self.label_bits, self.label_vocab)
+        if sort == "rejectReason":
+            return self._first_name_rank(self.reason_bits, self.reason_vocab)
+        raise ValueError(f"unknown sort key {sort!r} (expected one of {', '.join(SORT_KEYS)})")
+
+    def select(
+        self,
+        kept: Optional[bool] = None,
+        min_quality: Optional[int] = None,
+        max_quality: Optional[int] = None,
+        label: Optional[str] = None,
+        reject_reason: Optional[str] = None,
+        sort: str = "index",
+        descending: bool = False,
+    ) -> np.ndarray:
+        """Segment indices matching the filters, in sort order (ties by index); memoised."""
+        key = (kept, min_quality, max_quality, label, reject_reason, sort, descending)
+        with self._views_lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                return view
+
+        if sort not in SORT_KEYS:
+            raise ValueError(f"unknown sort key {sort!r} (expected one of {', '.join(SORT_KEYS)})")
+        mask = np.ones(len(self), dtype=bool)
+        if kept is not None:
+            mask &= self.kept == int(kept)
+        if min_quality is not None:
+            mask &= self.quality >= min_quality
+        if max_quality is not None:
+            mask &= (self.quality >= 0) & (self.quality <= max_quality)
+        if label is not None:
+            mask &= self._has(self.label_bits, self.label_vocab, label)
+        if reject_reason is not None:
+            mask &= self._has(self.reason_bits, self.reason_vocab, reject_reason)
+        view = np.flatnonzero(mask)
+        if sort == "index":
+            if descending:
+                view = view[::-1]
+        else:
+            values = self._sort_key(sort)[view]
+            view = view[np.argsort(-values if descending else values, kind="stable")]
+
+        with self._views_lock:
+            self._views[key] = view
+            while len(self._views) > MAX_CACHED_VIEWS:
+                self._views.popitem(last=False)
+        return view
+
+
+def _store(path: Path, columns: SegmentColumns) -> None:
+    # Concurrent page requests may rebuild the same sidecar; each needs its own tmp file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, **columns.to_arrays())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _load(path: Path) -> Optional[SegmentColumns]:
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return SegmentColumns.from_arrays({name: data[name] for name in data.files})
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_segment_columns(manifest_path: Path, segments: Sequence[dict], sample_rate: int) -> SegmentColumns:
+    """Write the sidecar for the manifest just written at ``manifest_path``."""
+    columns = SegmentColumns.from_segments(segments, sample_rate, manifest_stamp(manifest_path))
+    _store(columns_path(manifest_path), columns)
+    return columns
+
+
+class SegmentColumnsCache:
+    """Per-process cache of manifest columns, invalidated when the JSON's size or mtime changes."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_MANIFESTS):
+        self._entries: "OrderedDict[Path, SegmentColumns]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def get(self, manifest_path: Path) -> SegmentColumns:
+        """Columns for ``manifest_path``; raises FileNotFoundError / ValueError like reading the JSON would."""
+        stamp = manifest_stamp(manifest_path)
+        key = manifest_path.resolve()
+        with self._lock:
+            columns = self._entries.get(key)
+            if columns is not None and columns.stamp == stamp:
+                self._entries.move_to_end(key)
+                return columns
+
+        sidecar = columns_path(manifest_path)
+        columns = _load(sidecar) if sidecar.exists() else None
+        if columns is None or columns.stamp != stamp:
+            payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+            sample_rate = int((payload.get("source") or {}).get("sample_rate") or payload.get("sampleRate") or 0)
+            columns = SegmentColumns.from_segments(payload.get("segments") or [], sample_rate, stamp)
+            try:
+                _store(sidecar, columns)
+            except OSError:
+                pass
+
+        with self._lock:
+            self._entries[key] = columns
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return columns
+
+
+_cache: Optional[SegmentColumnsCache] = None
+
+
+def get_segment_columns(manifest_path: Path) -> SegmentColumns:
+    """Columns for ``manifest_path`` from the process-wide cache."""
+    global _cache
+    if _cache is None:
+        _cache = SegmentColumnsCache()
+    return _cache.get(manifest_path)
@@ -0,0 +1,336 @@
+"""Vocal separation restricted to the parts of a VOD that can contain speech.
+
+UVR and Demucs cost grows with the length of their input, but most of a stream
+VOD is silence or gameplay that sanitize discards anyway. ``separate_speech_regions``
+first runs a cheap pre-pass (20 ms frame energy against the file's own noise
+floor, AND-ed with webrtcvad at 16 kHz), pads and merges the speech it finds,
+and sends only those regions through the separator, split into overlapping
+chunks. Chunk outputs are overlap-added with complementary linear crossfades
+and written onto the original timeline; everything between regions is silence.
+
+The separator is any callable mapping a batch of chunk WAVs to their vocal
+stems, so the long-lived UVR worker and the in-process Demucs engine plug in
+the same way.
+"""
+
+import math
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.audio_source import AudioSource
+from streamcraft.core.resample import PolyphaseResampler
+from streamcraft.core.speech_regions import Region, normalize_regions, regions_from_vad
+
+FRAME_SEC = 0.02
+VAD_SAMPLE_RATE = 16000
+VAD_LEVEL = 1  # least aggressive setting that still ignores steady noise; misses cost vocals
+ENERGY_MARGIN_DB = 6.0  # frames must sit this far above the noise floor
+SILENCE_DB = -60.0  # and above this absolute level
+DIGITAL_SILENCE_DB = -100.0  # exact zeros, not room noise; noise floors here and in sanitize skip them
+NOISE_FLOOR_PERCENTILE = 15
+
+DEFAULT_PAD_SEC = 1.0
+DEFAULT_MERGE_GAP_SEC = 2.0
+DEFAULT_CHUNK_SEC = 60.0
+DEFAULT_OVERLAP_SEC = 2.0
+EDGE_FADE_SEC = 0.02  # region boundaries sit in padding; a short fade keeps separator edges click-free
+
+Separator = Callable[[List[Path]], Sequence[Path]]
+
+
+@dataclass
+class SparseSeparation:
+    """Result of ``separate_speech_regions``."""
+
+    output_path: Path
+    regions: List[Region]
+    separated_sec: float
+    duration_sec: float
+
+    @property
+    def speech_share(self) -> float:
+        return self.separated_sec / self.duration_sec if self.duration_sec > 0 else 0.0
+
+
+# Pre-pass --------------------------------------------------------------------
+
+
+def _frame_energy_db(samples: np.ndarray) -> np.ndarray:
+    frames = samples[: samples.size // 320 * 320].reshape(-1, 320).astype(np.float64)
+    return 20 * np.log10(np.sqrt(np.mean(frames * frames, axis=1) + 1e-12) + 1e-12)
+
+
+def _vad_frames(vad, samples: np.ndarray) -> np.ndarray:
+    pcm = (np.clip(samples[: samples.size // 320 * 320], -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    return np.fromiter((vad.is_speech(pcm[i : i + 640], VAD_SAMPLE_RATE) for i in range(0, len(pcm), 640)), dtype=bool)
+
+
+def detect_speech_regions(
+    input_path: Path,
+    pad_sec: float = DEFAULT_PAD_SEC,
+    merge_gap_sec: float = DEFAULT_MERGE_GAP_SEC,
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> List[Region]:
+    """Padded, merged (start, end) seconds of likely speech in ``input_path``.
+
+    One streamed pass over the file: the mono mix is resampled to 16 kHz, and a
+    20 ms frame counts as speech when it is louder than both the noise floor
+    plus ``ENERGY_MARGIN_DB`` and ``SILENCE_DB``, and webrtcvad (when installed)
+    agrees.
+    """
+    try:
+        import webrtcvad
+
+        vad = webrtcvad.Vad(VAD_LEVEL)
+    except ImportError:
+        vad = None
+
+    energy: List[np.ndarray] = []
+    voiced: List[np.ndarray] = []
+    with AudioSource(input_path) as source:
+        duration = source.duration
+        resampler = PolyphaseResampler(source.sample_rate, VAD_SAMPLE_RATE)
+        pending = np.zeros(0, dtype=np.float32)
+        for start in range(0, source.frames, source.block_frames):
+            if should_cancel and should_cancel():
+                raise RuntimeError("Separation canceled by user")
+            block = source.mono(start, start + source.block_frames)
+            pending = np.concatenate((pending, resampler.process(block)))
+            usable = pending.size // 320 * 320
+            energy.append(_frame_energy_db(pending[:usable]))
+            if vad is not None:
+                voiced.append(_vad_frames(vad, pending[:usable]))
+            pending = pending[usable:]
+        pending = np.concatenate((pending, resampler.flush()))
+        energy.append(_frame_energy_db(pending))
+        if vad is not None:
+            voiced.append(_vad_frames(vad, pending))
+
+    energy_db = np.concatenate(energy) if energy else np.zeros(0)
+    audible = energy_db[energy_db > DIGITAL_SILENCE_DB]
+    noise_floor = float(np.percentile(audible, NOISE_FLOOR_PERCENTILE)) if audible.size else SILENCE_DB
+    speech = energy_db >= max(noise_floor + ENERGY_MARGIN_DB, SILENCE_DB)
+    if vad is not None:
+        speech &= np.concatenate(voiced)
+    return normalize_regions(regions_from_vad(speech.astype(np.float32), FRAME_SEC), pad=pad_sec, merge_gap=merge_gap_sec, duration=duration)
+
+
+# Chunking --------------------------------------------------------------------
+
+
+def plan_chunks(
+    regions: Iterable[Region],
+    sample_rate: int,
+    total_frames: int,
+    chunk_sec: float = DEFAULT_CHUNK_SEC,
+    overlap_sec: float = DEFAULT_OVERLAP_SEC,
+) -> List[Tuple[int, int]]:
+    """Split regions into ``[start, stop)`` sample ranges of at most ``chunk_sec``.
+
+    Consecutive chunks of one region share ``overlap_sec``; a region is cut into
+    equal-length chunks so no tail chunk is left too short to separate well.
+    """
+    chunk = max(1, int(chunk_sec * sample_rate))
+    overlap = min(max(0, int(overlap_sec * sample_rate)), chunk // 2)
+    chunks: List[Tuple[int, int]] = []
+    for start_sec, end_sec in regions:
+        start = min(total_frames, max(0, int(start_sec * sample_rate)))
+        stop = min(total_frames, max(start, int(math.ceil(end_sec * sample_rate))))
+        length = stop - start
+        if length <= 0:
+            continue
+        if length <= chunk:
+            chunks.append((start, stop))
+            continue
+        count = math.ceil((length - overlap) / (chunk - overlap))
+        step = (length - overlap) / count
+        bounds = [start + int(round(i * step)) for i in range(count + 1)]
+        for i in range(count):
+            chunks.append((bounds[i], min(stop, bounds[i + 1] + overlap)))
+    return chunks
+
+
+def crossfade_weights(length: int, fade_in: int, fade_out: int) -> np.ndarray:
+    """Per-sample gain: linear ramps that sum to one with the neighbouring chunk's."""
+    weights = np.ones(length, dtype=np.float32)
+    fade_in = min(fade_in, length)
+    fade_out = min(fade_out, length)
+    if fade_in:
+        weights[:fade_in] *= (np.arange(fade_in, dtype=np.float32) + 0.5) / fade_in
+    if fade_out:
+        weights[length - fade_out :] *= (np.arange(fade_out, 0, -1, dtype=np.float32) - 0.5) / fade_out
+    return weights
+
+
+class TimelineWriter:
+    """Overlap-adds chunks (in start order) into a file, writing silence between them."""
+
+    def __init__(self, handle: sf.SoundFile, total_frames: int):
+        self._handle = handle
+        self._total = total_frames
+        self._written = 0
+        self._pending = np.zeros((0, handle.channels), dtype=np.float32)
+
+    def _write_silence(self, stop: int) -> None:
+        if stop <= self._written:
+            return
+        block = np.zeros((min(stop - self._written, 1 << 16), self._handle.channels), dtype=np.float32)
+        while self._written < stop:
+            count = min(block.shape[0], stop - self._written)
+            self._handle.write(block[:count])
+            self._written += count
+
+    def _flush(self, stop: int) -> None:
+        count = min(max(0, stop - self._written), self._pending.shape[0])
+        if count:
+            self._handle.write(self._pending[:count])
+            self._pending = self._pending[count:]
+            self._written += count
+
+    def add(self, start: int, data: np.ndarray) -> None:
+        if start < self._written:
+            raise ValueError("chunks must be added in start order")
+        pending_end = self._written + self._pending.shape[0]
+        if start >= pending_end:
+            self._flush(pending_end)
+            self._write_silence(start)
+        else:
+            self._flush(start)
+        offset = start - self._written
+        needed = offset + data.shape[0]
+        if needed > self._pending.shape[0]:
+            grown = np.zeros((needed, self._pending.shape[1]), dtype=np.float32)
+            grown[: self._pending.shape[0]] = self._pending
+            self._pending = grown
+        self._pending[offset:needed] += data
+
+    def finish(self) -> None:
+        self._flush(self._total)
+        self._pending = self._pending[:0]
+        self._write_silence(self._total)
+
+
+def _read_stem(stem: Path, channels: Optional[int]) -> Tuple[np.ndarray, int]:
+    data, sr = sf.read(str(stem), dtype="float32", always_2d=True)
+    if channels is not None and data.shape[1] != channels:
+        data = np.repeat(data[:, :1], channels, axis=1) if data.shape[1] == 1 else data[:, :channels]
+    return data, int(sr)
+
+
+def _fit(data: np.ndarray, length: int) -> np.ndarray:
+    if data.shape[0] >= length:
+        return data[:length]
+    return np.pad(data, ((0, length - data.shape[0]), (0, 0)))
+
+
+# Separation ------------------------------------------------------------------
+
+
+def separate_speech_regions(
+    input_path: Path,
+    output_path: Path,
+    separate: Separator,
+    regions: Optional[List[Region]] = None,
+    chunk_sec: float = DEFAULT_CHUNK_SEC,
+    overlap_sec: float = DEFAULT_OVERLAP_SEC,
+    pad_sec: float = DEFAULT_PAD_SEC,
+    batch_size: int = 1,
+    on_progress: Optional[Callable[[float, float], None]] = None,
+    log: Optional[Callable[[str], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> SparseSeparation:
+    """Separate only the speech regions of ``input_path`` into ``output_path``.
+
+    ``regions`` (seconds, already padded) skip the pre-pass when the caller knows
+    where speech is, e.g. from subtitle cues. ``separate`` receives up to
+    ``batch_size`` chunk WAVs per call and returns their vocal stems in order;
+    ``on_progress(done, share)`` reports, before each batch, the fraction of
+    speech time already separated and the fraction the batch covers. The output
+    has the stems' sample rate and channel count and the input's duration.
+    """
+    emit = log or (lambda line: None)
+    if regions is None:
+        regions = detect_speech_regions(input_path, pad_sec=pad_sec, should_cancel=should_cancel)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    source = AudioSource(input_path)
+    handle: Optional[sf.SoundFile] = None
+    work_dir = Path(tempfile.mkdtemp(prefix="sparse_sep_", dir=output_path.parent))
+    tmp_output = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        src_sr = source.sample_rate
+        duration = source.duration
+        regions = normalize_regions(regions, pad=0.0, merge_gap=0.0, duration=duration)
+        chunks = plan_chunks(regions, src_sr, source.frames, chunk_sec, overlap_sec)
+        total = sum(stop - start for start, stop in chunks)
+        separated_sec = sum(end - start for start, end in regions)
+        emit(
+            f"[separate] {len(regions)} speech regions, {separated_sec:.1f}s of {duration:.1f}s "
+            f"({100.0 * separated_sec / max(duration, 1e-9):.0f}%) in {len(chunks)} chunks"
+        )
+
+        writer: Optional[TimelineWriter] = None
+        out_sr = src_sr
+        out_channels: Optional[int] = None
+        done = 0
+        edge = max(1, int(EDGE_FADE_SEC * src_sr))
+        for first in range(0, len(chunks), max(1, batch_size)):
+            if should_cancel and should_cancel():
+                raise RuntimeError("Separation canceled by user")
+            batch = chunks[first : first + max(1, batch_size)]
+            paths: List[Path] = []
+            for i, (start, stop) in enumerate(batch, start=first):
+                path = work_dir / f"chunk_{i:05d}.wav"
+                sf.write(str(path), source.pcm(start, stop), src_sr, subtype="PCM_16")
+                paths.append(path)
+            if on_progress:
+                on_progress(done / total, sum(stop - start for start, stop in batch) / total)
+            stems = list(separate(paths))
+            if len(stems) != len(paths):
+                raise RuntimeError(f"Separator returned {len(stems)} stems for {len(paths)} chunks")
+
+            for i, (stem, (start, stop)) in enumerate(zip(stems, batch), start=first):
+                data, stem_sr = _read_stem(stem, out_channels)
+                if handle is None:
+                    out_sr, out_channels = stem_sr, data.shape[1]
+                    handle = sf.SoundFile(str(tmp_output), "w", samplerate=out_sr, channels=out_channels, subtype="PCM_16", format="WAV")
+                    writer = TimelineWriter(handle, int(round(source.frames * out_sr / src_sr)))
+                elif stem_sr != out_sr:
+                    raise RuntimeError(f"Separator changed sample rate mid-run ({out_sr} -> {stem_sr})")
+                prev_stop = chunks[i - 1][1] if i > 0 else 0
+                next_start = chunks[i + 1][0] if i + 1 < len(chunks) else source.frames
+                fade_in = prev_stop - start if prev_stop > start else edge
+                fade_out = stop - next_start if next_start < stop else edge
+                scale = out_sr / src_sr
+                out_start = int(round(start * scale))
+                length = int(round(stop * scale)) - out_start
+                weights = crossfade_weights(length, int(round(fade_in * scale)), int(round(fade_out * scale)))
+                writer.add(out_start, _fit(data, length) * weights[:, None])
+                done += stop - start
+            for path in [*paths, *stems]:
+                Path(path).unlink(missing_ok=True)
+
+        if handle is None:
+            # Nothing sounded like speech: a silent stem of the same length, separator never loaded.
+            handle = sf.SoundFile(str(tmp_output), "w", samplerate=src_sr, channels=source.channels, subtype="PCM_16", format="WAV")
+            writer = TimelineWriter(handle, source.frames)
+        writer.finish()
+        handle.close()
+        handle = None
+        os.replace(tmp_output, output_path)
+        if on_progress:
+            on_progress(1.0, 0.0)
+        return SparseSeparation(output_path=output_path, regions=list(regions), separated_sec=separated_sec, duration_sec=duration)
+    finally:
+        if handle is not None:
+            handle.close()
+        source.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+        tmp_output.unlink(missing_ok=True)
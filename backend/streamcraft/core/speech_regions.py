@@ -0,0 +1,95 @@
+"""Speech regions shared between sanitize and transcription.
+
+Sanitize v2 already runs webrtcvad over every 20 ms frame. A full (non-preview)
+run stores the resulting speech regions as ``<vod>_speech.json`` next to the
+VOD audio so transcription can decode only those spans instead of running its
+own VAD over the whole 48 kHz file. A sanitize segment manifest can be used as
+a fallback source when it was produced by a full run.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Region = Tuple[float, float]
+
+SPEECH_REGIONS_SUFFIX = "_speech.json"
+DEFAULT_PAD_SEC = 0.3
+DEFAULT_MERGE_GAP_SEC = 1.0
+
+
+def regions_from_vad(vad_prob: np.ndarray, frame_sec: float, threshold: float = 0.5) -> List[Region]:
+    """Contiguous runs of frames with ``vad_prob >= threshold`` as (start, end) seconds."""
+    if vad_prob.size == 0:
+        return []
+    speech = np.concatenate(([0], (vad_prob >= threshold).astype(np.int8), [0]))
+    edges = np.diff(speech)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [(float(s * frame_sec), float(e * frame_sec)) for s, e in zip(starts, ends)]
+
+
+def normalize_regions(
+    regions: Iterable[Sequence[float]],
+    pad: float = DEFAULT_PAD_SEC,
+    merge_gap: float = DEFAULT_MERGE_GAP_SEC,
+    duration: Optional[float] = None,
+) -> List[Region]:
+    """Pad, clip to ``[0, duration]``, sort and merge regions closer than ``merge_gap``."""
+    padded: List[Region] = []
+    for start, end in regions:
+        start = max(0.0, float(start) - pad)
+        end = float(end) + pad
+        if duration is not None:
+            end = min(end, duration)
+        if end > start:
+            padded.append((start, end))
+    padded.sort()
+    merged: List[Region] = []
+    for start, end in padded:
+        if merged and start - merged[-1][1] <= merge_gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def write_speech_regions(path: Path, source: Path, regions: List[Region], frame_sec: float) -> None:
+    payload = {
+        "source": str(source),
+        "frame_sec": frame_sec,
+        "regions": [[round(s, 3), round(e, 3)] for s, e in regions],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def load_speech_regions(path: Path) -> Optional[List[Region]]:
+    """Read regions from a ``_speech.json`` file or a full-run sanitize manifest.
+
+    Returns None when the file is missing or can't be trusted to cover the whole VOD
+    (e.g. a preview manifest, whose times are relative to the preview window).
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if "regions" in payload:
+        return [(float(s), float(e)) for s, e in payload["regions"]]
+    if "segments" in payload and (payload.get("settings") or {}).get("preview") is False:
+        return [(float(seg["start"]), float(seg["end"])) for seg in payload["segments"]]
+    return None
+
+
+def find_speech_regions(vod_dir: Path, dataset_dir: Optional[Path] = None) -> Optional[List[Region]]:
+    """Locate precomputed speech regions for a VOD: the VAD sidecar first, then the manifest."""
+    candidates = [vod_dir / f"{vod_dir.name}{SPEECH_REGIONS_SUFFIX}"]
+    if dataset_dir is not None:
+        candidates.append(dataset_dir / f"{vod_dir.name}_segments.json")
+    for path in candidates:
+        regions = load_speech_regions(path)
+        if regions is not None:
+            return regions
+    return None
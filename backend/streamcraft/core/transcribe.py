@@ -5,12 +5,24 @@ import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-from faster_whisper import WhisperModel
+
+from streamcraft.core.transcript_cache import get_transcript_cache
+from streamcraft.core.whisper_pool import get_model_pool
+from streamcraft.core.word_index import build_word_index, spool_line, word_index_paths
+
+
+@dataclass
+class Word:
+    """Word-level timing reported by faster-whisper."""
+    word: str
+    start: float
+    end: float
+    probability: float
 
 
 @dataclass
@@ -19,30 +31,144 @@ class Segment:
     start: float
     end: float
     text: str
+    words: List[Word] = field(default_factory=list)
+    avg_logprob: float = 0.0
+    no_speech_prob: float = 0.0
 
 
-class LiveSubtitleWriter:
-    """Streams subtitle outputs to disk so progress is never lost."""
+def segment_from_whisper(seg, offset: float = 0.0) -> Segment:
+    """Convert a faster-whisper segment, shifting all timestamps by ``offset``."""
+    words = [
+        Word(word=(w.word or "").strip(), start=w.start + offset, end=w.end + offset, probability=w.probability)
+        for w in (getattr(seg, "words", None) or [])
+    ]
+    return Segment(
+        start=seg.start + offset,
+        end=seg.end + offset,
+        text=(seg.text or "").strip(),
+        words=words,
+        avg_logprob=float(getattr(seg, "avg_logprob", 0.0) or 0.0),
+        no_speech_prob=float(getattr(seg, "no_speech_prob", 0.0) or 0.0),
+    )
+
 
-    def __init__(self, srt_path: Optional[Path], vtt_path: Optional[Path], txt_path: Optional[Path]):
+class TranscriptionCheckpoint:
+    """Resume marker stored next to ``<stem>.meta.json`` while a transcription is running.
+
+    After every segment the live writer commits the segment end time, the segment count
+    and the byte length of each live output. A crashed run can then truncate the outputs
+    back to the last committed segment and continue decoding from ``last_end``.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Path,
+        params: Dict,
+        last_end: float = 0.0,
+        segments: int = 0,
+        offsets: Optional[Dict[str, int]] = None,
+        complete: bool = False,
+    ):
+        self.path = path
+        self.params = params
+        self.last_end = last_end
+        self.segments = segments
+        self.offsets = dict(offsets or {})
+        self.complete = complete
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["TranscriptionCheckpoint"]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION:
+            return None
+        return cls(
+            path=path,
+            params=data.get("params") or {},
+            last_end=float(data.get("last_end") or 0.0),
+            segments=int(data.get("segments") or 0),
+            offsets={k: int(v) for k, v in (data.get("offsets") or {}).items()},
+            complete=bool(data.get("complete")),
+        )
+
+    def matches(self, params: Dict) -> bool:
+        return self.params == params
+
+    def commit(self, last_end: float, segments: int, offsets: Dict[str, int]):
+        self.last_end = last_end
+        self.segments = segments
+        self.offsets = offsets
+        self.save()
+
+    def mark_complete(self):
+        self.complete = True
+        self.save()
+
+    def save(self):
+        payload = {
+            "version": self.VERSION,
+            "params": self.params,
+            "last_end": self.last_end,
+            "segments": self.segments,
+            "offsets": self.offsets,
+            "complete": self.complete,
+        }
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def discard(self):
+        try:
+            self.path.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
+class LiveSubtitleWriter:
+    """Streams subtitle outputs to disk so progress is never lost.
+
+    With a ``checkpoint`` that already holds committed segments, the outputs are truncated
+    to the recorded lengths and appended to instead of being rewritten.
+    """
+
+    def __init__(
+        self,
+        srt_path: Optional[Path],
+        vtt_path: Optional[Path],
+        txt_path: Optional[Path],
+        checkpoint: Optional[TranscriptionCheckpoint] = None,
+        words_path: Optional[Path] = None,
+    ):
         self.srt_path = srt_path
         self.vtt_path = vtt_path
         self.txt_path = txt_path
-        self._srt_handle = self._open_handle(srt_path)
-        self._vtt_handle = self._open_handle(vtt_path)
-        self._txt_handle = self._open_handle(txt_path)
-        self._counter = 0
-        self._txt_written = False
-
-        if self._vtt_handle:
+        self.words_path = words_path
+        self.checkpoint = checkpoint
+        offsets = checkpoint.offsets if checkpoint and checkpoint.segments > 0 else {}
+        self._srt_handle = self._open_handle(srt_path, offsets.get("srt"))
+        self._vtt_handle = self._open_handle(vtt_path, offsets.get("vtt"))
+        self._txt_handle = self._open_handle(txt_path, offsets.get("txt"))
+        self._words_handle = self._open_handle(words_path, offsets.get("words"))
+        self._counter = checkpoint.segments if offsets else 0
+        self._txt_written = bool(offsets.get("txt"))
+
+        if self._vtt_handle and not offsets.get("vtt"):
             self._vtt_handle.write("WEBVTT\n\n")
             self._vtt_handle.flush()
 
     @staticmethod
-    def _open_handle(path: Optional[Path]):
+    def _open_handle(path: Optional[Path], resume_offset: Optional[int] = None):
         if not path:
             return None
         path.parent.mkdir(parents=True, exist_ok=True)
+        if resume_offset is not None and path.exists():
+            # Drop anything written after the last committed segment, then append.
+            os.truncate(path, min(resume_offset, path.stat().st_size))
+            return path.open("a", encoding="utf-8", newline="\n")
         return path.open("w", encoding="utf-8", newline="\n")
 
     def write_segment(self, seg: Segment):
@@ -70,9 +196,33 @@ class LiveSubtitleWriter:
             self._txt_handle.flush()
             self._txt_written = True
 
-    def close(self):
-        for handle in (self._srt_handle, self._vtt_handle, self._txt_handle):
+        if self._words_handle:
+            self._words_handle.write(spool_line(seg))
+            self._words_handle.flush()
+
+        if self.checkpoint:
+            self.checkpoint.commit(seg.end, self._counter, self.offsets())
+
+    def offsets(self) -> Dict[str, int]:
+        result = {}
+        handles = (
+            ("srt", self._srt_handle),
+            ("vtt", self._vtt_handle),
+            ("txt", self._txt_handle),
+            ("words", self._words_handle),
+        )
+        for key, handle in handles:
             if handle:
+                result[key] = handle.tell()
+        return result
+
+    @property
+    def segment_count(self) -> int:
+        return self._counter
+
+    def close(self):
+        for handle in (self._srt_handle, self._vtt_handle, self._txt_handle, self._words_handle):
+            if handle and not handle.closed:
                 handle.flush()
                 handle.close()
 
@@ -108,41 +258,69 @@ def ensure_ffmpeg() -> None:
         )
 
 
-def detect_device(device: str, compute_type: Optional[str]) -> Tuple[str, str]:
-    """Pick CUDA as the only supported device and ensure it is actually available."""
+CUDA_DEFAULT_COMPUTE_TYPE = "float16"
+CPU_DEFAULT_COMPUTE_TYPE = "int8"
+CPU_COMPUTE_TYPES = ("int8", "int8_float32", "float32")
 
-    def _has_cuda():
+
+def has_cuda() -> bool:
+    try:
+        import ctranslate2
+
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+def available_cpu_count() -> int:
+    """Cores this process may run on (honours affinity masks / container cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
         try:
-            import ctranslate2
-            # Try multiple methods to detect CUDA
-            if hasattr(ctranslate2, 'get_cuda_device_count'):
-                return ctranslate2.get_cuda_device_count() > 0
-            elif hasattr(ctranslate2, 'has_cuda'):
-                return ctranslate2.has_cuda()
-            else:
-                # Fallback: try to use cuda and catch exception
-                try:
-                    from faster_whisper import WhisperModel
-                    # This will fail if CUDA not available
-                    return True
-                except Exception:
-                    return False
-        except Exception:
-            return False
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    return max(1, os.cpu_count() or 1)
 
-    has_cuda = _has_cuda()
-    desired = device or "cuda"
 
-    if desired != "cuda":
-        raise RuntimeError("This pipeline now supports CUDA-only execution; remove custom --device values.")
+def cpu_worker_layout(workers: int = 1, threads: int = 0) -> Tuple[int, int]:
+    """Split the available cores into (num_workers, cpu_threads per worker).
 
-    if not has_cuda:
-        raise RuntimeError(
-            "CUDA runtime not detected. Install the CUDA build of ctranslate2/faster-whisper or fix GPU drivers."
-        )
+    ``threads <= 0`` means auto: every worker gets an equal share of the cores so
+    parallel decoders don't oversubscribe the machine.
+    """
+    cores = available_cpu_count()
+    workers = max(1, min(int(workers or 1), cores))
+    if threads and threads > 0:
+        return workers, int(threads)
+    return workers, max(1, cores // workers)
+
+
+def detect_device(device: Optional[str], compute_type: Optional[str]) -> Tuple[str, str]:
+    """Resolve ``auto``/``cuda``/``cpu`` to a concrete device and a compute type it supports.
+
+    ``auto`` prefers CUDA and falls back to CPU when no GPU runtime is present; an explicit
+    ``cuda`` request still fails loudly. On CPU, GPU-only precisions are replaced with int8.
+    """
 
-    chosen_compute = compute_type or "float16"
-    return "cuda", chosen_compute
+    desired = (device or "auto").lower()
+    if desired not in ("auto", "cuda", "cpu"):
+        raise RuntimeError(f"Unsupported device '{device}'; use auto, cuda or cpu.")
+    requested = None if compute_type in (None, "", "auto") else compute_type
+
+    if desired in ("auto", "cuda"):
+        if has_cuda():
+            return "cuda", requested or CUDA_DEFAULT_COMPUTE_TYPE
+        if desired == "cuda":
+            raise RuntimeError(
+                "CUDA runtime not detected. Install the CUDA build of ctranslate2/faster-whisper, fix GPU drivers, "
+                "or run with --device cpu."
+            )
+        log_warn("CUDA runtime not detected; running Whisper on CPU")
+
+    if requested and requested not in CPU_COMPUTE_TYPES:
+        log_warn(f"compute_type={requested} is not supported on CPU; using {CPU_DEFAULT_COMPUTE_TYPE}")
+        requested = None
+    return "cpu", requested or CPU_DEFAULT_COMPUTE_TYPE
 
 
 def ensure_cuda_dlls_available():
@@ -314,6 +492,87 @@ def write_txt(segments, path: Path):
     text = " ".join((seg.text or "").strip() for seg in segments)
     path.write_text(text, encoding="utf-8")
 
+
+WHISPER_SAMPLE_RATE = 16000
+
+
+def read_audio_16k(audio_path: Path, start: float = 0.0, end: Optional[float] = None) -> np.ndarray:
+    """Read ``[start, end)`` seconds of ``audio_path`` as 16 kHz mono float32 for Whisper.
+
+    Downmixes and resamples one block at a time into a preallocated output, so
+    only the 16 kHz result is ever held in full (resuming deep into a long VOD
+    would otherwise materialise the whole tail at the source rate first).
+    """
+    from streamcraft.core.audio_source import AudioSource
+    from streamcraft.core.resample import PolyphaseResampler
+
+    with AudioSource(audio_path) as source:
+        start_idx = source.index(start)
+        end_idx = source.frames if end is None else max(start_idx, source.index(end))
+        resampler = PolyphaseResampler(source.sample_rate, WHISPER_SAMPLE_RATE)
+        out = np.empty(resampler.output_length(end_idx - start_idx), dtype=np.float32)
+        pos = 0
+        for block_start in range(start_idx, end_idx, source.block_frames):
+            piece = resampler.process(source.mono(block_start, min(end_idx, block_start + source.block_frames)))
+            out[pos : pos + piece.size] = piece
+            pos += piece.size
+        tail = resampler.flush()
+        out[pos : pos + tail.size] = tail
+    return out
+
+
+# Decoder settings shared by the single-stream and chunked transcription paths.
+DECODE_OPTIONS = {
+    "vad_filter": True,
+    "beam_size": 5,
+    "best_of": 5,
+    "patience": 1,
+    "word_timestamps": True,
+}
+
+
+def clip_regions(
+    regions: Sequence[Tuple[float, float]], start: float = 0.0, end: Optional[float] = None
+) -> List[Tuple[float, float]]:
+    """Intersect speech regions with ``[start, end)``."""
+    clipped = []
+    for region_start, region_end in regions:
+        region_start = max(region_start, start)
+        if end is not None:
+            region_end = min(region_end, end)
+        if region_end > region_start:
+            clipped.append((region_start, region_end))
+    return clipped
+
+
+def decode_speech_regions(model, audio_path: Path, regions: Sequence[Tuple[float, float]], language: str):
+    """Decode only ``regions`` of ``audio_path``, returning segments on the original timeline.
+
+    The regions are concatenated and fed to Whisper with its own VAD disabled; timestamps
+    are mapped back with faster-whisper's ``restore_speech_timestamps``, the same mapping
+    its built-in VAD filter uses.
+    """
+    from faster_whisper.transcribe import restore_speech_timestamps
+
+    pieces = []
+    chunks = []
+    for start, end in regions:
+        piece = read_audio_16k(audio_path, start, end)
+        if piece.size == 0:
+            continue
+        offset = max(int(round(start * WHISPER_SAMPLE_RATE)), chunks[-1]["end"] if chunks else 0)
+        pieces.append(piece)
+        chunks.append({"start": offset, "end": offset + piece.size})
+    if not pieces:
+        return iter(()), None
+    segments, info = model.transcribe(
+        np.concatenate(pieces),
+        language=None if language == "auto" else language,
+        **{**DECODE_OPTIONS, "vad_filter": False},
+    )
+    return restore_speech_timestamps(segments, chunks, WHISPER_SAMPLE_RATE), info
+
+
 def transcribe(
     audio_path: Path,
     model_size: str,
@@ -324,27 +583,67 @@ def transcribe(
     progress_interval: float,
     live_writer: Optional[LiveSubtitleWriter] = None,
     max_duration: Optional[float] = None,
+    start_offset: float = 0.0,
+    speech_regions: Optional[Sequence[Tuple[float, float]]] = None,
 ):
     device, compute_type = detect_device(device, compute_type)
-    if device == "cuda":
-        ensure_cuda_dlls_available()
-    log(f"Loading faster-whisper model={model_size} device={device} compute_type={compute_type} threads={threads}")
-    model = WhisperModel(model_size, device=device, compute_type=compute_type, cpu_threads=threads)
+    if device == "cpu":
+        _, threads = cpu_worker_layout(1, threads)
+    with get_model_pool().lease(model_size, device, compute_type, threads) as model:
+        return _transcribe_with_model(
+            model,
+            audio_path,
+            language,
+            device,
+            compute_type,
+            threads,
+            progress_interval,
+            live_writer=live_writer,
+            max_duration=max_duration,
+            start_offset=start_offset,
+            speech_regions=speech_regions,
+        )
 
-    segments, info = model.transcribe(
-        str(audio_path),
-        language=None if language == "auto" else language,
-        vad_filter=True,
-        beam_size=5,
-        best_of=5,
-        patience=1,
-        word_timestamps=True,
-    )
 
-    total = info.duration or 0.0
+def _transcribe_with_model(
+    model,
+    audio_path: Path,
+    language: str,
+    device: str,
+    compute_type: str,
+    threads: int,
+    progress_interval: float,
+    live_writer: Optional[LiveSubtitleWriter] = None,
+    max_duration: Optional[float] = None,
+    start_offset: float = 0.0,
+    speech_regions: Optional[Sequence[Tuple[float, float]]] = None,
+):
     limit = max_duration if max_duration and max_duration > 0 else None
-    seen = 0.0
-    last_emit = 0.0
+    if speech_regions is not None:
+        # Precomputed VAD (e.g. from sanitize): decode speech spans only, already on the full timeline.
+        import soundfile as sf
+
+        regions = clip_regions(speech_regions, start_offset, limit)
+        total = float(sf.info(str(audio_path)).duration)
+        log(
+            f"Decoding {len(regions)} speech regions "
+            f"({sum(e - s for s, e in regions):.1f}s of {total - start_offset:.1f}s remaining audio)"
+        )
+        segments, info = decode_speech_regions(model, audio_path, regions, language)
+        segment_offset = 0.0
+    else:
+        # Resuming decodes only the tail; timestamps are shifted back onto the full timeline.
+        source = read_audio_16k(audio_path, start_offset) if start_offset > 0 else str(audio_path)
+        segments, info = model.transcribe(
+            source,
+            language=None if language == "auto" else language,
+            **DECODE_OPTIONS,
+        )
+        total = (info.duration or 0.0) + start_offset
+        segment_offset = start_offset
+
+    seen = start_offset
+    last_emit = start_offset
     seg_list = []
 
     print("\n" + "="*80)
@@ -352,27 +651,27 @@ def transcribe(
     print("="*80)
 
     for seg in segments:
-        cleaned = (seg.text or "").strip()
-        segment = Segment(start=seg.start, end=seg.end, text=cleaned)
+        segment = segment_from_whisper(seg, segment_offset)
+        cleaned = segment.text
         seg_list.append(segment)
 
         if live_writer:
             live_writer.write_segment(segment)
         
         # Format timestamp range
-        start_ts = format_timestamp(seg.start)
-        end_ts = format_timestamp(seg.end)
+        start_ts = format_timestamp(segment.start)
+        end_ts = format_timestamp(segment.end)
         timestamp = f"{start_ts} -> {end_ts}"
         
         # Print segment in real-time
         print(f"{timestamp:<20} | {cleaned}")
 
-        if limit is not None and seg.end >= limit:
+        if limit is not None and segment.end >= limit:
             log_warn(f"Reached max-duration limit ({limit:.1f}s); stopping early")
             break
         
         if total > 0:
-            seen = seg.end
+            seen = segment.end
             if seen - last_emit >= progress_interval or seen >= total:
                 pct = min(100.0, seen / total * 100.0)
                 print(f"[progress] {seen:8.1f}s / {total:8.1f}s ({pct:5.1f}%)", flush=True)
@@ -380,18 +679,29 @@ def transcribe(
 
     print("="*80)
     log_ok(f"Transcribed {len(seg_list)} segments")
-    processed = seg_list[-1].end if seg_list else 0.0
+    processed = seg_list[-1].end if seg_list else start_offset
     meta = {
-        "language": info.language,
-        "duration": info.duration,
+        "language": info.language if info else (None if language == "auto" else language),
+        "duration": total,
         "processed_duration": processed,
         "device": device,
         "compute_type": compute_type,
+        "cpu_threads": threads,
         "segments": len(seg_list),
     }
     return seg_list, meta
 
 
+def regions_digest(regions: Optional[Sequence[Tuple[float, float]]]) -> Optional[str]:
+    """Stable short hash of a region list (None when decoding the whole file)."""
+    if regions is None:
+        return None
+    import hashlib
+
+    payload = json.dumps([[round(s, 3), round(e, 3)] for s, e in regions])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+
+
 def save_metadata(meta: Dict, path: Path):
     path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
 
@@ -411,7 +721,14 @@ def run_transcription(
     also_txt: bool,
     force: bool,
     max_duration: Optional[float],
+    chunk_workers: int = 0,
+    speech_regions: Optional[Sequence[Tuple[float, float]]] = None,
 ):
+    """Download/extract, transcribe and write SRT (+VTT/TXT, word index) for one VOD.
+
+    ``speech_regions`` (seconds on the audio timeline, e.g. from the sanitize VAD pass)
+    restricts decoding to those spans instead of running Whisper's own VAD on everything.
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
 
     if vod.startswith("http"):
@@ -428,44 +745,160 @@ def run_transcription(
     txt_path = out_dir / f"{media_path.stem}.txt"
     meta_path = out_dir / f"{media_path.stem}.meta.json"
 
-    def cleanup_partial_outputs():
-        for path in (srt_path, vtt_path, txt_path):
-            try:
-                path.unlink(missing_ok=True)
-            except Exception:
-                pass
+    checkpoint_path = out_dir / f"{media_path.stem}.checkpoint.json"
+    words_spool_path, words_index_path, words_text_path = word_index_paths(out_dir, media_path.stem)
 
-    def run_once(run_device: str, run_compute: Optional[str]):
+    regions = None
+    if speech_regions is not None:
+        import soundfile as sf
+
+        from streamcraft.core.speech_regions import normalize_regions
+
+        audio_duration = float(sf.info(str(audio_path)).duration)
+        regions = normalize_regions(speech_regions, duration=audio_duration)
+        covered = sum(end - start for start, end in regions)
+        log(f"Using {len(regions)} precomputed speech regions ({covered:.1f}s of {audio_duration:.1f}s)")
+
+    # Everything that changes the decoder output keys the cache; the outputs only gate resumes.
+    device, compute_type = detect_device(device, compute_type)
+    decode_params = {
+        "model": model,
+        "compute_type": compute_type,
+        "language": language,
+        "decode": DECODE_OPTIONS,
+        "max_duration": max_duration,
+        "speech_regions": regions_digest(regions),
+    }
+    cache = get_transcript_cache()
+    audio_hash = cache.audio_fingerprint(audio_path)
+    cache_key = cache.make_key(audio_hash, decode_params)
+    params = {
+        **decode_params,
+        "audio": audio_hash,
+        "outputs": {"vtt": also_vtt, "txt": also_txt, "words": True},
+    }
+
+    checkpoint = None if force else TranscriptionCheckpoint.load(checkpoint_path)
+    if checkpoint and not checkpoint.matches(params):
+        log_warn(f"Checkpoint parameters changed; restarting transcription: {checkpoint_path}")
+        checkpoint = None
+    if checkpoint and not srt_path.exists():
+        log_warn(f"Checkpoint has no matching SRT; restarting transcription: {checkpoint_path}")
+        checkpoint = None
+
+    skip_existing = not force and srt_path.exists() and (checkpoint is None or checkpoint.complete)
+    if skip_existing and checkpoint is None:
+        previous_key = None
+        try:
+            previous_key = json.loads(meta_path.read_text(encoding="utf-8")).get("cache_key")
+        except (OSError, ValueError):
+            pass
+        if previous_key and previous_key != cache_key:
+            # The SRT was produced from different audio or decoder settings.
+            log_warn(f"SRT is stale for the current audio/settings; transcribing again: {srt_path}")
+            skip_existing = False
+
+    def run_once(run_device: str, run_compute: Optional[str], run_checkpoint: TranscriptionCheckpoint):
+        start_offset = run_checkpoint.last_end if run_checkpoint.segments > 0 else 0.0
+        if start_offset > 0:
+            log(
+                f"Resuming transcription at {format_timestamp(start_offset)} "
+                f"after {run_checkpoint.segments} committed segments"
+            )
         writer = LiveSubtitleWriter(
             srt_path=srt_path,
             vtt_path=vtt_path if also_vtt else None,
             txt_path=txt_path if also_txt else None,
+            checkpoint=run_checkpoint,
+            words_path=words_spool_path,
         )
         try:
-            segments, meta = transcribe(
-                audio_path,
-                model,
-                language,
-                threads,
-                run_device,
-                run_compute,
-                progress_interval,
-                live_writer=writer,
-                max_duration=max_duration,
-            )
+            if chunk_workers > 0:
+                from streamcraft.core.transcribe_chunked import transcribe_chunked
+
+                segments, meta = transcribe_chunked(
+                    audio_path,
+                    model,
+                    language,
+                    threads,
+                    run_device,
+                    run_compute,
+                    chunk_workers,
+                    live_writer=writer,
+                    max_duration=max_duration,
+                    start_offset=start_offset,
+                    speech_regions=regions,
+                )
+            else:
+                segments, meta = transcribe(
+                    audio_path,
+                    model,
+                    language,
+                    threads,
+                    run_device,
+                    run_compute,
+                    progress_interval,
+                    live_writer=writer,
+                    max_duration=max_duration,
+                    start_offset=start_offset,
+                    speech_regions=regions,
+                )
+            if start_offset > 0:
+                meta["resumed_from"] = start_offset
+            meta["segments"] = writer.segment_count
             return segments, meta, writer
         except Exception:
             writer.close()
             raise
 
-    if not force and srt_path.exists():
+    required_outputs = [".srt", ".words.npz", ".words.txt"]
+    if also_vtt:
+        required_outputs.append(".vtt")
+    if also_txt:
+        required_outputs.append(".txt")
+    cached_meta = None
+    if not skip_existing and not force:
+        cached_meta = cache.restore(cache_key, out_dir, media_path.stem, required=required_outputs)
+
+    if skip_existing:
+        # Without a checkpoint the SRT predates checkpointing (or was supplied by hand).
         log_warn(f"SRT exists, skipping transcription: {srt_path}")
+    elif cached_meta is not None:
+        meta = dict(cached_meta)
+        meta["srt"] = str(srt_path)
+        if also_vtt:
+            meta["vtt"] = str(vtt_path)
+        if also_txt:
+            meta["txt"] = str(txt_path)
+        meta["words_index"] = str(words_index_path)
+        meta["audio"] = str(audio_path)
+        meta["audio_full"] = str(audio_full_path)
+        meta["media"] = str(media_path)
+        meta["cache_key"] = cache_key
+        meta["cache_hit"] = True
+        save_metadata(meta, meta_path)
+        TranscriptionCheckpoint(
+            checkpoint_path,
+            params,
+            last_end=float(meta.get("processed_duration") or 0.0),
+            segments=int(meta.get("segments") or 0),
+            complete=True,
+        ).save()
+        stats = cache.stats()
+        log_ok(f"Transcript cache hit ({stats['hits']} hits / {stats['misses']} misses); restored {srt_path}")
     else:
+        if checkpoint is None or checkpoint.complete:
+            checkpoint = TranscriptionCheckpoint(checkpoint_path, params)
+            checkpoint.save()
         writer = None
         try:
-            segments, meta, writer = run_once(device, compute_type)
+            segments, meta, writer = run_once(device, compute_type, checkpoint)
         except Exception:
-            cleanup_partial_outputs()
+            # Partial outputs stay on disk; the checkpoint lets the next run pick up from here.
+            log_warn(
+                f"Transcription interrupted after {format_timestamp(checkpoint.last_end)}; "
+                f"re-run to resume from {checkpoint_path}"
+            )
             raise
         finally:
             if writer:
@@ -485,10 +918,18 @@ def run_transcription(
                 write_txt(segments, txt_path)
             meta["txt"] = str(txt_path)
 
+        word_count = build_word_index(words_spool_path, words_index_path, words_text_path, meta.get("language"))
+        words_spool_path.unlink(missing_ok=True)
+        meta["words_index"] = str(words_index_path)
+        meta["words"] = word_count
+
         meta["audio"] = str(audio_path)
         meta["audio_full"] = str(audio_full_path)
         meta["media"] = str(media_path)
+        meta["cache_key"] = cache_key
         save_metadata(meta, meta_path)
+        checkpoint.mark_complete()
+        cache.store(cache_key, out_dir, media_path.stem, meta)
         log_ok(f"Saved SRT to {srt_path}")
 
     if mux_subs:
@@ -0,0 +1,294 @@
+"""Chunked, multi-process transcription for long VODs.
+
+A single faster-whisper generator decodes a multi-hour file strictly
+sequentially. This module instead:
+
+- scans a cheap RMS envelope of the audio and cuts it at long silences into
+  chunks of roughly 10-20 minutes, each padded with a small overlap,
+- decodes the chunks in a process pool (one model per worker process),
+- keeps each segment only in the chunk that "owns" its midpoint, which drops
+  the duplicates produced by the overlaps,
+- hands segments to the ``LiveSubtitleWriter`` in timeline order as soon as
+  every earlier chunk has finished.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.transcribe import (
+    DECODE_OPTIONS,
+    LiveSubtitleWriter,
+    Segment,
+    clip_regions,
+    cpu_worker_layout,
+    decode_speech_regions,
+    detect_device,
+    format_timestamp,
+    log,
+    log_ok,
+    log_warn,
+    read_audio_16k,
+    segment_from_whisper,
+)
+
+ENVELOPE_HOP_SEC = 0.1
+
+
+@dataclass
+class AudioChunk:
+    index: int
+    start: float  # decode window, including overlap
+    end: float
+    own_start: float  # segments whose midpoint lies in [own_start, own_end) belong to this chunk
+    own_end: float
+
+
+def _energy_envelope(audio_path: Path, hop_sec: float = ENVELOPE_HOP_SEC) -> Tuple[np.ndarray, float]:
+    """Per-hop RMS (dB) of the mono mix, read block-wise so memory stays flat."""
+    info = sf.info(str(audio_path))
+    hop = max(1, int(round(info.samplerate * hop_sec)))
+    levels: List[np.ndarray] = []
+    for block in sf.blocks(str(audio_path), blocksize=hop * 600, dtype="float32", always_2d=True):
+        mono = block.mean(axis=1)
+        usable = (len(mono) // hop) * hop
+        if usable:
+            framed = mono[:usable].reshape(-1, hop)
+            levels.append(np.sqrt(np.mean(framed * framed, axis=1) + 1e-12))
+        if usable < len(mono):
+            tail = mono[usable:]
+            levels.append(np.array([np.sqrt(np.mean(tail * tail) + 1e-12)], dtype=np.float32))
+    if not levels:
+        return np.array([], dtype=np.float32), float(info.duration)
+    rms = np.concatenate(levels)
+    return (20 * np.log10(rms + 1e-12)).astype(np.float32), float(info.duration)
+
+
+def plan_chunks(
+    env_db: np.ndarray,
+    duration: float,
+    hop_sec: float = ENVELOPE_HOP_SEC,
+    min_sec: float = 600.0,
+    target_sec: float = 900.0,
+    max_sec: float = 1200.0,
+    overlap_sec: float = 2.0,
+) -> List[AudioChunk]:
+    """Cut the timeline at the longest silence within [min_sec, max_sec] of each chunk start."""
+    cuts: List[float] = [0.0]
+    if env_db.size:
+        # Relative to the file's own floor, but never within 10 dB of the typical level so
+        # dense speech over constant background audio is not mistaken for silence.
+        floor_db = float(np.percentile(env_db, 10))
+        threshold_db = min(floor_db + 6.0, float(np.median(env_db)) - 10.0)
+        silent = env_db <= threshold_db
+    else:
+        silent = np.zeros(0, dtype=bool)
+
+    cursor = 0.0
+    while duration - cursor > max_sec:
+        lo = int((cursor + min_sec) / hop_sec)
+        hi = min(len(silent), int((cursor + max_sec) / hop_sec))
+        cut = cursor + target_sec
+        window = silent[lo:hi]
+        if window.any():
+            padded = np.concatenate(([False], window, [False])).astype(np.int8)
+            edges = np.diff(padded)
+            run_starts = np.flatnonzero(edges == 1)
+            run_ends = np.flatnonzero(edges == -1)
+            lengths = run_ends - run_starts
+            mids = (run_starts + run_ends) / 2.0
+            target_idx = (cursor + target_sec) / hop_sec - lo
+            # Longest silence wins; ties go to the one closest to the target length.
+            best = max(range(len(lengths)), key=lambda i: (lengths[i], -abs(mids[i] - target_idx)))
+            cut = float((lo + mids[best]) * hop_sec)
+        cuts.append(cut)
+        cursor = cut
+    cuts.append(float(duration))
+
+    chunks: List[AudioChunk] = []
+    for idx in range(len(cuts) - 1):
+        own_start, own_end = cuts[idx], cuts[idx + 1]
+        chunks.append(
+            AudioChunk(
+                index=idx,
+                start=max(0.0, own_start - overlap_sec),
+                end=min(duration, own_end + overlap_sec),
+                own_start=own_start,
+                own_end=own_end,
+            )
+        )
+    return chunks
+
+
+# Worker-process state: one model per process, loaded by the pool initializer.
+_worker_model = None
+
+
+def _init_worker(model_size: str, device: str, compute_type: str, cpu_threads: int) -> None:
+    global _worker_model
+    from streamcraft.core.whisper_pool import get_model_pool
+
+    _worker_model = get_model_pool().acquire(model_size, device, compute_type, cpu_threads)
+
+
+def _transcribe_chunk(
+    audio_path: str,
+    chunk: AudioChunk,
+    language: str,
+    speech_regions: Optional[List[Tuple[float, float]]] = None,
+) -> Tuple[int, List[Segment], Optional[str]]:
+    if speech_regions is not None:
+        regions = clip_regions(speech_regions, chunk.start, chunk.end)
+        segments, info = decode_speech_regions(_worker_model, Path(audio_path), regions, language)
+        offset = 0.0
+    else:
+        samples = read_audio_16k(Path(audio_path), chunk.start, chunk.end)
+        if samples.size == 0:
+            return chunk.index, [], None
+        segments, info = _worker_model.transcribe(
+            samples,
+            language=None if language == "auto" else language,
+            **DECODE_OPTIONS,
+        )
+        offset = chunk.start
+    owned: List[Segment] = []
+    for seg in segments:
+        segment = segment_from_whisper(seg, offset)
+        mid = (segment.start + segment.end) / 2.0
+        if not (chunk.own_start <= mid < chunk.own_end):
+            continue
+        owned.append(segment)
+    return chunk.index, owned, info.language if info else None
+
+
+def _stitch(segments: List[Segment], last_end: float) -> Tuple[List[Segment], float]:
+    """Clamp a chunk's segments so the stitched timeline never goes backwards."""
+    stitched: List[Segment] = []
+    for seg in segments:
+        if seg.end <= last_end:
+            continue
+        if seg.start < last_end:
+            seg = replace(seg, start=last_end)
+        stitched.append(seg)
+        last_end = seg.end
+    return stitched, last_end
+
+
+def transcribe_chunked(
+    audio_path: Path,
+    model_size: str,
+    language: str,
+    threads: int,
+    device: str,
+    compute_type: Optional[str],
+    workers: int,
+    live_writer: Optional[LiveSubtitleWriter] = None,
+    max_duration: Optional[float] = None,
+    min_chunk_sec: float = 600.0,
+    target_chunk_sec: float = 900.0,
+    max_chunk_sec: float = 1200.0,
+    overlap_sec: float = 2.0,
+    start_offset: float = 0.0,
+    speech_regions: Optional[List[Tuple[float, float]]] = None,
+):
+    """Transcribe ``audio_path`` in silence-aligned chunks across ``workers`` processes.
+
+    ``start_offset`` skips audio that a resumed run already committed; ``speech_regions``
+    restricts decoding to precomputed speech spans. Returns ``(segments, meta)`` like
+    ``transcribe``.
+    """
+    device, compute_type = detect_device(device, compute_type)
+    if device == "cpu":
+        workers, threads = cpu_worker_layout(workers, threads)
+    workers = max(1, workers)
+
+    env_db, duration = _energy_envelope(audio_path)
+    limit = max_duration if max_duration and max_duration > 0 else None
+    chunks = plan_chunks(
+        env_db,
+        min(duration, limit) if limit is not None else duration,
+        min_sec=min_chunk_sec,
+        target_sec=target_chunk_sec,
+        max_sec=max_chunk_sec,
+        overlap_sec=overlap_sec,
+    )
+    if start_offset > 0:
+        chunks = [c for c in chunks if c.own_end > start_offset]
+        for new_index, chunk in enumerate(chunks):
+            chunk.index = new_index
+        if chunks:
+            chunks[0].own_start = max(chunks[0].own_start, start_offset)
+            chunks[0].start = max(chunks[0].start, start_offset)
+    log(
+        f"Chunked transcription: {len(chunks)} chunk(s) over {duration:.1f}s, "
+        f"workers={workers} device={device} compute_type={compute_type} threads/worker={threads}"
+    )
+
+    results: Dict[int, List[Segment]] = {}
+    languages: Dict[int, Optional[str]] = {}
+    seg_list: List[Segment] = []
+    next_index = 0
+    last_end = start_offset
+    started = time.perf_counter()
+
+    def flush_ready() -> None:
+        nonlocal next_index, last_end
+        while next_index in results:
+            stitched, last_end = _stitch(results.pop(next_index), last_end)
+            for seg in stitched:
+                seg_list.append(seg)
+                if live_writer:
+                    live_writer.write_segment(seg)
+                print(f"{format_timestamp(seg.start)} -> {format_timestamp(seg.end)} | {seg.text}")
+            chunk = chunks[next_index]
+            pct = min(100.0, chunk.own_end / max(duration, 1e-9) * 100.0)
+            print(f"[progress] {chunk.own_end:8.1f}s / {duration:8.1f}s ({pct:5.1f}%)", flush=True)
+            next_index += 1
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)) or 1,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(model_size, device, compute_type, threads),
+    ) as pool:
+        pending = {pool.submit(_transcribe_chunk, str(audio_path), chunk, language, speech_regions): chunk for chunk in chunks}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    chunk = pending.pop(fut)
+                    index, owned, chunk_language = fut.result()
+                    results[index] = owned
+                    languages[index] = chunk_language
+                    log(f"Chunk {index + 1}/{len(chunks)} done ({chunk.own_start:.0f}s-{chunk.own_end:.0f}s, {len(owned)} segments)")
+                flush_ready()
+        except BaseException:
+            # Drop the queued chunks instead of letting the with-block decode them all first.
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if limit is not None and seg_list and seg_list[-1].end >= limit:
+        log_warn(f"Reached max-duration limit ({limit:.1f}s); stopping early")
+    elapsed = time.perf_counter() - started
+    log_ok(f"Transcribed {len(seg_list)} segments in {elapsed:.1f}s across {len(chunks)} chunk(s)")
+
+    detected = next((languages[i] for i in sorted(languages) if languages[i]), None)
+    meta = {
+        "language": detected if language == "auto" else language,
+        "duration": duration,
+        "processed_duration": seg_list[-1].end if seg_list else start_offset,
+        "device": device,
+        "compute_type": compute_type,
+        "cpu_threads": threads,
+        "segments": len(seg_list),
+        "chunks": len(chunks),
+        "chunk_workers": workers,
+    }
+    return seg_list, meta
@@ -0,0 +1,195 @@
+"""Content-addressed cache of finished transcriptions.
+
+Entries are keyed by a hash of the *decoded* audio samples plus every setting
+that changes the decoder output (model, compute type, language, beam/VAD
+options, duration limit), so the same VOD reached through another URL, job or
+local path is served from the cache, while changed audio never reuses a stale
+transcript.
+
+Layout under ``temp/cache/transcripts``::
+
+    <key>/transcript.srt|.vtt|.txt|.words.npz|.words.txt|.meta.json
+    fingerprints.db     # path -> (size, mtime, audio hash) memo, shared with the feature cache
+    stats.json          # cumulative hit / miss counters
+
+Entries past ``transcript_cache_budget_mb`` are evicted least recently used first.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import soundfile as sf
+
+from streamcraft.core.cache_budget import evict_to_budget, touch
+from streamcraft.paths import get_paths
+
+AUDIO_HASH_BLOCK_FRAMES = 1 << 20
+CACHED_SUFFIXES = (".srt", ".vtt", ".txt", ".words.npz", ".words.txt")
+ENTRY_PATTERN = "?" * 40  # hex blake2b keys; skips the memo, stats and staging directories
+FINGERPRINT_DB = "fingerprints.db"
+BUSY_TIMEOUT_SEC = 5.0
+
+
+def _hash_decoded_audio(audio_path: Path) -> str:
+    """blake2b over the decoded PCM (container/header changes don't alter the hash)."""
+    info = sf.info(str(audio_path))
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{info.samplerate}:{info.channels}:{info.frames}".encode("ascii"))
+    for block in sf.blocks(str(audio_path), blocksize=AUDIO_HASH_BLOCK_FRAMES, dtype="int16", always_2d=True):
+        digest.update(block.tobytes())
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Filesystem transcript cache with persistent hit/miss counters."""
+
+    def __init__(self, root: Path, budget_bytes: int = 0):
+        self.root = root
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+
+    # Fingerprints --------------------------------------------------------
+
+    def audio_fingerprint(self, audio_path: Path) -> str:
+        """Hash of the decoded audio, memoised by (path, size, mtime) so reruns skip the read."""
+        stat = audio_path.stat()
+        path = str(audio_path.resolve())
+        with self._lock, closing(self._fingerprint_db()) as conn:
+            row = conn.execute(
+                "SELECT hash FROM fingerprints WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns),
+            ).fetchone()
+        if row is not None:
+            return row[0]
+        fingerprint = _hash_decoded_audio(audio_path)
+        with self._lock, closing(self._fingerprint_db()) as conn:
+            with conn:
+                # One row per path: a rewritten file replaces its old hash instead of adding one.
+                conn.execute(
+                    "INSERT OR REPLACE INTO fingerprints (path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, fingerprint),
+                )
+                known = [row[0] for row in conn.execute("SELECT path FROM fingerprints")]
+                conn.executemany(
+                    "DELETE FROM fingerprints WHERE path = ?",
+                    [(gone,) for gone in known if not os.path.exists(gone)],
+                )
+        return fingerprint
+
+    def _fingerprint_db(self) -> sqlite3.Connection:
+        db_path = self.root / FINGERPRINT_DB
+        if not db_path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            # The JSON memo this table replaces; its hashes are recomputed on first use.
+            (self.root / "fingerprints.json").unlink(missing_ok=True)
+        conn = sqlite3.connect(str(db_path), timeout=BUSY_TIMEOUT_SEC)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints"
+            " (path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, hash TEXT NOT NULL)"
+        )
+        return conn
+
+    @staticmethod
+    def make_key(audio_hash: str, params: Dict) -> str:
+        """Cache key for ``audio_hash`` decoded with ``params`` (model, compute type, decode options...)."""
+        payload = json.dumps({"audio": audio_hash, **params}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    # Entries -------------------------------------------------------------
+
+    def entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def restore(self, key: str, out_dir: Path, stem: str, required: Sequence[str] = (".srt",)) -> Optional[Dict]:
+        """Materialise a cached transcript as ``<out_dir>/<stem>.*``; returns its meta or None.
+
+        An entry missing any of the ``required`` outputs counts as a miss.
+        """
+        entry = self.entry_dir(key)
+        meta_path = entry / "transcript.meta.json"
+        if not meta_path.exists() or not all((entry / f"transcript{suffix}").exists() for suffix in required):
+            self._count("misses")
+            return None
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for suffix in CACHED_SUFFIXES:
+            src = entry / f"transcript{suffix}"
+            if src.exists():
+                # Copies, not hardlinks: live writers reopen these outputs with truncation.
+                shutil.copy2(src, out_dir / f"{stem}{suffix}")
+        touch(entry)
+        self._count("hits")
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def store(self, key: str, out_dir: Path, stem: str, meta: Dict) -> None:
+        entry = self.entry_dir(key)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: two runs storing the same key must not share a staging directory.
+        staging = Path(tempfile.mkdtemp(dir=self.root, prefix=f"{key}.", suffix=".tmp"))
+        try:
+            for suffix in CACHED_SUFFIXES:
+                src = out_dir / f"{stem}{suffix}"
+                if src.exists():
+                    shutil.copy2(src, staging / f"transcript{suffix}")
+            (staging / "transcript.meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            shutil.rmtree(entry, ignore_errors=True)
+            try:
+                staging.replace(entry)
+            except OSError:
+                # Another writer put the same key in place first; its entry is just as good.
+                shutil.rmtree(staging, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        evict_to_budget(self.root, ENTRY_PATTERN, self.budget_bytes, keep=entry)
+
+    # Stats ---------------------------------------------------------------
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            data = self._read_json(self.root / "stats.json")
+        hits = int(data.get("hits", 0))
+        misses = int(data.get("misses", 0))
+        entries = sum(1 for p in self.root.iterdir() if p.is_dir() and not p.name.endswith(".tmp")) if self.root.exists() else 0
+        return {"hits": hits, "misses": misses, "entries": entries}
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            path = self.root / "stats.json"
+            data = self._read_json(path)
+            data[field] = int(data.get(field, 0)) + 1
+            self._write_json(path, data)
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+_cache: Optional[TranscriptCache] = None
+
+
+def get_transcript_cache() -> TranscriptCache:
+    """Get or create the process-wide transcript cache."""
+    global _cache
+    if _cache is None:
+        from streamcraft.settings import get_settings
+
+        _cache = TranscriptCache(get_paths().transcripts_cache_dir, get_settings().transcript_cache_budget_mb << 20)
+    return _cache
@@ -0,0 +1,360 @@
+"""UVR vocal isolation: a long-lived audio-separator worker plus a stem cache.
+
+The sanitize step used to check (and even ``pip install``) audio-separator on
+every request, then launch a fresh CLI that reloaded the BS-Roformer
+checkpoint and separated the whole VOD again. Now:
+
+* ``check_dependencies`` runs once at API startup (``importlib`` lookup, no pip);
+* ``UvrWorker`` keeps one ``python -m streamcraft.core.uvr`` subprocess with the
+  model loaded and feeds it jobs over stdin/stdout JSON lines (killing it is
+  how a separation is cancelled; the next job restarts it);
+* ``VocalStemCache`` stores stems under ``temp/cache/vocals`` keyed by the
+  decoded-audio hash of the input plus the model, and places them next to the
+  VOD by hardlink (or rename), never by copying through memory. Stems beyond
+  ``vocal_cache_budget_mb`` are evicted least-recently-used first, and purging
+  a job drops the entries linked to its stem.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from streamcraft.core.cache_budget import evict_to_budget, touch
+from streamcraft.paths import get_paths
+
+DEFAULT_MODEL = "model_bs_roformer_ep_317_sdr_12.9755.ckpt"
+STEM_NAME = "Vocals"
+
+
+# Dependencies --------------------------------------------------------------
+
+
+_available: Optional[bool] = None
+
+
+def check_dependencies() -> bool:
+    """Whether audio-separator is importable; resolved once (at startup) and memoised."""
+    global _available
+    if _available is None:
+        _available = importlib.util.find_spec("audio_separator") is not None
+    return _available
+
+
+def _has_cuda() -> bool:
+    try:
+        import torch
+
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+# Stem cache ----------------------------------------------------------------
+
+
+def place_file(src: Path, dst: Path, keep_source: bool) -> None:
+    """Put ``src`` at ``dst`` without reading it into memory.
+
+    Hardlinks when ``keep_source`` (falling back to a streamed copy across
+    filesystems), otherwise renames (falling back to ``shutil.move``).
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    # Unique per call: two threads placing the same stem must not share a tmp name.
+    tmp = dst.with_name(f"{dst.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if keep_source:
+            try:
+                os.link(src, tmp)
+            except OSError:
+                shutil.copyfile(src, tmp)
+        else:
+            try:
+                os.replace(src, tmp)
+            except OSError:
+                shutil.move(str(src), str(tmp))
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class VocalStemCache:
+    """Content-addressed cache of separated vocal stems, kept under an LRU byte budget."""
+
+    def __init__(self, root: Path, budget_bytes: int = 0):
+        self.root = root
+        self.budget_bytes = budget_bytes
+
+    @staticmethod
+    def make_key(audio_hash: str, model: str, params: Optional[Dict] = None) -> str:
+        """Cache key for ``model``'s stem of ``audio_hash``; ``params`` describe a non-default separation mode."""
+        payload = json.dumps({"audio": audio_hash, "model": model, "stem": STEM_NAME, **(params or {})}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.wav"
+
+    def staging_dir(self) -> Path:
+        return self.root / "staging"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        path = self.entry_path(key)
+        if not (path.exists() and path.stat().st_size > 0):
+            return None
+        touch(path)
+        return path
+
+    def store(self, key: str, stem: Path) -> Path:
+        """Move a freshly separated stem into the cache, evicting the least recently used stems over budget."""
+        path = self.entry_path(key)
+        place_file(stem, path, keep_source=False)
+        evict_to_budget(self.root, "*.wav", self.budget_bytes, keep=path)
+        return path
+
+    def discard_linked(self, placed: Path) -> int:
+        """Drop cache entries hardlinked to ``placed`` (a stem put next to a VOD); returns how many."""
+        if not placed.exists() or not self.root.exists():
+            return 0
+        dropped = 0
+        for path in self.root.glob("*.wav"):
+            try:
+                if os.path.samefile(path, placed):
+                    path.unlink()
+                    dropped += 1
+            except OSError:
+                continue
+        return dropped
+
+
+_cache: Optional[VocalStemCache] = None
+
+
+def get_vocal_cache() -> VocalStemCache:
+    global _cache
+    if _cache is None:
+        from streamcraft.settings import get_settings
+
+        _cache = VocalStemCache(get_paths().vocals_cache_dir, get_settings().vocal_cache_budget_mb << 20)
+    return _cache
+
+
+# Worker --------------------------------------------------------------------
+
+
+class UvrWorker:
+    """Client for one long-lived separator subprocess; one separation at a time."""
+
+    def __init__(self, model: str, output_dir: Path, use_cuda: Optional[bool] = None):
+        self.model = model
+        self.output_dir = output_dir
+        self.use_cuda = _has_cuda() if use_cuda is None else use_cuda
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self, on_line: Callable[[str], None]) -> subprocess.Popen:
+        if self.running:
+            return self._process
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        cmd = [sys.executable, "-m", "streamcraft.core.uvr", "--model", self.model, "--output-dir", str(self.output_dir)]
+        if self.use_cuda:
+            cmd.append("--autocast")
+        on_line(f"Starting separator worker ({'CUDA' if self.use_cuda else 'CPU'}, model={self.model})")
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        try:
+            self._read_until(lambda msg: msg.get("type") == "ready", on_line, None)
+        except Exception:
+            self.close()
+            raise
+        return self._process
+
+    def _read_until(
+        self,
+        done: Callable[[dict], bool],
+        on_line: Callable[[str], None],
+        should_cancel: Optional[Callable[[], bool]],
+    ) -> dict:
+        process = self._process
+        for raw in process.stdout:
+            if should_cancel and should_cancel():
+                self.close()
+                raise RuntimeError("Sanitize canceled by user")
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                msg = json.loads(raw)
+            except json.JSONDecodeError:
+                msg = {"type": "log", "line": raw}
+            if msg.get("type") == "log":
+                on_line(msg.get("line", ""))
+            elif msg.get("type") == "error":
+                raise RuntimeError(f"audio-separator failed: {msg.get('error')}")
+            if done(msg):
+                return msg
+        code = process.wait()
+        self._process = None
+        raise RuntimeError(f"Separator worker exited with code {code}")
+
+    def warmup(self, on_line: Callable[[str], None] = lambda line: None) -> None:
+        with self._lock:
+            self._start(on_line)
+
+    def separate(
+        self,
+        input_path: Path,
+        on_line: Callable[[str], None],
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> Path:
+        """Separate ``input_path``; returns the vocal stem inside ``output_dir``."""
+        with self._lock:
+            process = self._start(on_line)
+            try:
+                process.stdin.write(json.dumps({"input": str(input_path)}) + "\n")
+                process.stdin.flush()
+                msg = self._read_until(lambda m: m.get("type") == "done", on_line, should_cancel)
+            except (BrokenPipeError, OSError) as exc:
+                self.close()
+                raise RuntimeError(f"Separator worker died: {exc}")
+        files = [Path(f) if Path(f).is_absolute() else self.output_dir / f for f in msg.get("files", [])]
+        stems = [f for f in files if STEM_NAME.lower() in f.name.lower()] or files
+        if not stems or not stems[0].exists():
+            raise FileNotFoundError("Vocals stem not found after separation")
+        return stems[0]
+
+    def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except Exception:
+            pass
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except Exception:
+            process.kill()
+
+
+_worker: Optional[UvrWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_uvr_worker() -> UvrWorker:
+    """Get or create the process-wide separator worker for the configured model."""
+    global _worker
+    from streamcraft.settings import get_settings
+
+    with _worker_lock:
+        if _worker is None:
+            _worker = UvrWorker(get_settings().uvr_model, get_vocal_cache().staging_dir())
+        return _worker
+
+
+def startup_from_settings() -> bool:
+    """API startup hook: resolve the dependency check and optionally preload the model."""
+    from streamcraft.settings import get_settings
+
+    available = check_dependencies()
+    if available and get_settings().uvr_warmup:
+        get_uvr_worker().warmup()
+    return available
+
+
+# Worker process ------------------------------------------------------------
+
+
+class _JsonLines:
+    """File-like stderr replacement: every line / progress-bar redraw becomes a log message."""
+
+    def __init__(self, out, lock: threading.Lock):
+        self._out = out
+        self._lock = lock
+        self._buf = ""
+
+    def write(self, text: str) -> int:
+        self._buf += text
+        *lines, self._buf = self._buf.replace("\r", "\n").split("\n")
+        for line in lines:
+            if line.strip():
+                _send(self._out, self._lock, {"type": "log", "line": line.strip()})
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _send(out, lock: threading.Lock, msg: Dict) -> None:
+    with lock:
+        out.write(json.dumps(msg) + "\n")
+        out.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+    import logging
+
+    parser = argparse.ArgumentParser(description="audio-separator worker (JSON lines on stdin/stdout)")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--autocast", action="store_true")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout
+    lock = threading.Lock()
+    # Library logging and tqdm bars go to stderr; the protocol owns stdout.
+    sys.stderr = _JsonLines(out, lock)
+    sys.stdout = sys.stderr
+
+    try:
+        from audio_separator.separator import Separator
+
+        separator = Separator(
+            log_level=logging.INFO,
+            output_dir=args.output_dir,
+            output_format="WAV",
+            output_single_stem=STEM_NAME,
+            use_autocast=args.autocast,
+        )
+        separator.load_model(model_filename=args.model)
+    except Exception as exc:
+        _send(out, lock, {"type": "error", "error": f"model load failed: {exc}"})
+        sys.exit(1)
+    _send(out, lock, {"type": "ready"})
+
+    for raw in sys.stdin:
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            job = json.loads(raw)
+            _send(out, lock, {"type": "log", "line": f"Processing file: {job['input']}"})
+            files = separator.separate(job["input"])
+            _send(out, lock, {"type": "done", "files": [str(f) for f in files]})
+        except Exception as exc:
+            _send(out, lock, {"type": "error", "error": str(exc)})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Persistent VOD metadata cache used by path resolution.
+
+``resolve_output_dirs`` runs on nearly every API request, so the Twitch
+owner lookup behind it is cached in memory and on disk
+(``temp/cache/vod_metadata.json``), keyed by VOD id:
+
+- resolved owners never expire by default (a VOD does not change owner), so
+  once a VOD is known, path resolution stays off the network,
+- failed lookups are cached for ``negative_ttl_sec`` so a flaky Twitch API is
+  not hammered on every page flip,
+- concurrent lookups of the same id share one request (single-flight).
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+
+class VodMetadataCache:
+    """Memory + JSON file cache of VOD id -> streamer login."""
+
+    def __init__(self, path: Path, ttl_sec: float = 0.0, negative_ttl_sec: float = 60.0):
+        self.path = path
+        self.ttl_sec = ttl_sec
+        self.negative_ttl_sec = negative_ttl_sec
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._read_disk()
+        self._inflight: Dict[str, threading.Event] = {}
+
+    def get(self, vod_id: str) -> Optional[Dict]:
+        """Fresh entry for ``vod_id`` (``{"streamer": str | None, "fetched_at": float}``) or None."""
+        with self._lock:
+            entry = self._entries.get(vod_id)
+        if entry is None or not self._is_fresh(entry):
+            return None
+        return entry
+
+    def put(self, vod_id: str, streamer: Optional[str]) -> None:
+        entry = {"streamer": streamer, "fetched_at": time.time()}
+        with self._lock:
+            self._entries[vod_id] = entry
+            if streamer is not None:
+                # Only resolved owners are persisted; failures stay process-local.
+                self._write_disk()
+
+    def resolve(self, vod_id: str, fetch: Callable[[str], Optional[str]]) -> Optional[str]:
+        """Return the cached streamer or run ``fetch`` once, shared by concurrent callers."""
+        entry = self.get(vod_id)
+        if entry is not None:
+            return entry["streamer"]
+
+        with self._lock:
+            event = self._inflight.get(vod_id)
+            leader = event is None
+            if leader:
+                event = threading.Event()
+                self._inflight[vod_id] = event
+
+        if not leader:
+            event.wait()
+            entry = self.get(vod_id)
+            return entry["streamer"] if entry else None
+
+        try:
+            try:
+                streamer = fetch(vod_id)
+            except Exception:
+                streamer = None
+            self.put(vod_id, streamer)
+            return streamer
+        finally:
+            with self._lock:
+                self._inflight.pop(vod_id, None)
+            event.set()
+
+    def _is_fresh(self, entry: Dict) -> bool:
+        age = time.time() - float(entry.get("fetched_at") or 0.0)
+        if entry.get("streamer") is None:
+            return age < self.negative_ttl_sec
+        return self.ttl_sec <= 0 or age < self.ttl_sec
+
+    def _read_disk(self) -> Dict[str, Dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(v, dict) and v.get("streamer")}
+
+    def _write_disk(self) -> None:
+        # Merge with what other processes may have written since we loaded.
+        merged = self._read_disk()
+        merged.update({k: v for k, v in self._entries.items() if v.get("streamer")})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+_cache: Optional[VodMetadataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_vod_metadata_cache() -> VodMetadataCache:
+    """Get or create the process-wide VOD metadata cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from streamcraft.paths import get_paths
+            from streamcraft.settings import get_settings
+
+            settings = get_settings()
+            _cache = VodMetadataCache(
+                get_paths().cache_dir / "vod_metadata.json",
+                ttl_sec=settings.vod_metadata_ttl_sec,
+                negative_ttl_sec=settings.vod_metadata_negative_ttl_sec,
+            )
+        return _cache
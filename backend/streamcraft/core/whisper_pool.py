@@ -0,0 +1,244 @@
+"""Process-wide faster-whisper model registry.
+
+Every transcription entry point (pipeline runs, the segment endpoint and the
+clean-architecture transcribers) leases models from one pool instead of
+constructing its own ``WhisperModel``. Models are keyed by
+(size, device, compute_type, cpu_threads), loaded lazily on first use,
+reference counted while leased and evicted least-recently-used once the
+estimated footprint exceeds the configured budget.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+# Approximate parameter counts (millions) used to estimate resident size.
+_MODEL_PARAMS_M = {
+    "tiny": 39,
+    "tiny.en": 39,
+    "base": 74,
+    "base.en": 74,
+    "small": 244,
+    "small.en": 244,
+    "medium": 769,
+    "medium.en": 769,
+    "large-v1": 1550,
+    "large-v2": 1550,
+    "large-v3": 1550,
+    "large": 1550,
+    "distil-large-v3": 756,
+    "turbo": 809,
+    "large-v3-turbo": 809,
+}
+
+_BYTES_PER_PARAM = {
+    "float32": 4.0,
+    "float16": 2.0,
+    "bfloat16": 2.0,
+    "int8_float16": 1.0,
+    "int8_bfloat16": 1.0,
+    "int8_float32": 1.0,
+    "int8": 1.0,
+}
+
+
+class ModelKey(NamedTuple):
+    size: str
+    device: str
+    compute_type: str
+    cpu_threads: int
+
+
+def estimate_model_mb(size: str, compute_type: str) -> float:
+    params_m = _MODEL_PARAMS_M.get(size, _MODEL_PARAMS_M["large-v3"])
+    bytes_per_param = _BYTES_PER_PARAM.get(compute_type, 2.0)
+    # Weights plus ~20% for runtime buffers / tokenizer.
+    return params_m * bytes_per_param * 1.2
+
+
+@dataclass
+class _Entry:
+    key: ModelKey
+    model: object = None
+    size_mb: float = 0.0
+    refs: int = 0
+    loaded_at: float = 0.0
+    last_used: float = 0.0
+    load_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _load_model(key: ModelKey) -> object:
+    from faster_whisper import WhisperModel
+
+    from streamcraft.core.transcribe import ensure_cuda_dlls_available, log
+
+    if key.device == "cuda":
+        ensure_cuda_dlls_available()
+    log(
+        f"Loading faster-whisper model={key.size} device={key.device} "
+        f"compute_type={key.compute_type} threads={key.cpu_threads}"
+    )
+    return WhisperModel(key.size, device=key.device, compute_type=key.compute_type, cpu_threads=key.cpu_threads)
+
+
+class WhisperModelPool:
+    """Thread-safe LRU pool of loaded faster-whisper models."""
+
+    def __init__(self, budget_mb: float):
+        self.budget_mb = float(budget_mb)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(size: str, device: str, compute_type: str, cpu_threads: int = 0) -> ModelKey:
+        return ModelKey(size, device, compute_type, int(cpu_threads or 0))
+
+    def acquire(self, size: str, device: str, compute_type: str, cpu_threads: int = 0):
+        """Return a loaded model and take a reference on it; pair with ``release``."""
+        key = self.make_key(size, device, compute_type, cpu_threads)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(key=key, size_mb=estimate_model_mb(size, compute_type))
+                self._entries[key] = entry
+            entry.refs += 1
+            self._entries.move_to_end(key)
+
+        # Load outside the pool lock so other keys stay available; concurrent
+        # callers for the same key wait on the entry and share one load.
+        try:
+            with entry.load_lock:
+                if entry.model is None:
+                    with self._lock:
+                        self.misses += 1
+                        self._evict_locked(reserve_mb=entry.size_mb, keep=key)
+                    entry.model = _load_model(key)
+                    entry.loaded_at = time.time()
+                else:
+                    with self._lock:
+                        self.hits += 1
+        except Exception:
+            with self._lock:
+                entry.refs -= 1
+                if entry.model is None and entry.refs <= 0:
+                    self._entries.pop(key, None)
+            raise
+
+        entry.last_used = time.time()
+        return entry.model
+
+    def release(self, size: str, device: str, compute_type: str, cpu_threads: int = 0) -> None:
+        key = self.make_key(size, device, compute_type, cpu_threads)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs = max(0, entry.refs - 1)
+            entry.last_used = time.time()
+            self._evict_locked(reserve_mb=0.0, keep=None)
+
+    @contextmanager
+    def lease(self, size: str, device: str, compute_type: str, cpu_threads: int = 0) -> Iterator[object]:
+        model = self.acquire(size, device, compute_type, cpu_threads)
+        try:
+            yield model
+        finally:
+            self.release(size, device, compute_type, cpu_threads)
+
+    def warmup(self, keys: Sequence[ModelKey]) -> List[ModelKey]:
+        """Load models ahead of the first request; returns the keys that loaded."""
+        from streamcraft.core.transcribe import log_warn
+
+        loaded: List[ModelKey] = []
+        for key in keys:
+            try:
+                self.acquire(*key)
+            except Exception as exc:
+                log_warn(f"Whisper warmup failed for {key.size} ({key.device}/{key.compute_type}): {exc}")
+                continue
+            self.release(*key)
+            loaded.append(key)
+        return loaded
+
+    def evict_all(self) -> None:
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.refs == 0]:
+                self._entries.pop(key, None)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "budget_mb": self.budget_mb,
+                "resident_mb": self._resident_mb_locked(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "models": [
+                    {
+                        "size": e.key.size,
+                        "device": e.key.device,
+                        "compute_type": e.key.compute_type,
+                        "cpu_threads": e.key.cpu_threads,
+                        "refs": e.refs,
+                        "loaded": e.model is not None,
+                        "size_mb": e.size_mb,
+                        "last_used": e.last_used,
+                    }
+                    for e in self._entries.values()
+                ],
+            }
+
+    def _resident_mb_locked(self) -> float:
+        return sum(e.size_mb for e in self._entries.values() if e.model is not None)
+
+    def _evict_locked(self, reserve_mb: float, keep: Optional[ModelKey]) -> None:
+        # Oldest first; models that are leased (refs > 0) are never dropped.
+        for key in list(self._entries.keys()):
+            if self._resident_mb_locked() + reserve_mb <= self.budget_mb:
+                return
+            entry = self._entries[key]
+            if key == keep or entry.refs > 0 or entry.model is None:
+                continue
+            self._entries.pop(key, None)
+            entry.model = None
+            self.evictions += 1
+
+
+_pool: Optional[WhisperModelPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_model_pool() -> WhisperModelPool:
+    """Get or create the process-wide model pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from streamcraft.settings import get_settings
+
+            _pool = WhisperModelPool(budget_mb=get_settings().whisper_pool_budget_mb)
+        return _pool
+
+
+def warmup_from_settings() -> List[ModelKey]:
+    """Preload the models listed in ``STREAMCRAFT_WHISPER_WARMUP_MODELS`` (comma separated)."""
+    from streamcraft.core.transcribe import cpu_worker_layout, detect_device
+    from streamcraft.settings import get_settings
+
+    settings = get_settings()
+    sizes = [s.strip() for s in settings.whisper_warmup_models.split(",") if s.strip()]
+    if not sizes:
+        return []
+    device, compute_type = detect_device(settings.whisper_device, settings.whisper_compute_type)
+    threads = settings.whisper_threads
+    if device == "cpu":
+        _, threads = cpu_worker_layout(1, threads)
+    pool = get_model_pool()
+    keys = [pool.make_key(size, device, compute_type, threads) for size in sizes]
+    return pool.warmup(keys)
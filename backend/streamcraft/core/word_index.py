@@ -0,0 +1,187 @@
+"""Word-level timing index persisted from the main transcription pass.
+
+While transcribing, ``LiveSubtitleWriter`` appends one JSON line per segment to
+``<stem>.words.jsonl`` (so it is covered by the resume checkpoint like the other
+live outputs). When the run completes the spool is compacted into:
+
+- ``<stem>.words.npz``: columnar arrays (word start/end/probability, owning
+  segment, byte offsets into the text blob, per-segment avg_logprob and
+  no_speech_prob),
+- ``<stem>.words.txt``: the UTF-8 word text blob.
+
+``WordIndex.words_between`` answers time-range queries with a binary search so
+the segment endpoint never has to re-run Whisper.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+WORDS_SPOOL_SUFFIX = ".words.jsonl"
+WORDS_INDEX_SUFFIX = ".words.npz"
+WORDS_TEXT_SUFFIX = ".words.txt"
+MAX_CACHED_INDEXES = 8
+
+
+def word_index_paths(out_dir: Path, stem: str) -> Tuple[Path, Path, Path]:
+    """Return (spool, npz, text blob) paths for a transcription stem."""
+    return (
+        out_dir / f"{stem}{WORDS_SPOOL_SUFFIX}",
+        out_dir / f"{stem}{WORDS_INDEX_SUFFIX}",
+        out_dir / f"{stem}{WORDS_TEXT_SUFFIX}",
+    )
+
+
+def spool_line(seg) -> str:
+    """Serialise one ``Segment`` (with its words) as a spool line."""
+    return json.dumps(
+        {
+            "s": seg.start,
+            "e": seg.end,
+            "lp": seg.avg_logprob,
+            "ns": seg.no_speech_prob,
+            "w": [[w.word, w.start, w.end, w.probability] for w in seg.words],
+        },
+        ensure_ascii=False,
+    ) + "\n"
+
+
+def build_word_index(spool_path: Path, npz_path: Path, text_path: Path, language: Optional[str] = None) -> int:
+    """Compact a words spool into the npz index + text blob; returns the word count."""
+    seg_start: List[float] = []
+    seg_end: List[float] = []
+    seg_logprob: List[float] = []
+    seg_no_speech: List[float] = []
+    word_start: List[float] = []
+    word_end: List[float] = []
+    word_prob: List[float] = []
+    word_segment: List[int] = []
+    text_offsets: List[int] = [0]
+    blob = bytearray()
+
+    with spool_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            seg_idx = len(seg_start)
+            seg_start.append(float(row["s"]))
+            seg_end.append(float(row["e"]))
+            seg_logprob.append(float(row.get("lp") or 0.0))
+            seg_no_speech.append(float(row.get("ns") or 0.0))
+            for word, start, end, prob in row.get("w") or []:
+                encoded = (word or "").strip().encode("utf-8")
+                blob.extend(encoded)
+                text_offsets.append(len(blob))
+                word_start.append(float(start))
+                word_end.append(float(end))
+                word_prob.append(float(prob))
+                word_segment.append(seg_idx)
+
+    starts = np.asarray(word_start, dtype=np.float64)
+    order = np.argsort(starts, kind="stable")
+    offsets = np.asarray(text_offsets, dtype=np.int64)
+    npz_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_npz = npz_path.with_name(npz_path.name + ".tmp.npz")
+    np.savez(
+        tmp_npz,
+        word_start=starts[order],
+        word_end=np.asarray(word_end, dtype=np.float64)[order],
+        word_prob=np.asarray(word_prob, dtype=np.float32)[order],
+        word_segment=np.asarray(word_segment, dtype=np.int32)[order],
+        text_start=offsets[:-1][order],
+        text_end=offsets[1:][order],
+        seg_start=np.asarray(seg_start, dtype=np.float64),
+        seg_end=np.asarray(seg_end, dtype=np.float64),
+        seg_avg_logprob=np.asarray(seg_logprob, dtype=np.float32),
+        seg_no_speech_prob=np.asarray(seg_no_speech, dtype=np.float32),
+        language=np.asarray(language or ""),
+    )
+    text_path.write_bytes(bytes(blob))
+    tmp_npz.replace(npz_path)
+    return len(word_start)
+
+
+class WordIndex:
+    """Read-only view over a persisted word index."""
+
+    def __init__(self, npz_path: Path, text_path: Path):
+        with np.load(npz_path, allow_pickle=False) as data:
+            self.word_start = data["word_start"]
+            self.word_end = data["word_end"]
+            self.word_prob = data["word_prob"]
+            self.word_segment = data["word_segment"]
+            self.text_start = data["text_start"]
+            self.text_end = data["text_end"]
+            self.seg_avg_logprob = data["seg_avg_logprob"]
+            self.seg_no_speech_prob = data["seg_no_speech_prob"]
+            self.language = str(data["language"]) or None
+        self._blob = text_path.read_bytes()
+        # Running max of word ends keeps the lower-bound search valid even if words overlap.
+        self._end_cummax = np.maximum.accumulate(self.word_end) if self.word_end.size else self.word_end
+
+    def __len__(self) -> int:
+        return int(self.word_start.size)
+
+    def word_text(self, i: int) -> str:
+        return self._blob[int(self.text_start[i]):int(self.text_end[i])].decode("utf-8", errors="replace")
+
+    def words_between(self, start: float, end: float) -> List[Dict]:
+        """Words whose midpoint falls in ``[start, end)``, in timeline order."""
+        lo = int(np.searchsorted(self._end_cummax, start, side="right"))
+        hi = int(np.searchsorted(self.word_start, end, side="left"))
+        words: List[Dict] = []
+        for i in range(lo, max(lo, hi)):
+            ws = float(self.word_start[i])
+            we = float(self.word_end[i])
+            mid = (ws + we) / 2.0
+            if not (start <= mid < end):
+                continue
+            seg_idx = int(self.word_segment[i])
+            words.append(
+                {
+                    "word": self.word_text(i),
+                    "start": ws,
+                    "end": we,
+                    "probability": float(self.word_prob[i]),
+                    "avg_logprob": float(self.seg_avg_logprob[seg_idx]),
+                    "no_speech_prob": float(self.seg_no_speech_prob[seg_idx]),
+                }
+            )
+        return words
+
+
+_index_cache: "OrderedDict[Path, Tuple[float, WordIndex]]" = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def load_word_index(out_dir: Path, stem: str) -> Optional[WordIndex]:
+    """Load (and cache per process, invalidated by mtime) the word index for ``stem``.
+
+    Only the ``MAX_CACHED_INDEXES`` most recently used indexes stay cached.
+    """
+    _, npz_path, text_path = word_index_paths(out_dir, stem)
+    try:
+        mtime = npz_path.stat().st_mtime
+    except OSError:
+        return None
+    if not text_path.exists():
+        return None
+    key = npz_path.resolve()
+    with _index_lock:
+        cached = _index_cache.get(key)
+        if cached and cached[0] == mtime:
+            _index_cache.move_to_end(key)
+            return cached[1]
+    index = WordIndex(npz_path, text_path)
+    with _index_lock:
+        _index_cache[key] = (mtime, index)
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > MAX_CACHED_INDEXES:
+            _index_cache.popitem(last=False)
+    return index
@@ -2,38 +2,65 @@
 Demucs Audio Separator Adapter
 """
 
+import asyncio
+import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from ....domain.audio.entities import AudioFile
 from ....domain.audio.ports import AudioSeparator
+from ....domain.audio.value_objects.audio_format import AudioFormat
+from ....domain.audio.value_objects.sample_rate import SampleRate
+from ....domain.shared.branded_types import create_audio_file_id
 from ....domain.shared.result import Result, Err, Ok
+from ....domain.shared.value_objects import Duration
 
 
 class DemucsSeparator(AudioSeparator):
     """Demucs-based audio source separation."""
 
-    def __init__(self, model_name: str = "htdemucs", device: str = "cpu") -> None:
+    def __init__(
+        self,
+        model_name: str = "htdemucs",
+        device: str = "cpu",
+        chunk_sec: Optional[float] = None,
+        overlap_sec: Optional[float] = None,
+    ) -> None:
         """
         Initialize Demucs separator.
 
         Args:
             model_name: Demucs model to use (htdemucs, htdemucs_ft, etc.)
             device: Device for inference (cpu, cuda, mps)
+            chunk_sec: Length of the chunks fed to the model (bounds memory)
+            overlap_sec: Crossfaded overlap between consecutive chunks
         """
         self._model_name = model_name
         self._device = device
+        self._chunk_sec = chunk_sec
+        self._overlap_sec = overlap_sec
 
     async def separate(
-        self, audio_path: str, output_dir: str, stems: Optional[List[str]] = None
+        self,
+        audio_path: str,
+        output_dir: str,
+        stems: Optional[List[str]] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
     ) -> Result[dict[str, AudioFile], Exception]:
         """
         Separate audio into stems (vocals, drums, bass, other).
 
+        The model is loaded once per process and shared with the legacy
+        dataset pipeline; separation runs in a worker thread.
+
         Args:
             audio_path: Path to input audio file
             output_dir: Directory to save separated stems
-            stems: List of stems to extract (default: all)
+            stems: List of stems to extract (default: all); ``no_vocals``
+                style names give the mix minus that source
+            on_progress: Called with the fraction done after every chunk
+            should_cancel: Polled before every chunk; True aborts the run
 
         Returns:
             Result containing dict mapping stem names to AudioFile entities
@@ -43,42 +70,58 @@ class DemucsSeparator(AudioSeparator):
             if not Path(audio_path).exists():
                 return Err(FileNotFoundError(f"Audio file not found: {audio_path}"))
 
+            from ....core.demucs_engine import check_dependencies
+
+            if not check_dependencies():
+                return Err(
+                    ImportError(
+                        "Demucs integration requires demucs library installation. "
+                        "Install with: pip install demucs"
+                    )
+                )
+
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # Default stems
-            if stems is None:
-                stems = ["vocals", "drums", "bass", "other"]
-
-            # Note: Real implementation would use demucs library
-            # from demucs.pretrained import get_model
-            # from demucs.apply import apply_model
-            #
-            # model = get_model(self._model_name)
-            # model.to(self._device)
-            # wav = load_audio(audio_path)
-            # sources = apply_model(model, wav)
-            # save_stems(sources, output_dir)
-
-            # For now, return not implemented
-            return Err(
-                NotImplementedError(
-                    "Demucs integration requires demucs library installation. "
-                    "Install with: pip install demucs"
-                )
+            paths = await asyncio.to_thread(
+                self._separate_blocking, Path(audio_path), output_path, stems, on_progress, should_cancel
             )
+            return Ok({name: self._create_audio_file(str(path)) for name, path in paths.items()})
 
         except Exception as e:
             return Err(e)
 
+    def _separate_blocking(
+        self,
+        audio_path: Path,
+        output_path: Path,
+        stems: Optional[List[str]],
+        on_progress: Optional[Callable[[float], None]],
+        should_cancel: Optional[Callable[[], bool]],
+    ) -> Dict[str, Path]:
+        from ....core.demucs_engine import get_demucs_engine
+
+        engine = get_demucs_engine(self._model_name, self._device)
+        outputs = {name: output_path / f"{audio_path.stem}_{name}.wav" for name in (stems or engine.sources)}
+        options = {}
+        if self._chunk_sec is not None:
+            options["chunk_sec"] = self._chunk_sec
+        if self._overlap_sec is not None:
+            options["overlap_sec"] = self._overlap_sec
+        return engine.separate(audio_path, outputs, on_progress=on_progress, should_cancel=should_cancel, **options)
+
     def _create_audio_file(self, path: str) -> AudioFile:
         """Create AudioFile entity from path."""
+        import soundfile as sf
+
         file_path = Path(path)
-        # Placeholder - would need to read actual audio properties
+        info = sf.info(str(file_path))
         return AudioFile(
-            path=str(file_path),
-            format=file_path.suffix.lstrip("."),
-            sample_rate=44100,  # Placeholder
-            duration_seconds=0.0,  # Would need to read from file
-            file_size_bytes=file_path.stat().st_size if file_path.exists() else 0,
+            id=create_audio_file_id(str(uuid.uuid4())),
+            path=file_path,
+            format=AudioFormat.WAV,
+            sample_rate=SampleRate(hertz=int(info.samplerate)),
+            duration=Duration(seconds=float(info.duration)),
+            size_bytes=file_path.stat().st_size,
+            channels=int(info.channels),
         )
@@ -1,30 +1,44 @@
 """Soundfile audio quality analyzer implementation."""
 
 from pathlib import Path
+from typing import Tuple
 
 from streamcraft.domain.audio.ports.audio_quality_analyzer import AudioQualityAnalyzer
 from streamcraft.domain.audio.value_objects.rms_db import RmsDb
 from streamcraft.domain.shared.result import Failure, Result, Success
 
 
+def _mono_stats(audio_path: Path) -> Tuple[float, float, float, float]:
+    """RMS, peak, min and max of the mono mixdown, read block by block."""
+    import numpy as np
+
+    from streamcraft.core.audio_source import AudioSource
+
+    sum_sq = 0.0
+    count = 0
+    low = float("inf")
+    high = float("-inf")
+    with AudioSource(audio_path) as source:
+        for start in range(0, source.frames, source.block_frames):
+            mono = source.mono(start, start + source.block_frames)
+            sum_sq += float(np.square(mono, dtype=np.float64).sum())
+            count += mono.size
+            low = min(low, float(mono.min()))
+            high = max(high, float(mono.max()))
+    if count == 0:
+        raise ValueError("empty audio")
+    peak = max(abs(low), abs(high))
+    return float(np.sqrt(sum_sq / count)), peak, low, high
+
+
 class SoundfileAudioAnalyzer(AudioQualityAnalyzer):
     """Soundfile implementation of audio quality analyzer."""
 
     def analyze_rms(self, audio_path: Path) -> Result[RmsDb, Exception]:
         """Analyze RMS level of audio file using soundfile."""
         try:
-            import numpy as np
-            import soundfile as sf
-
-            # Read audio file
-            audio_data, sample_rate = sf.read(str(audio_path))
-
-            # Convert to mono if stereo
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-
-            # Calculate RMS
-            rms_linear = np.sqrt(np.mean(audio_data**2))
+            # RMS of the mono mixdown
+            rms_linear, _, _, _ = _mono_stats(audio_path)
 
             # Convert to dB
             rms_db = RmsDb.from_linear(float(rms_linear))
@@ -39,20 +53,9 @@ class SoundfileAudioAnalyzer(AudioQualityAnalyzer):
     def calculate_quality_score(self, audio_path: Path) -> Result[float, Exception]:
         """Calculate overall quality score (0.0 to 1.0)."""
         try:
-            import numpy as np
-            import soundfile as sf
-
-            # Read audio file
-            audio_data, sample_rate = sf.read(str(audio_path))
-
-            # Convert to mono if stereo
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-
-            # Calculate multiple quality metrics
-            rms = np.sqrt(np.mean(audio_data**2))
-            peak = np.max(np.abs(audio_data))
-            dynamic_range = np.max(audio_data) - np.min(audio_data)
+            # Calculate multiple quality metrics on the mono mixdown
+            rms, peak, low, high = _mono_stats(audio_path)
+            dynamic_range = high - low
 
             # Quality scoring based on:
             # 1. RMS level (too quiet or too loud is bad)
@@ -0,0 +1,108 @@
+"""Dict (JSON) layout of job aggregates, shared by the file and SQLite repositories."""
+
+from streamcraft.domain.job.entities.job import Job, JobStep
+from streamcraft.domain.job.value_objects.job_status import (
+    DoneStatus,
+    ErrorStatus,
+    IdleStatus,
+    JobStatus,
+    RunningStatus,
+    create_done,
+    create_error,
+    create_idle,
+    create_running,
+)
+from streamcraft.domain.job.value_objects.step_name import StepName
+from streamcraft.domain.shared.branded_types import create_job_id, create_vod_id
+from streamcraft.domain.shared.value_objects import Timestamp
+
+
+def serialize_status(status: JobStatus) -> dict:
+    """Serialize job status to dict."""
+    if isinstance(status, IdleStatus):
+        return {"kind": "idle"}
+    elif isinstance(status, RunningStatus):
+        return {
+            "kind": "running",
+            "current_step": status.current_step,
+            "progress": status.progress,
+        }
+    elif isinstance(status, DoneStatus):
+        return {"kind": "done", "exit_code": status.exit_code}
+    elif isinstance(status, ErrorStatus):
+        return {"kind": "error", "message": status.message, "exit_code": status.exit_code}
+    return {"kind": "idle"}
+
+
+def deserialize_status(data: dict) -> JobStatus:
+    """Deserialize job status from dict."""
+    kind = data.get("kind", "idle")
+    if kind == "idle":
+        return create_idle()
+    elif kind == "running":
+        return create_running(
+            current_step=data.get("current_step", ""),
+            progress=data.get("progress", 0.0),
+        )
+    elif kind == "done":
+        return create_done(exit_code=data.get("exit_code", 0))
+    elif kind == "error":
+        return create_error(
+            message=data.get("message", ""),
+            exit_code=data.get("exit_code", 1),
+        )
+    return create_idle()
+
+
+def serialize_job(job: Job) -> dict:
+    """Serialize job to dict."""
+    return {
+        "id": str(job.id),
+        "vod_id": str(job.vod_id),
+        "vod_url": job.vod_url,
+        "status": serialize_status(job.status),
+        "steps": [
+            {
+                "name": step.name.value,
+                "status": serialize_status(step.status),
+                "started_at": step.started_at.to_iso() if step.started_at else None,
+                "completed_at": step.completed_at.to_iso() if step.completed_at else None,
+                "log_messages": list(step.log_messages),
+            }
+            for step in job.steps
+        ],
+        "created_at": job.created_at.to_iso(),
+        "updated_at": job.updated_at.to_iso(),
+    }
+
+
+def deserialize_job(data: dict) -> Job:
+    """Deserialize job from dict."""
+    steps = tuple(
+        JobStep(
+            name=StepName(step_data["name"]),
+            status=deserialize_status(step_data["status"]),
+            started_at=(
+                Timestamp.from_iso(step_data["started_at"])
+                if step_data.get("started_at")
+                else None
+            ),
+            completed_at=(
+                Timestamp.from_iso(step_data["completed_at"])
+                if step_data.get("completed_at")
+                else None
+            ),
+            log_messages=tuple(step_data.get("log_messages", [])),
+        )
+        for step_data in data.get("steps", [])
+    )
+
+    return Job(
+        id=create_job_id(data["id"]),
+        vod_id=create_vod_id(data["vod_id"]),
+        vod_url=data["vod_url"],
+        status=deserialize_status(data["status"]),
+        steps=steps,
+        created_at=Timestamp.from_iso(data["created_at"]),
+        updated_at=Timestamp.from_iso(data["updated_at"]),
+    )
@@ -0,0 +1,9 @@
+"""SQLite persistence implementations."""
+
+from streamcraft.infrastructure.persistence.sqlite.sqlite_job_repository import (
+    SqliteJobRepository,
+)
+
+__all__ = [
+    "SqliteJobRepository",
+]
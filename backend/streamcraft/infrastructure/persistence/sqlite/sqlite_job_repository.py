@@ -0,0 +1,72 @@
+"""SQLite job repository implementation."""
+
+from pathlib import Path
+from typing import Sequence
+
+from streamcraft.domain.job.entities.job import Job
+from streamcraft.domain.job.errors.job_errors import JobNotFoundError
+from streamcraft.domain.job.ports.job_repository import JobRepository
+from streamcraft.domain.shared.branded_types import JobId
+from streamcraft.domain.shared.result import Result, err, ok
+from streamcraft.infrastructure.persistence.job_codec import deserialize_job, serialize_job
+from streamcraft.jobs.database import (
+    JOBS_DB,
+    LEGACY_JOBS_FILE,
+    get_job_database,
+    read_job_records,
+    write_job_record,
+)
+
+
+class SqliteJobRepository(JobRepository):
+    """Job repository on the shared WAL-mode jobs database.
+
+    Saving a job upserts its row and appends only the log lines it has not
+    stored yet, so concurrent writers touching different jobs never clobber
+    each other and a save costs the same however many jobs exist.
+    """
+
+    def __init__(self, db_path: Path = JOBS_DB, legacy_json: Path | None = LEGACY_JOBS_FILE) -> None:
+        """Initialize repository, importing ``legacy_json`` on first open."""
+        self._db = get_job_database(db_path, legacy_json)
+
+    def save(self, job: Job) -> Result[Job, Exception]:
+        """Save a job."""
+        try:
+            with self._db.transaction() as conn:
+                write_job_record(conn, serialize_job(job))
+            return ok(job)
+        except Exception as e:
+            return err(e)
+
+    def find_by_id(self, job_id: JobId) -> Result[Job, JobNotFoundError]:
+        """Find a job by ID."""
+        try:
+            with self._db.snapshot() as conn:
+                records = read_job_records(conn, str(job_id))
+            if not records:
+                return err(JobNotFoundError(str(job_id)))
+            return ok(deserialize_job(records[0]))
+        except Exception:
+            return err(JobNotFoundError(str(job_id)))
+
+    def find_all(self) -> Result[Sequence[Job], Exception]:
+        """Find all jobs."""
+        try:
+            with self._db.snapshot() as conn:
+                records = read_job_records(conn)
+            return ok(tuple(deserialize_job(record) for record in records))
+        except Exception as e:
+            return err(e)
+
+    def delete(self, job_id: JobId) -> Result[None, JobNotFoundError]:
+        """Delete a job."""
+        try:
+            with self._db.transaction() as conn:
+                deleted = conn.execute("DELETE FROM jobs WHERE id = ?", (str(job_id),)).rowcount
+                conn.execute("DELETE FROM job_logs WHERE job_id = ?", (str(job_id),))
+            if not deleted:
+                return err(JobNotFoundError(str(job_id)))
+            return ok(None)
+        except Exception:
+            return err(JobNotFoundError(str(job_id)))
@@ -23,7 +23,6 @@ class FasterWhisperTranscriber(Transcriber):
         """Initialize transcriber with device and compute type."""
         self._device = device
         self._compute_type = compute_type
-        self._model_cache: dict[WhisperModel, object] = {}
 
     def transcribe(
         self,
@@ -33,33 +32,26 @@ class FasterWhisperTranscriber(Transcriber):
     ) -> Result[Transcript, TranscriptionFailedError]:
         """Transcribe audio file using Faster-Whisper."""
         try:
-            from faster_whisper import WhisperModel as FWModel
+            from streamcraft.core.whisper_pool import get_model_pool
 
-            # Get or load model
-            if model not in self._model_cache:
-                self._model_cache[model] = FWModel(
-                    str(model), device=self._device, compute_type=self._compute_type
+            # Lease from the process-wide pool (shared with the legacy pipeline)
+            with get_model_pool().lease(str(model), self._device, self._compute_type) as fw_model:
+                segments, info = fw_model.transcribe(
+                    str(audio_path),
+                    language=language.code if language else None,
+                    word_timestamps=False,
                 )
 
-            fw_model = self._model_cache[model]
-
-            # Transcribe
-            segments, info = fw_model.transcribe(
-                str(audio_path),
-                language=language.code if language else None,
-                word_timestamps=False,
-            )
-
-            # Convert segments to cues
-            cues: list[Cue] = []
-            for segment in segments:
-                cue = Cue(
-                    id=create_cue_id(str(uuid.uuid4())),
-                    time_range=TimeRange(start=segment.start, end=segment.end),
-                    text=TranscriptText.create(segment.text),
-                    confidence=ConfidenceScore(value=min(segment.avg_logprob + 1.0, 1.0)),
-                )
-                cues.append(cue)
+                # Convert segments to cues
+                cues: list[Cue] = []
+                for segment in segments:
+                    cue = Cue(
+                        id=create_cue_id(str(uuid.uuid4())),
+                        time_range=TimeRange(start=segment.start, end=segment.end),
+                        text=TranscriptText.create(segment.text),
+                        confidence=ConfidenceScore(value=min(segment.avg_logprob + 1.0, 1.0)),
+                    )
+                    cues.append(cue)
 
             if not cues:
                 return Failure(
@@ -25,7 +25,6 @@ class WhisperTranscriber(Transcriber):
         """
         self._model_size = model_size
         self._device = device
-        self._model: Optional[any] = None
 
     async def transcribe(
         self,
@@ -43,55 +42,43 @@ class WhisperTranscriber(Transcriber):
             Result containing Transcript with cues or error
         """
         try:
-            # Lazy load model
-            if self._model is None:
-                from faster_whisper import WhisperModel
-
-                # Determine device
-                device = self._device
-                if device == "auto":
-                    try:
-                        import torch
-                        device = "cuda" if torch.cuda.is_available() else "cpu"
-                    except ImportError:
-                        device = "cpu"
-
-                # Use int8 for better performance on CPU
-                compute_type = "int8" if device == "cpu" else "float16"
-
-                self._model = WhisperModel(
-                    self._model_size,
-                    device=device,
-                    compute_type=compute_type,
-                )
+            from streamcraft.core.transcribe import cpu_worker_layout, detect_device
+            from streamcraft.core.whisper_pool import get_model_pool
+
+            # Resolve device (auto falls back to CPU) and a precision it supports:
+            # float16 on CUDA, int8 on CPU
+            device, compute_type = detect_device(self._device, None)
+            cpu_threads = cpu_worker_layout(1)[1] if device == "cpu" else 0
 
             if not audio_path.exists():
                 return Failure(FileNotFoundError(f"Audio file not found: {audio_path}"))
 
-            # Transcribe with word-level timestamps
-            segments, info = self._model.transcribe(
-                str(audio_path),
-                language=language,
-                word_timestamps=True,
-                vad_filter=True,  # Voice activity detection
-                vad_parameters={
-                    "threshold": 0.5,
-                    "min_speech_duration_ms": 250,
-                    "min_silence_duration_ms": 100,
-                },
-            )
-
-            # Convert segments to cues
-            cues: list[Cue] = []
-            for segment in segments:
-                # Use segment-level timestamps
-                cue = Cue(
-                    start_seconds=segment.start,
-                    end_seconds=segment.end,
-                    text=segment.text.strip(),
-                    confidence=segment.avg_logprob if hasattr(segment, 'avg_logprob') else None,
+            # Lease the model from the process-wide pool (loaded lazily, shared across callers)
+            with get_model_pool().lease(self._model_size, device, compute_type, cpu_threads) as model:
+                # Transcribe with word-level timestamps
+                segments, info = model.transcribe(
+                    str(audio_path),
+                    language=language,
+                    word_timestamps=True,
+                    vad_filter=True,  # Voice activity detection
+                    vad_parameters={
+                        "threshold": 0.5,
+                        "min_speech_duration_ms": 250,
+                        "min_silence_duration_ms": 100,
+                    },
                 )
-                cues.append(cue)
+
+                # Convert segments to cues
+                cues: list[Cue] = []
+                for segment in segments:
+                    # Use segment-level timestamps
+                    cue = Cue(
+                        start_seconds=segment.start,
+                        end_seconds=segment.end,
+                        text=segment.text.strip(),
+                        confidence=segment.avg_logprob if hasattr(segment, 'avg_logprob') else None,
+                    )
+                    cues.append(cue)
 
             # Create transcript
             from streamcraft.domain.shared.branded_types import create_transcription_id
@@ -40,6 +40,15 @@ def create_app() -> FastAPI:
     app.include_router(dataset_router, prefix="/api")
     app.include_router(legacy_routes.router, prefix="/api/legacy")
 
+    @app.on_event("startup")
+    def warmup_whisper_models() -> None:
+        """Preload configured Whisper models in the background so the first request skips the load."""
+        import threading
+
+        from streamcraft.core.whisper_pool import warmup_from_settings
+
+        threading.Thread(target=warmup_from_settings, name="whisper-warmup", daemon=True).start()
+
     # Health check endpoint
     @app.get("/health")
     def health() -> dict[str, str]:
@@ -34,25 +34,25 @@ from streamcraft.infrastructure.transcription.parser.subtitle_parser import Subt
 from streamcraft.infrastructure.external_apis.twitch import TwitchApiClient, TwitchVodDownloader
 from streamcraft.infrastructure.external_apis.youtube import YouTubeVodDownloader
 from streamcraft.domain.vod.value_objects.platform import Platform
-from streamcraft.infrastructure.persistence.file_system.json_job_repository import (
-    JsonJobRepository,
-)
 from streamcraft.infrastructure.persistence.memory import (
     MemoryDatasetRepository,
     MemoryTranscriptionRepository,
 )
+from streamcraft.infrastructure.persistence.sqlite import SqliteJobRepository
 
 
-_job_repository: JsonJobRepository | None = None
+_job_repository: SqliteJobRepository | None = None
 _transcription_repository: MemoryTranscriptionRepository | None = None
 _dataset_repository: MemoryDatasetRepository | None = None
 
 
-def get_job_repository() -> JsonJobRepository:
+def get_job_repository() -> SqliteJobRepository:
     """Get or create job repository singleton."""
     global _job_repository
     if _job_repository is None:
-        _job_repository = JsonJobRepository(file_path=Path("temp/jobs.json"))
+        _job_repository = SqliteJobRepository(
+            db_path=Path("temp/jobs.db"), legacy_json=Path("temp/jobs.json")
+        )
     return _job_repository
 
 
@@ -0,0 +1,266 @@
+"""SQLite job database shared by the wizard job store and the job repository.
+
+One WAL-mode database (``temp/jobs.db``) replaces ``temp/jobs.json``: every
+change is a single-row statement in its own short transaction instead of a
+read-modify-rewrite of the whole file, so the sanitize worker thread and the
+UI no longer overwrite each other's updates. Step log lines live in their own
+table and are appended, never rewritten.
+
+Two kinds of job share the old JSON file and get separate tables here:
+``pipeline_jobs`` holds the wizard jobs of ``jobs/storage.py`` (camelCase,
+``steps`` is a dict of booleans) and ``jobs``/``job_logs`` hold the domain
+``Job`` aggregates saved through ``JobRepository``. An existing ``jobs.json``
+is imported once, the first time the database is opened, and then renamed to
+``jobs.json.migrated``.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+JOBS_DB = Path("temp") / "jobs.db"
+LEGACY_JOBS_FILE = Path("temp") / "jobs.json"
+BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    id TEXT PRIMARY KEY,
+    vod_url TEXT NOT NULL,
+    streamer TEXT NOT NULL,
+    title TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    steps TEXT,
+    outputs TEXT
+);
+CREATE INDEX IF NOT EXISTS pipeline_jobs_updated_at ON pipeline_jobs (updated_at);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    vod_id TEXT NOT NULL,
+    vod_url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    status_data TEXT NOT NULL,
+    steps TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_updated_at ON jobs (updated_at);
+CREATE TABLE IF NOT EXISTS job_logs (
+    job_id TEXT NOT NULL,
+    step TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (job_id, step, seq)
+) WITHOUT ROWID;
+"""
+
+
+class JobDatabase:
+    """Thread-safe handle on the jobs database (one connection per thread)."""
+
+    def __init__(self, path: Path = JOBS_DB) -> None:
+        self.path = Path(path)
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection().executescript(_SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: reads see the latest commit, writes go through transaction().
+            conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, taking the write lock up front."""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Run several reads against one consistent snapshot."""
+        conn = self.connection()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def write_job_record(conn: sqlite3.Connection, record: Dict) -> None:
+    """Upsert one serialized domain job, appending only new log lines.
+
+    ``record`` is the dict layout ``JsonJobRepository`` stores (steps carry
+    their ``log_messages``). Logs are append-only in practice, so each step's
+    stored lines are kept and only the tail is inserted; a step whose stored
+    log no longer prefixes the new one (retry, reset) is rewritten.
+    """
+    job_id = record["id"]
+    steps = [{key: value for key, value in step.items() if key != "log_messages"} for step in record.get("steps", [])]
+    conn.execute(
+        "INSERT INTO jobs (id, vod_id, vod_url, status, status_data, steps, created_at, updated_at)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (id) DO UPDATE SET vod_id = excluded.vod_id, vod_url = excluded.vod_url,"
+        " status = excluded.status, status_data = excluded.status_data, steps = excluded.steps,"
+        " updated_at = excluded.updated_at",
+        (
+            job_id,
+            record["vod_id"],
+            record["vod_url"],
+            record["status"].get("kind", "idle"),
+            json.dumps(record["status"]),
+            json.dumps(steps),
+            record["created_at"],
+            record["updated_at"],
+        ),
+    )
+
+    stored = {
+        row["step"]: (row["count"], row["last"])
+        for row in conn.execute(
+            "SELECT step, COUNT(*) AS count,"
+            " (SELECT message FROM job_logs AS l WHERE l.job_id = g.job_id AND l.step = g.step ORDER BY seq DESC LIMIT 1) AS last"
+            " FROM job_logs AS g WHERE job_id = ? GROUP BY step",
+            (job_id,),
+        )
+    }
+    for step in record.get("steps", []):
+        messages = list(step.get("log_messages") or [])
+        have, last = stored.pop(step["name"], (0, None))
+        if have and (have > len(messages) or messages[have - 1] != last):
+            conn.execute("DELETE FROM job_logs WHERE job_id = ? AND step = ?", (job_id, step["name"]))
+            have = 0
+        if len(messages) > have:
+            conn.executemany(
+                "INSERT INTO job_logs (job_id, step, seq, message) VALUES (?, ?, ?, ?)",
+                [(job_id, step["name"], seq, messages[seq]) for seq in range(have, len(messages))],
+            )
+    for step_name in stored:
+        conn.execute("DELETE FROM job_logs WHERE job_id = ? AND step = ?", (job_id, step_name))
+
+
+def read_job_records(conn: sqlite3.Connection, job_id: Optional[str] = None) -> List[Dict]:
+    """Load serialized domain jobs (all, or one by id) with their logs, in insertion order."""
+    where, params = ("WHERE id = ?", (job_id,)) if job_id is not None else ("", ())
+    records = []
+    index = {}
+    for row in conn.execute(f"SELECT * FROM jobs {where} ORDER BY rowid", params):
+        record = {
+            "id": row["id"],
+            "vod_id": row["vod_id"],
+            "vod_url": row["vod_url"],
+            "status": json.loads(row["status_data"]),
+            "steps": json.loads(row["steps"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+        for step in record["steps"]:
+            step["log_messages"] = []
+            index[(row["id"], step["name"])] = step
+        records.append(record)
+    if not records:
+        return records
+
+    where = "WHERE job_id = ?" if job_id is not None else ""
+    for row in conn.execute(f"SELECT job_id, step, message FROM job_logs {where} ORDER BY job_id, step, seq", params):
+        step = index.get((row["job_id"], row["step"]))
+        if step is not None:
+            step["log_messages"].append(row["message"])
+    return records
+
+
+def _write_pipeline_record(conn: sqlite3.Connection, entry: Dict) -> None:
+    """Insert one wizard job as it was stored in jobs.json (old key spellings included)."""
+    created_at = entry.get("createdAt") or entry.get("created", "")
+    conn.execute(
+        "INSERT OR IGNORE INTO pipeline_jobs (id, vod_url, streamer, title, created_at, updated_at, steps, outputs)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            entry["id"],
+            entry.get("vodUrl") or entry.get("vod_url", ""),
+            entry.get("streamer", "unknown"),
+            entry.get("title", "Untitled"),
+            created_at,
+            entry.get("updatedAt") or entry.get("updated", created_at),
+            json.dumps(entry["steps"]) if "steps" in entry else None,
+            json.dumps(entry["outputs"]) if entry.get("outputs") is not None else None,
+        ),
+    )
+
+
+def migrate_json_jobs(db: JobDatabase, json_path: Path = LEGACY_JOBS_FILE) -> Tuple[int, int]:
+    """Import a legacy jobs.json once; returns (wizard jobs, domain jobs) imported.
+
+    Domain jobs are told apart by their ``vod_id``/``status``/list-of-steps
+    layout; everything else is a wizard job. The import is recorded in the
+    ``meta`` table, and the file is renamed so it is not read again.
+    """
+    json_path = Path(json_path)
+    with db.transaction() as conn:
+        done = conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+        if done is not None or not json_path.exists():
+            return 0, 0
+        try:
+            entries = json.loads(json_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            entries = []
+
+        pipeline = domain = 0
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or "id" not in entry:
+                continue
+            if "vod_id" in entry and isinstance(entry.get("steps"), list):
+                write_job_record(conn, entry)
+                domain += 1
+            else:
+                _write_pipeline_record(conn, entry)
+                pipeline += 1
+        conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(json_path),))
+
+    json_path.replace(json_path.with_name(json_path.name + ".migrated"))
+    return pipeline, domain
+
+
+_databases: Dict[Path, JobDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def get_job_database(path: Path = JOBS_DB, legacy_json: Optional[Path] = LEGACY_JOBS_FILE) -> JobDatabase:
+    """Get the shared database for ``path``, importing ``legacy_json`` on first open."""
+    key = Path(path).resolve()
+    with _databases_lock:
+        db = _databases.get(key)
+        if db is None:
+            db = JobDatabase(path)
+            if legacy_json is not None:
+                migrate_json_jobs(db, legacy_json)
+            _databases[key] = db
+    return db
@@ -1,64 +1,39 @@
-"""Simple file-based job storage."""
+"""Simple SQLite-backed job storage."""
 
 import json
+import sqlite3
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
+from streamcraft.jobs.database import get_job_database
 from streamcraft.models.api import JobResponse, JobSteps, JobOutputs
 
-JOBS_FILE = Path("temp") / "jobs.json"
 
-
-def _ensure_jobs_file() -> None:
-    """Create jobs file if it doesn't exist."""
-    JOBS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    if not JOBS_FILE.exists():
-        JOBS_FILE.write_text(json.dumps([], indent=2))
-
-
-def _read_jobs() -> List[Dict]:
-    """Read all jobs from file."""
-    _ensure_jobs_file()
-    try:
-        with open(JOBS_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
-
-
-def _write_jobs(jobs: List[Dict]) -> None:
-    """Write all jobs to file."""
-    _ensure_jobs_file()
-    with open(JOBS_FILE, 'w') as f:
-        json.dump(jobs, f, indent=2)
+def _to_response(row: sqlite3.Row) -> JobResponse:
+    """Build the API model from a pipeline_jobs row."""
+    outputs = json.loads(row["outputs"]) if row["outputs"] else None
+    return JobResponse(
+        id=row["id"],
+        vodUrl=row["vod_url"],
+        streamer=row["streamer"],
+        title=row["title"],
+        createdAt=row["created_at"],
+        updatedAt=row["updated_at"],
+        steps=JobSteps(**json.loads(row["steps"] or "{}")),
+        outputs=JobOutputs(**outputs) if outputs else None,
+    )
 
 
 def get_all_jobs() -> List[JobResponse]:
     """Get all jobs."""
-    jobs_data = _read_jobs()
     result = []
-    for j in jobs_data:
+    # Old-format jobs imported without steps stay hidden, as they were in jobs.json.
+    rows = get_job_database().connection().execute(
+        "SELECT * FROM pipeline_jobs WHERE steps IS NOT NULL ORDER BY rowid"
+    )
+    for row in rows:
         try:
-            # Handle both old and new format
-            vod_url = j.get("vodUrl") or j.get("vod_url", "")
-            created_at = j.get("createdAt") or j.get("created", "")
-            updated_at = j.get("updatedAt") or j.get("updated", created_at)
-            
-            # Skip old-format jobs that don't have required new fields
-            if "steps" not in j:
-                continue
-                
-            result.append(JobResponse(
-                id=j["id"],
-                vodUrl=vod_url,
-                streamer=j.get("streamer", "unknown"),
-                title=j.get("title", "Untitled"),
-                createdAt=created_at,
-                updatedAt=updated_at,
-                steps=JobSteps(**j.get("steps", {})),
-                outputs=JobOutputs(**j.get("outputs", {})) if j.get("outputs") else None,
-            ))
+            result.append(_to_response(row))
         except Exception:
             # Skip malformed jobs silently
             continue
@@ -67,42 +42,32 @@ def get_all_jobs() -> List[JobResponse]:
 
 def get_job(job_id: str) -> Optional[JobResponse]:
     """Get a single job by ID."""
-    jobs = _read_jobs()
-    for j in jobs:
-        if j["id"] == job_id:
-            return JobResponse(
-                id=j["id"],
-                vodUrl=j["vodUrl"],
-                streamer=j["streamer"],
-                title=j["title"],
-                createdAt=j["createdAt"],
-                updatedAt=j["updatedAt"],
-                steps=JobSteps(**j.get("steps", {})),
-                outputs=JobOutputs(**j.get("outputs", {})) if j.get("outputs") else None,
-            )
-    return None
+    row = get_job_database().connection().execute(
+        "SELECT * FROM pipeline_jobs WHERE id = ?", (job_id,)
+    ).fetchone()
+    return _to_response(row) if row is not None else None
 
 
 def create_job(vod_url: str, streamer: str, title: str) -> JobResponse:
     """Create a new job."""
-    jobs = _read_jobs()
-    job_id = f"job-{len(jobs) + 1}-{int(datetime.now().timestamp())}"
     now = datetime.now().isoformat()
-    
-    job_data = {
-        "id": job_id,
-        "vodUrl": vod_url,
-        "streamer": streamer,
-        "title": title,
-        "createdAt": now,
-        "updatedAt": now,
-        "steps": {"vod": True, "audio": False, "sanitize": False, "srt": False, "train": False, "tts": False},
-        "outputs": {},
-    }
-    
-    jobs.append(job_data)
-    _write_jobs(jobs)
-    
+    steps = {"vod": True, "audio": False, "sanitize": False, "srt": False, "train": False, "tts": False}
+
+    with get_job_database().transaction() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM pipeline_jobs").fetchone()[0]
+        stamp = int(datetime.now().timestamp())
+        # Same id scheme as before; skip numbers a deleted job left taken.
+        while True:
+            count += 1
+            job_id = f"job-{count}-{stamp}"
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO pipeline_jobs (id, vod_url, streamer, title, created_at, updated_at, steps, outputs)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, vod_url, streamer, title, now, now, json.dumps(steps), json.dumps({})),
+            )
+            if cursor.rowcount:
+                break
+
     return JobResponse(
         id=job_id,
         vodUrl=vod_url,
@@ -110,49 +75,35 @@ def create_job(vod_url: str, streamer: str, title: str) -> JobResponse:
         title=title,
         createdAt=now,
         updatedAt=now,
-        steps=JobSteps(**job_data["steps"]),
-        outputs=JobOutputs(**job_data["outputs"]),
+        steps=JobSteps(**steps),
+        outputs=JobOutputs(),
     )
 
 
 def update_job(
-    job_id: str, 
-    steps: Optional[JobSteps] = None, 
+    job_id: str,
+    steps: Optional[JobSteps] = None,
     outputs: Optional[JobOutputs] = None
 ) -> Optional[JobResponse]:
     """Update a job."""
-    jobs = _read_jobs()
-    for i, j in enumerate(jobs):
-        if j["id"] == job_id:
-            now = datetime.now().isoformat()
-            j["updatedAt"] = now
-            
-            if steps:
-                j["steps"] = steps.model_dump()
-            if outputs:
-                j["outputs"] = outputs.model_dump()
-            
-            jobs[i] = j
-            _write_jobs(jobs)
-            
-            return JobResponse(
-                id=j["id"],
-                vodUrl=j["vodUrl"],
-                streamer=j["streamer"],
-                title=j["title"],
-                createdAt=j["createdAt"],
-                updatedAt=now,
-                steps=JobSteps(**j["steps"]),
-                outputs=JobOutputs(**j["outputs"]) if j.get("outputs") else None,
-            )
-    return None
+    now = datetime.now().isoformat()
+    with get_job_database().transaction() as conn:
+        # One row, one statement: fields this call doesn't pass keep their stored value.
+        conn.execute(
+            "UPDATE pipeline_jobs SET updated_at = ?, steps = COALESCE(?, steps), outputs = COALESCE(?, outputs)"
+            " WHERE id = ?",
+            (
+                now,
+                json.dumps(steps.model_dump()) if steps else None,
+                json.dumps(outputs.model_dump()) if outputs else None,
+                job_id,
+            ),
+        )
+        row = conn.execute("SELECT * FROM pipeline_jobs WHERE id = ?", (job_id,)).fetchone()
+    return _to_response(row) if row is not None else None
 
 
 def delete_job(job_id: str) -> bool:
     """Delete a job."""
-    jobs = _read_jobs()
-    filtered = [j for j in jobs if j["id"] != job_id]
-    if len(filtered) < len(jobs):
-        _write_jobs(filtered)
-        return True
-    return False
+    with get_job_database().transaction() as conn:
+        return conn.execute("DELETE FROM pipeline_jobs WHERE id = ?", (job_id,)).rowcount > 0
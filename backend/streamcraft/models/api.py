@@ -110,6 +110,41 @@ class RunSanitizeResponse(BaseModel):
     log: List[str] = []
 
 
+class SweepSanitizeRequest(BaseModel):
+    """Grid of sanitize settings scored on cached frame features, without rendering."""
+    vodUrl: str
+    outdir: str = "out"
+    datasetOut: str = "dataset"
+    mode: Literal["auto", "voice"] = "auto"
+    presets: List[Literal["strict", "balanced", "lenient"]] = ["balanced"]
+    strictness: List[float] = [0.5]
+    frameKeep: List[Optional[float]] = [None]  # None = value implied by preset + strictness
+    extractVocals: bool = False
+    preview: bool = False
+    previewStart: float = 0.0
+    previewDuration: float = 90.0
+    preservePauses: bool = True
+    reduceSfx: bool = True
+
+
+class SweepSanitizePoint(BaseModel):
+    preset: str
+    strictness: float
+    frameKeep: float
+    segments: int
+    kept: int
+    keptDuration: float
+    qualityHistogram: List[int]
+    params: dict
+
+
+class SweepSanitizeResponse(BaseModel):
+    frames: int
+    histogramBinWidth: int
+    points: List[SweepSanitizePoint]
+    log: List[str] = []
+
+
 class SegmentReviewVote(BaseModel):
     index: int
     decision: Literal["accept", "reject"]
@@ -190,7 +225,8 @@ class SegmentManifestResponse(BaseModel):
     cleanPath: Optional[str] = None
     originalPath: Optional[str] = None
     segments: List[SegmentManifestItem]
-    total: Optional[int] = None
+    total: Optional[int] = None  # segments matching the filters
+    totalSegments: Optional[int] = None  # segments in the manifest
     offset: Optional[int] = None
     limit: Optional[int] = None
     hasMore: Optional[bool] = None
@@ -306,6 +342,14 @@ class TranscribeSegmentRequest(BaseModel):
     datasetOut: str = "dataset"
 
 
+class TranscribeSegmentsRequest(BaseModel):
+    """Request to transcribe several audio segments in one streamed batch."""
+    vodUrl: str
+    segmentIndices: List[int]
+    outdir: str = "out"
+    datasetOut: str = "dataset"
+
+
 class TranscribeSegmentWord(BaseModel):
     """Individual word in transcription."""
     word: str
@@ -20,6 +20,9 @@ class Paths:
         self.jobs_logs_dir = self.jobs_dir / "logs"
         self.jobs_cache_dir = self.jobs_dir / "cache"
         self.cache_dir = self.temp_dir / "cache"
+        self.transcripts_cache_dir = self.cache_dir / "transcripts"
+        self.features_cache_dir = self.cache_dir / "features"
+        self.vocals_cache_dir = self.cache_dir / "vocals"
         
     def ensure_base_dirs(self) -> None:
         """Create required folders if they do not exist."""
@@ -31,6 +34,9 @@ class Paths:
             self.output_dir,
             self.temp_dir,
             self.cache_dir,
+            self.transcripts_cache_dir,
+            self.features_cache_dir,
+            self.vocals_cache_dir,
         ):
             path.mkdir(parents=True, exist_ok=True)
     
@@ -20,9 +20,26 @@ class Settings(BaseSettings):
     # Transcription defaults
     whisper_model: str = "large-v3"
     whisper_language: str = "en"
-    whisper_threads: int = 8
-    whisper_compute_type: str = "float16"
+    whisper_device: str = "auto"  # auto | cuda | cpu
+    whisper_threads: int = 0  # 0 = size from available cores
+    whisper_compute_type: str = "auto"  # auto = float16 on CUDA, int8 on CPU
+    whisper_pool_budget_mb: int = 8192  # estimated resident size before idle models are evicted
+    whisper_warmup_models: str = ""  # comma-separated sizes preloaded at API startup
+    whisper_chunk_workers: int = 0  # >0 = chunked multi-process transcription for /srt/run
     vod_quality: str = "audio_only"
+    vod_metadata_ttl_sec: float = 0.0  # 0 = resolved VOD owners never expire
+    vod_metadata_negative_ttl_sec: float = 60.0  # retry failed Twitch lookups after this long
+    sanitize_block_sec: float = 60.0  # sanitize reads full runs in blocks this long; 0 = load whole file
+    feature_cache_budget_mb: int = 2048  # sanitize feature cache size before least-recently-used entries go; 0 = unbounded
+    transcript_cache_budget_mb: int = 1024  # cached transcripts kept before least-recently-used ones go; 0 = unbounded
+    uvr_model: str = "model_bs_roformer_ep_317_sdr_12.9755.ckpt"  # audio-separator checkpoint for vocal isolation
+    uvr_warmup: bool = False  # start the separator worker and load the model at API startup
+    vocal_cache_budget_mb: int = 20480  # cached vocal stems kept before least-recently-used ones go; 0 = unbounded
+    # Independent of this switch, sanitize's noise floor skips exact digital silence in any input (feature cache v3).
+    separation_skip_silence: bool = True  # separate only padded speech regions found by an energy/VAD pre-pass
+    separation_chunk_sec: float = 60.0  # speech regions go to the separator in chunks this long
+    separation_overlap_sec: float = 2.0  # crossfaded overlap between consecutive chunks
+    separation_pad_sec: float = 1.0  # context kept around each detected speech region
     
     # Dataset defaults
     min_speech_ms: int = 1500
@@ -0,0 +1,148 @@
+"""Property test: vectorised keep mask / segmentation vs. the per-frame loops they replaced.
+
+Random quality curves, thresholds, hangover, min segment and split lengths,
+with NaN frames sprinkled in; ``_hysteresis_mask``, ``_mask_to_segments`` and
+``_merge_segments`` must return exactly what the frozen reference loops return.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from streamcraft.core.sanitize_v2 import _hysteresis_mask, _mask_to_segments, _merge_segments
+
+FRAME_MS = 20
+SEEDS = range(20)
+TRIALS_PER_SEED = 25
+
+
+# Reference implementations (the loops the vectorised versions replaced) ----
+
+
+def reference_mask(quality: np.ndarray, start_keep: float, stop_keep: float, hang_frames: int) -> np.ndarray:
+    mask = np.zeros_like(quality, dtype=bool)
+    active = False
+    hang_count = 0
+    for i, q in enumerate(quality):
+        if active:
+            if q >= stop_keep:
+                mask[i] = True
+                hang_count = 0
+            else:
+                hang_count += 1
+                if hang_count <= hang_frames:
+                    mask[i] = True
+                else:
+                    active = False
+        else:
+            if q >= start_keep:
+                active = True
+                mask[i] = True
+    return mask
+
+
+def reference_segments(mask: np.ndarray, params: Dict[str, float], total_frames: int) -> List[Tuple[int, int]]:
+    segments: List[Tuple[int, int]] = []
+    start = None
+    min_frames = max(1, int(params["minSegmentMs"] / 20))
+    min_silence_split = max(1, int(params["minSilenceMsToSplit"] / 20))
+    silence_run = 0
+    for idx, keep in enumerate(mask):
+        if keep:
+            if start is None:
+                start = idx
+            silence_run = 0
+        else:
+            if start is not None:
+                silence_run += 1
+                if silence_run >= min_silence_split:
+                    end = idx - silence_run
+                    if end - start >= min_frames:
+                        segments.append((start, end))
+                    start = None
+                    silence_run = 0
+    if start is not None:
+        segments.append((start, total_frames))
+    return segments
+
+
+def reference_merge(segments: List[Tuple[int, int]], params: Dict[str, float], preserve_pauses: bool) -> List[Tuple[int, int]]:
+    if not segments:
+        return []
+    adaptive_gap = params["minSilenceMsToSplit"] if preserve_pauses else params["minSilenceMsToSplit"] * 0.6
+    gap_frames = max(1, int(adaptive_gap / 20))
+    merged: List[Tuple[int, int]] = []
+    cur_s, cur_e = segments[0]
+    for s, e in segments[1:]:
+        if s - cur_e <= gap_frames:
+            cur_e = e
+        else:
+            merged.append((cur_s, cur_e))
+            cur_s, cur_e = s, e
+    merged.append((cur_s, cur_e))
+    return merged
+
+
+# Synthetic data ------------------------------------------------------------
+
+
+def quality_curve(rng: np.random.Generator, frames: int) -> np.ndarray:
+    """Bursty speech-like quality: smoothed on/off states plus noise."""
+    state = np.repeat(rng.random(frames // 25 + 1) < 0.5, 25)[:frames].astype(np.float32)
+    noise = rng.normal(0.0, 0.15, frames).astype(np.float32)
+    return np.clip(0.2 + 0.5 * state + noise, -0.5, 1.5)
+
+
+def _random_params(rng: np.random.Generator) -> Tuple[float, Dict[str, float]]:
+    frame_keep = float(rng.uniform(0.3, 0.8))
+    params = {
+        "hangoverMs": float(rng.choice([0, 20, 60, 150, 300, 500])),
+        "minSegmentMs": float(rng.choice([0, 20, 200, 400, 1200])),
+        "minSilenceMsToSplit": float(rng.choice([0, 20, 40, 250, 600, 900])),
+    }
+    return frame_keep, params
+
+
+def run_pipeline(mask_fn, seg_fn, merge_fn, quality, frame_keep, params, preserve):
+    hang_frames = max(1, int(params["hangoverMs"] / FRAME_MS))
+    mask = mask_fn(quality, frame_keep + 0.05, frame_keep - 0.05, hang_frames)
+    segments = seg_fn(mask, params, quality.size)
+    return mask, segments, merge_fn(segments, params, preserve)
+
+
+def _assert_same(quality: np.ndarray, frame_keep: float, params: Dict[str, float], preserve: bool) -> None:
+    ref = run_pipeline(reference_mask, reference_segments, reference_merge, quality, frame_keep, params, preserve)
+    new = run_pipeline(_hysteresis_mask, _mask_to_segments, _merge_segments, quality, frame_keep, params, preserve)
+    context = f"frames={quality.size} frameKeep={frame_keep} params={params} preserve={preserve}"
+    assert np.array_equal(ref[0], new[0]), f"mask differs: {context}"
+    assert ref[1] == new[1], f"segments differ: {context}"
+    assert ref[2] == new[2], f"merged segments differ: {context}"
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_matches_reference_loops(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    for _ in range(TRIALS_PER_SEED):
+        frames = int(rng.integers(0, 3000))
+        quality = quality_curve(rng, frames) if rng.random() < 0.7 else rng.random(frames).astype(np.float32)
+        if frames and rng.random() < 0.2:
+            quality[rng.integers(0, frames, size=max(1, frames // 50))] = np.nan
+        frame_keep, params = _random_params(rng)
+        _assert_same(quality, frame_keep, params, bool(rng.random() < 0.5))
+
+
+@pytest.mark.parametrize(
+    "quality",
+    [
+        np.zeros(0, dtype=np.float32),
+        np.full(50, np.nan, dtype=np.float32),
+        np.ones(50, dtype=np.float32),
+        np.tile(np.array([1.0, 0.0], dtype=np.float32), 40),
+    ],
+    ids=["empty", "all-nan", "all-kept", "alternating"],
+)
+@pytest.mark.parametrize("preserve", [True, False])
+def test_edge_cases(quality: np.ndarray, preserve: bool) -> None:
+    params = {"hangoverMs": 20.0, "minSegmentMs": 20.0, "minSilenceMsToSplit": 20.0}
+    _assert_same(quality, 0.5, params, preserve)
@@ -0,0 +1,74 @@
+"""Segment batcher: segments of different languages queued into one batch keep their own language."""
+
+import asyncio
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import numpy as np
+import soundfile as sf
+
+from streamcraft.core.segment_batcher import SegmentBatcher
+
+SAMPLE_RATE = 16000
+
+
+class FakeModel:
+    """Detects the language from the clip's amplitude (loud: German, quiet: English)."""
+
+    def detect_language(self, audio):
+        language = "de" if np.abs(audio).max() > 0.4 else "en"
+        return language, 1.0, [(language, 1.0)]
+
+
+class FakeBatcher(SegmentBatcher):
+    def __init__(self):
+        super().__init__("tiny", batch_size=2, max_wait=5.0)
+        self.decodes = []
+        self.batch_sizes = []
+
+    def _transcribe_batch(self, batch):
+        self.batch_sizes.append(len(batch))
+        super()._transcribe_batch(batch)
+
+    def _lease_model(self):
+        return nullcontext(FakeModel())
+
+    def _speech_spans(self, samples):
+        return [(0, samples.size)]
+
+    def _decode(self, model, audio, clips, language):
+        self.decodes.append((language, len(clips)))
+        # One segment per clip whose text names the language it was decoded with.
+        return [
+            SimpleNamespace(start=clip["start"], end=clip["end"], text=f" {language} ", words=None)
+            for clip in clips
+        ]
+
+
+def _write_tone(path, amplitude):
+    t = np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE
+    sf.write(str(path), (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32), SAMPLE_RATE, subtype="PCM_16")
+
+
+def test_batch_with_two_languages_decodes_each_with_its_own(tmp_path):
+    english = tmp_path / "english.wav"
+    german = tmp_path / "german.wav"
+    _write_tone(english, 0.1)
+    _write_tone(german, 0.8)
+
+    batcher = FakeBatcher()
+
+    async def collect():
+        requests = [("en-seg", english, 0.0, 2.0), ("de-seg", german, 0.0, 2.0)]
+        return [event async for event in batcher.stream(requests)]
+
+    events = asyncio.run(collect())
+
+    metadata = {event["segmentIndex"]: event["language"] for event in events if event["type"] == "metadata"}
+    assert metadata == {"en-seg": "en", "de-seg": "de"}
+    texts = {event["segmentIndex"]: event["text"] for event in events if event["type"] == "segment"}
+    assert texts == {"en-seg": "en", "de-seg": "de"}
+    # Both segments were drained as one batch and decoded as two language groups.
+    assert batcher.batch_sizes == [2]
+    assert sorted(batcher.decodes) == [("de", 1), ("en", 1)]
+    assert [event["type"] for event in events].count("segmentDone") == 2